@@ -0,0 +1,47 @@
+"""never reuse reminder ids on sqlite
+
+Revision ID: a7c3e9f1d2b4
+Revises: e8b4c2d6f913
+Create Date: 2026-10-19 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e9f1d2b4'
+down_revision: Union[str, None] = 'e8b4c2d6f913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Archived reminders keep their ids, and a plain SQLite rowid reuses the
+    # highest freed id. Other databases' sequences never go backwards.
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    with op.batch_alter_table('reminders', recreate='always',
+                              table_kwargs={'sqlite_autoincrement': True}):
+        pass
+
+    # Start past every id already handed out, including archived ones
+    op.execute(sa.text(
+        "DELETE FROM sqlite_sequence WHERE name = 'reminders'"
+    ))
+    op.execute(sa.text(
+        "INSERT INTO sqlite_sequence (name, seq) SELECT 'reminders', MAX(COALESCE(MAX(r.id), 0), "
+        "COALESCE((SELECT MAX(id) FROM reminders_archive), 0)) FROM reminders r"
+    ))
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    with op.batch_alter_table('reminders', recreate='always',
+                              table_kwargs={'sqlite_autoincrement': False}):
+        pass
@@ -0,0 +1,81 @@
+"""record call attempts in flight, drop per-attempt columns from reminders_archive
+
+Revision ID: b3f7d1e9a5c2
+Revises: a7c3e9f1d2b4
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3f7d1e9a5c2'
+down_revision: Union[str, None] = 'a7c3e9f1d2b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+call_attempts = sa.table('call_attempts',
+    sa.column('reminder_id', sa.Integer), sa.column('attempt_number', sa.Integer),
+    sa.column('idempotency_key', sa.String), sa.column('provider_call_id', sa.String),
+    sa.column('status', sa.String), sa.column('succeeded', sa.Boolean), sa.column('error', sa.Text),
+    sa.column('started_at', sa.DateTime), sa.column('finished_at', sa.DateTime),
+    sa.column('created_at', sa.DateTime), sa.column('updated_at', sa.DateTime)
+)
+
+
+def upgrade() -> None:
+    op.add_column('call_attempts', sa.Column('status', sa.String(length=20), nullable=True))
+    op.execute(call_attempts.update().values(
+        status=sa.case((call_attempts.c.succeeded, 'succeeded'), else_='failed')
+    ))
+    with op.batch_alter_table('call_attempts') as batch_op:
+        batch_op.alter_column('status', existing_type=sa.String(length=20), nullable=False)
+        batch_op.alter_column('finished_at', existing_type=sa.DateTime(), nullable=True)
+        batch_op.drop_column('succeeded')
+
+    # Move the archive's last recorded attempts into the ledger (as e8b4c2d6f913
+    # did for reminders), then drop the columns nothing writes any more
+    archive = sa.table('reminders_archive',
+        sa.column('id', sa.Integer), sa.column('attempt_count', sa.Integer),
+        sa.column('idempotency_key', sa.String), sa.column('vapi_call_id', sa.String),
+        sa.column('last_error', sa.Text), sa.column('updated_at', sa.DateTime)
+    )
+    op.execute(call_attempts.insert().from_select(
+        ['reminder_id', 'attempt_number', 'idempotency_key', 'provider_call_id', 'status',
+         'error', 'started_at', 'finished_at', 'created_at', 'updated_at'],
+        sa.select(
+            archive.c.id, archive.c.attempt_count, archive.c.idempotency_key, archive.c.vapi_call_id,
+            sa.case((archive.c.vapi_call_id.is_not(None), 'succeeded'), else_='failed'), archive.c.last_error,
+            archive.c.updated_at, archive.c.updated_at, archive.c.updated_at, archive.c.updated_at
+        ).where(
+            archive.c.idempotency_key.is_not(None),
+            archive.c.idempotency_key.not_in(sa.select(call_attempts.c.idempotency_key))
+        )
+    ))
+
+    with op.batch_alter_table('reminders_archive') as batch_op:
+        batch_op.drop_column('vapi_call_id')
+        batch_op.drop_column('idempotency_key')
+        batch_op.drop_column('last_error')
+
+
+def downgrade() -> None:
+    # The restored archive columns start out empty; in-flight attempts become failures
+    with op.batch_alter_table('reminders_archive') as batch_op:
+        batch_op.add_column(sa.Column('last_error', sa.Text(), nullable=True))
+        batch_op.add_column(sa.Column('idempotency_key', sa.String(length=64), nullable=True))
+        batch_op.add_column(sa.Column('vapi_call_id', sa.String(length=100), nullable=True))
+
+    op.add_column('call_attempts', sa.Column('succeeded', sa.Boolean(), nullable=True))
+    op.execute(call_attempts.update().values(
+        succeeded=call_attempts.c.status == 'succeeded',
+        finished_at=sa.func.coalesce(call_attempts.c.finished_at, call_attempts.c.started_at)
+    ))
+    with op.batch_alter_table('call_attempts') as batch_op:
+        batch_op.alter_column('succeeded', existing_type=sa.Boolean(), nullable=False)
+        batch_op.alter_column('finished_at', existing_type=sa.DateTime(), nullable=False)
+        batch_op.drop_column('status')
@@ -0,0 +1,53 @@
+"""add reminders_archive table
+
+Revision ID: c8d4f2a6e1b9
+Revises: f1a9d3c6b8e2
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8d4f2a6e1b9'
+down_revision: Union[str, None] = 'f1a9d3c6b8e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('reminders_archive',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=200), nullable=False),
+    sa.Column('message', sa.Text(), nullable=False),
+    sa.Column('phone_number', sa.String(length=20), nullable=False),
+    sa.Column('date_time', sa.DateTime(), nullable=False),
+    sa.Column('timezone', sa.String(length=100), nullable=False),
+    sa.Column('date_time_utc', sa.DateTime(), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('attempt_count', sa.Integer(), nullable=False),
+    sa.Column('max_attempts', sa.Integer(), nullable=False),
+    sa.Column('next_retry_at', sa.DateTime(), nullable=True),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('recurrence_rule', sa.String(length=255), nullable=True),
+    sa.Column('recurrence_start', sa.DateTime(), nullable=True),
+    sa.Column('idempotency_key', sa.String(length=64), nullable=True),
+    sa.Column('vapi_call_id', sa.String(length=100), nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_reminders_archive_id'), 'reminders_archive', ['id'], unique=False)
+    op.create_index('ix_reminders_archive_user_id_date_time', 'reminders_archive', ['user_id', 'date_time'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reminders_archive_user_id_date_time', table_name='reminders_archive')
+    op.drop_index(op.f('ix_reminders_archive_id'), table_name='reminders_archive')
+    op.drop_table('reminders_archive')
@@ -0,0 +1,30 @@
+"""add recurrence fields to reminders
+
+Revision ID: e3c5a7d90b21
+Revises: b7e2f91c4d18
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3c5a7d90b21'
+down_revision: Union[str, None] = 'b7e2f91c4d18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # RRULE body; NULL for one-off reminders
+    op.add_column('reminders', sa.Column('recurrence_rule', sa.String(length=255), nullable=True))
+    # Local start the rule is anchored to
+    op.add_column('reminders', sa.Column('recurrence_start', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('reminders', 'recurrence_start')
+    op.drop_column('reminders', 'recurrence_rule')
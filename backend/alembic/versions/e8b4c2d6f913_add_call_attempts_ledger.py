@@ -0,0 +1,87 @@
+"""add call_attempts ledger, drop per-attempt columns from reminders
+
+Revision ID: e8b4c2d6f913
+Revises: d5e1a8c3f702
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8b4c2d6f913'
+down_revision: Union[str, None] = 'd5e1a8c3f702'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('call_attempts',
+    sa.Column('reminder_id', sa.Integer(), nullable=False),
+    sa.Column('attempt_number', sa.Integer(), nullable=False),
+    sa.Column('idempotency_key', sa.String(length=64), nullable=False),
+    sa.Column('provider_call_id', sa.String(length=100), nullable=True),
+    sa.Column('succeeded', sa.Boolean(), nullable=False),
+    sa.Column('error_class', sa.String(length=100), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('started_at', sa.DateTime(), nullable=False),
+    sa.Column('finished_at', sa.DateTime(), nullable=False),
+    sa.Column('latency_ms', sa.Integer(), nullable=True),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('idempotency_key')
+    )
+    op.create_index(op.f('ix_call_attempts_id'), 'call_attempts', ['id'], unique=False)
+    op.create_index(op.f('ix_call_attempts_reminder_id'), 'call_attempts', ['reminder_id'], unique=False)
+    op.create_index(op.f('ix_call_attempts_provider_call_id'), 'call_attempts', ['provider_call_id'], unique=False)
+
+    # Keep each reminder's latest attempt (the only one the old columns recorded).
+    # Its timing is unknown, so updated_at stands in and latency is left empty.
+    reminders = sa.table('reminders',
+        sa.column('id', sa.Integer), sa.column('attempt_count', sa.Integer),
+        sa.column('idempotency_key', sa.String), sa.column('vapi_call_id', sa.String),
+        sa.column('last_error', sa.Text), sa.column('updated_at', sa.DateTime)
+    )
+    call_attempts = sa.table('call_attempts',
+        sa.column('reminder_id', sa.Integer), sa.column('attempt_number', sa.Integer),
+        sa.column('idempotency_key', sa.String), sa.column('provider_call_id', sa.String),
+        sa.column('succeeded', sa.Boolean), sa.column('error', sa.Text),
+        sa.column('started_at', sa.DateTime), sa.column('finished_at', sa.DateTime),
+        sa.column('created_at', sa.DateTime), sa.column('updated_at', sa.DateTime)
+    )
+    op.execute(call_attempts.insert().from_select(
+        ['reminder_id', 'attempt_number', 'idempotency_key', 'provider_call_id', 'succeeded',
+         'error', 'started_at', 'finished_at', 'created_at', 'updated_at'],
+        sa.select(
+            reminders.c.id, reminders.c.attempt_count, reminders.c.idempotency_key,
+            reminders.c.vapi_call_id, reminders.c.vapi_call_id.is_not(None), reminders.c.last_error,
+            reminders.c.updated_at, reminders.c.updated_at, reminders.c.updated_at, reminders.c.updated_at
+        ).where(reminders.c.idempotency_key.is_not(None))
+    ))
+
+    with op.batch_alter_table('reminders') as batch_op:
+        batch_op.drop_index('ix_reminders_vapi_call_id')
+        batch_op.drop_index('ix_reminders_idempotency_key')
+        batch_op.drop_column('vapi_call_id')
+        batch_op.drop_column('idempotency_key')
+        batch_op.drop_column('last_error')
+
+
+def downgrade() -> None:
+    # Attempt history is dropped; the restored columns start out empty
+    with op.batch_alter_table('reminders') as batch_op:
+        batch_op.add_column(sa.Column('last_error', sa.Text(), nullable=True))
+        batch_op.add_column(sa.Column('idempotency_key', sa.String(length=64), nullable=True))
+        batch_op.add_column(sa.Column('vapi_call_id', sa.String(length=100), nullable=True))
+        batch_op.create_index('ix_reminders_idempotency_key', ['idempotency_key'], unique=True)
+        batch_op.create_index('ix_reminders_vapi_call_id', ['vapi_call_id'])
+
+    op.drop_index(op.f('ix_call_attempts_provider_call_id'), table_name='call_attempts')
+    op.drop_index(op.f('ix_call_attempts_reminder_id'), table_name='call_attempts')
+    op.drop_index(op.f('ix_call_attempts_id'), table_name='call_attempts')
+    op.drop_table('call_attempts')
@@ -0,0 +1,90 @@
+"""store refresh tokens as sha256 digest with expiry
+
+Revision ID: f1a9d3c6b8e2
+Revises: e3c5a7d90b21
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from datetime import datetime, timedelta
+import hashlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1a9d3c6b8e2'
+down_revision: Union[str, None] = 'e3c5a7d90b21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Fallback lifetime for rows whose JWT has no readable exp claim
+LEGACY_TOKEN_LIFETIME = timedelta(days=7)
+
+
+def _token_expiry(token: str, created_at: datetime) -> datetime:
+    """Read exp from the stored JWT without verifying it."""
+    from jose import jwt
+
+    try:
+        exp = jwt.get_unverified_claims(token).get("exp")
+        if isinstance(exp, (int, float)):
+            return datetime.utcfromtimestamp(exp)
+    except Exception:
+        pass
+    return created_at + LEGACY_TOKEN_LIFETIME
+
+
+def upgrade() -> None:
+    op.add_column('refresh_tokens', sa.Column('token_hash', sa.String(length=64), nullable=True))
+    op.add_column('refresh_tokens', sa.Column('expires_at', sa.DateTime(), nullable=True))
+
+    # Backfill digests and expiries from the stored tokens; revoked rows are
+    # dropped since they can never be used again
+    bind = op.get_bind()
+    refresh_tokens = sa.table(
+        'refresh_tokens',
+        sa.column('id', sa.Integer),
+        sa.column('token', sa.String),
+        sa.column('token_hash', sa.String),
+        sa.column('expires_at', sa.DateTime),
+        sa.column('is_revoked', sa.Boolean),
+        sa.column('created_at', sa.DateTime),
+    )
+    bind.execute(sa.delete(refresh_tokens).where(refresh_tokens.c.is_revoked == sa.true()))
+
+    rows = bind.execute(
+        sa.select(refresh_tokens.c.id, refresh_tokens.c.token, refresh_tokens.c.created_at)
+    ).fetchall()
+    for row in rows:
+        bind.execute(
+            sa.update(refresh_tokens)
+            .where(refresh_tokens.c.id == row.id)
+            .values(
+                token_hash=hashlib.sha256(row.token.encode()).hexdigest(),
+                expires_at=_token_expiry(row.token, row.created_at)
+            )
+        )
+
+    with op.batch_alter_table('refresh_tokens') as batch_op:
+        batch_op.drop_index('ix_refresh_tokens_token')
+        batch_op.drop_column('token')
+        batch_op.alter_column('token_hash', existing_type=sa.String(length=64), nullable=False)
+        batch_op.alter_column('expires_at', existing_type=sa.DateTime(), nullable=False)
+        batch_op.create_index('ix_refresh_tokens_token_hash', ['token_hash'], unique=True)
+        batch_op.create_index('ix_refresh_tokens_expires_at', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    # Raw tokens cannot be recovered from their digests, so existing refresh
+    # tokens are discarded and users must log in again
+    op.execute('DELETE FROM refresh_tokens')
+
+    with op.batch_alter_table('refresh_tokens') as batch_op:
+        batch_op.drop_index('ix_refresh_tokens_expires_at')
+        batch_op.drop_index('ix_refresh_tokens_token_hash')
+        batch_op.add_column(sa.Column('token', sa.String(length=500), nullable=False))
+        batch_op.create_index('ix_refresh_tokens_token', ['token'], unique=True)
+        batch_op.drop_column('expires_at')
+        batch_op.drop_column('token_hash')
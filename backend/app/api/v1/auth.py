@@ -3,15 +3,17 @@ import secrets
 from pathlib import Path
 from fastapi import APIRouter, Depends, HTTPException, status, Response, Request
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import select, update
 
-from app.dependencies import get_db, get_current_user, get_current_user_from_cookie
+from app.dependencies import get_db, get_current_user_from_cookie_for_write
 from app.schemas.auth import TokenRefresh, TokenResponse, Token
 from app.schemas.user import UserCreate, UserLogin, PasswordResetRequest, PasswordResetConfirm, PasswordChange
 from app.models.refresh_token import RefreshToken
 from app.models.user import User
-from app.core.security import create_access_token, create_refresh_token, decode_token
+from app.core.user_cache import CurrentUser, user_cache
+from app.core.security import create_access_token, create_refresh_token, decode_token, hash_token, refresh_token_expiry
 from app.core.password import hash_password, verify_password
+from app.core.rate_limit import client_ip, login_limiter, password_reset_limiter
 from app.core.cookies import set_auth_cookies, clear_auth_cookies, COOKIE_CONFIG
 from app.config import settings
 
@@ -54,7 +56,11 @@ def signup(user_data: UserCreate, response: Response, db: Session = Depends(get_
     refresh_token = create_refresh_token(data={"sub": str(new_user.id)})
 
     # Store refresh token
-    refresh_token_model = RefreshToken(token=refresh_token, user_id=new_user.id)
+    refresh_token_model = RefreshToken(
+        token_hash=hash_token(refresh_token),
+        user_id=new_user.id,
+        expires_at=refresh_token_expiry()
+    )
     db.add(refresh_token_model)
     db.commit()
 
@@ -65,20 +71,26 @@ def signup(user_data: UserCreate, response: Response, db: Session = Depends(get_
 
 
 @router.post("/login", status_code=status.HTTP_200_OK)
-def login(user_data: UserLogin, response: Response, db: Session = Depends(get_db)):
+def login(user_data: UserLogin, request: Request, response: Response, db: Session = Depends(get_db)):
     """
     Login with email and password, set httpOnly cookies.
 
     - **email**: User's email address
     - **password**: User's password
     - **remember_me**: If True, refresh token persists for 7 days; if False, session cookie
+
+    Attempts are rate limited per client IP and per email (429 when exceeded).
     """
+    # Throttle before any DB lookup or bcrypt verification
+    login_limiter.check(ip=client_ip(request), email=user_data.email)
+
     # Find user by email
     stmt = select(User).where(User.email == user_data.email)
     user = db.scalars(stmt).first()
 
     # Use generic error message to prevent user enumeration
     if not user:
+        login_limiter.record_failure(email=user_data.email)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
@@ -93,17 +105,24 @@ def login(user_data: UserLogin, response: Response, db: Session = Depends(get_db
 
     # Verify password using timing-safe comparison
     if not verify_password(user_data.password, user.password_hash):
+        login_limiter.record_failure(email=user_data.email)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
         )
 
+    login_limiter.reset(email=user_data.email)
+
     # Generate tokens
     access_token = create_access_token(data={"sub": str(user.id), "email": user.email})
     refresh_token = create_refresh_token(data={"sub": str(user.id)})
 
     # Store refresh token
-    refresh_token_model = RefreshToken(token=refresh_token, user_id=user.id)
+    refresh_token_model = RefreshToken(
+        token_hash=hash_token(refresh_token),
+        user_id=user.id,
+        expires_at=refresh_token_expiry()
+    )
     db.add(refresh_token_model)
     db.commit()
 
@@ -149,10 +168,11 @@ def refresh_access_token(
             detail="Invalid token type"
         )
 
-    # Check if token exists and is not revoked
+    # Check if token exists, is not revoked and has not expired
     stmt = select(RefreshToken).where(
-        RefreshToken.token == refresh_token,
-        RefreshToken.is_revoked == False
+        RefreshToken.token_hash == hash_token(refresh_token),
+        RefreshToken.is_revoked == False,
+        RefreshToken.expires_at > datetime.utcnow()
     )
     refresh_token_model = db.scalars(stmt).first()
 
@@ -198,7 +218,7 @@ def refresh_access_token(
 def logout(
     request: Request,
     response: Response,
-    current_user: User = Depends(get_current_user_from_cookie),
+    current_user: CurrentUser = Depends(get_current_user_from_cookie_for_write),
     db: Session = Depends(get_db)
 ):
     """
@@ -210,16 +230,17 @@ def logout(
     refresh_token = request.cookies.get("refresh_token")
 
     if refresh_token:
-        # Find and revoke refresh token
-        stmt = select(RefreshToken).where(
-            RefreshToken.token == refresh_token,
-            RefreshToken.user_id == current_user.id
+        # Revoke in a single statement, scoped to the already-resolved principal
+        db.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.token_hash == hash_token(refresh_token),
+                RefreshToken.user_id == current_user.id,
+                RefreshToken.is_revoked == False
+            )
+            .values(is_revoked=True)
         )
-        refresh_token_model = db.scalars(stmt).first()
-
-        if refresh_token_model:
-            refresh_token_model.is_revoked = True
-            db.commit()
+        db.commit()
 
     # Clear httpOnly cookies
     clear_auth_cookies(response)
@@ -230,6 +251,7 @@ def logout(
 @router.post("/password-reset/request", status_code=status.HTTP_200_OK)
 def request_password_reset(
     reset_request: PasswordResetRequest,
+    request: Request,
     db: Session = Depends(get_db)
 ):
     """
@@ -239,7 +261,11 @@ def request_password_reset(
 
     Note: Always returns success to prevent user enumeration.
     If the email exists, a reset token is generated and logged (dev mode).
+    Requests are rate limited per client IP and per email (429 when exceeded).
     """
+    # Throttle before any DB lookup or token write
+    password_reset_limiter.check(ip=client_ip(request), email=reset_request.email)
+
     # Find user by email
     stmt = select(User).where(User.email == reset_request.email)
     user = db.scalars(stmt).first()
@@ -316,6 +342,7 @@ def confirm_password_reset(
     user.reset_token_expires_at = None
 
     db.commit()
+    user_cache.invalidate(user.id)
 
     return {"message": "Password reset successful"}
 
@@ -323,7 +350,7 @@ def confirm_password_reset(
 @router.post("/password/change", status_code=status.HTTP_200_OK)
 def change_password(
     password_change: PasswordChange,
-    current_user: User = Depends(get_current_user_from_cookie),
+    current_user: CurrentUser = Depends(get_current_user_from_cookie_for_write),
     db: Session = Depends(get_db)
 ):
     """
@@ -334,21 +361,30 @@ def change_password(
 
     Requires authentication.
     """
+    # The cached principal carries no credentials; load the row to update it
+    user = db.get(User, current_user.id)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found"
+        )
+
     # Verify current password
-    if current_user.password_hash is None:
+    if user.password_hash is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="No password set. Please use password reset."
         )
 
-    if not verify_password(password_change.current_password, current_user.password_hash):
+    if not verify_password(password_change.current_password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Current password is incorrect"
         )
 
     # Hash and set new password
-    current_user.password_hash = hash_password(password_change.new_password)
+    user.password_hash = hash_password(password_change.new_password)
     db.commit()
+    user_cache.invalidate(user.id)
 
     return {"message": "Password changed successfully"}
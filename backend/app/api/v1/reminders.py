@@ -1,20 +1,81 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+import asyncio
+import json
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func, or_
-from typing import List, Optional
+from sqlalchemy import FromClause, select, func, or_
+from typing import List, Literal, Optional
+from datetime import datetime, timedelta, timezone as dt_timezone
 
-from app.dependencies import get_db, get_current_user_from_cookie
+from app.dependencies import get_db, get_read_db, get_current_user_from_cookie, get_current_user_from_cookie_for_write
 from app.models.reminder import Reminder, ReminderStatus
-from app.models.user import User
-from app.schemas.reminder import ReminderCreate, ReminderUpdate, ReminderResponse, PaginatedResponse, ReminderStatsResponse
+from app.core.user_cache import CurrentUser
+from app.schemas.reminder import ReminderCreate, ReminderUpdate, ReminderResponse, PaginatedResponse, ReminderStatsResponse, ReminderOccurrence
+from app.services.reminder_export import stream_export, EXPORT_MEDIA_TYPES
+from app.services.reminder_occurrences import expand_occurrences
+from app.services.reminder_serialization import REMINDER_RESPONSE_FIELDS, rows_to_dicts
+from app.services.reminder_history import (
+    reminder_history, archived_status_counts, get_archived_reminder
+)
+from app.core.responses import FastJSONResponse
+from app.core.events import event_bus, stage_reminder_event
+from app.core.write_queue import run_write
+from app.config import settings
 
 router = APIRouter(prefix="/reminders", tags=["reminders"])
 
 
+def build_reminder_conditions(
+    user_id: int,
+    status_filter: Optional[str] = None,
+    search: Optional[str] = None,
+    source: FromClause = Reminder.__table__
+) -> list:
+    """
+    Build the WHERE conditions shared by the listing and export endpoints.
+
+    Conditions reference `source` columns (see reminder_history()).
+
+    Raises:
+        HTTPException: 400 if status_filter is not a valid ReminderStatus
+    """
+    columns = source.c
+
+    # Base query with user filter
+    conditions = [columns.user_id == user_id]
+
+    # Add status filter if provided
+    if status_filter:
+        if status_filter not in [s.value for s in ReminderStatus]:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid status. Must be one of: {', '.join([s.value for s in ReminderStatus])}"
+            )
+        conditions.append(columns.status == status_filter)
+
+    # Add search filter if provided
+    if search:
+        search_pattern = f"%{search}%"
+        search_condition = or_(
+            columns.title.ilike(search_pattern),
+            columns.message.ilike(search_pattern)
+        )
+        conditions.append(search_condition)
+
+    return conditions
+
+
+def _to_naive_utc(value: datetime) -> datetime:
+    """Normalize a query datetime to naive UTC (naive input is assumed UTC)."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(dt_timezone.utc).replace(tzinfo=None)
+
+
 @router.post("/", response_model=ReminderResponse, status_code=status.HTTP_201_CREATED)
 def create_reminder(
     reminder_data: ReminderCreate,
-    current_user: User = Depends(get_current_user_from_cookie),
+    current_user: CurrentUser = Depends(get_current_user_from_cookie_for_write),
     db: Session = Depends(get_db)
 ):
     """
@@ -25,6 +86,7 @@ def create_reminder(
     - **phone_number**: Phone with country code (e.g., +2348101217888)
     - **date_time**: When to send reminder (local datetime)
     - **timezone**: IANA timezone identifier (e.g., "America/New_York", "Asia/Kolkata") or legacy UTC offset (e.g., UTC+1, UTC-7)
+    - **recurrence_rule**: Optional RRULE body (e.g., "FREQ=DAILY", "FREQ=WEEKLY;BYDAY=MO,WE;COUNT=10")
     """
     # Create reminder
     new_reminder = Reminder(
@@ -34,27 +96,32 @@ def create_reminder(
         phone_number=reminder_data.phone_number,
         date_time=reminder_data.date_time,
         timezone=reminder_data.timezone,
-        status="scheduled"
+        status="scheduled",
+        recurrence_rule=reminder_data.recurrence_rule,
+        recurrence_start=reminder_data.date_time if reminder_data.recurrence_rule else None
     )
 
     # Compute UTC datetime
     new_reminder.set_utc_datetime(reminder_data.date_time, reminder_data.timezone)
 
-    db.add(new_reminder)
-    db.commit()
-    db.refresh(new_reminder)
+    def write(session) -> None:
+        session.add(new_reminder)
+        session.flush()
+        stage_reminder_event(session, "created", new_reminder)
+
+    run_write(db, write)
 
     return new_reminder
 
 
-@router.get("/", response_model=PaginatedResponse[ReminderResponse])
+@router.get("/", response_model=PaginatedResponse[ReminderResponse], response_class=FastJSONResponse)
 def list_reminders(
-    current_user: User = Depends(get_current_user_from_cookie),
+    current_user: CurrentUser = Depends(get_current_user_from_cookie),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: Optional[int] = Query(None, ge=1, le=100, description="Maximum records to return (omit to get all)"),
     status: Optional[str] = Query(None, description="Filter by status (scheduled, completed, failed)"),
     search: Optional[str] = Query(None, description="Search in title and message"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     List all reminders for authenticated user with optional filtering.
@@ -63,67 +130,171 @@ def list_reminders(
     - **limit**: Maximum records to return (max 100, omit to get all records)
     - **status**: Filter by reminder status (optional)
     - **search**: Search text in title and message (optional)
-    """
-    # Base query with user filter
-    base_conditions = [Reminder.user_id == current_user.id]
-
-    # Add status filter if provided
-    if status:
-        if status not in [s.value for s in ReminderStatus]:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid status. Must be one of: {', '.join([s.value for s in ReminderStatus])}"
-            )
-        base_conditions.append(Reminder.status == status)
 
-    # Add search filter if provided
-    if search:
-        search_pattern = f"%{search}%"
-        search_condition = or_(
-            Reminder.title.ilike(search_pattern),
-            Reminder.message.ilike(search_pattern)
-        )
-        base_conditions.append(search_condition)
+    Finished reminders moved to the archive are included transparently.
+    """
+    source = reminder_history(status)
+    base_conditions = build_reminder_conditions(current_user.id, status, search, source)
 
     # Get total count with filters
     count_stmt = (
         select(func.count())
-        .select_from(Reminder)
+        .select_from(source)
         .where(*base_conditions)
     )
     total = db.scalar(count_stmt) or 0
 
-    # Get paginated reminders with filters
+    # Get paginated reminders with filters, selecting only the response
+    # columns as plain rows instead of full ORM objects
     stmt = (
-        select(Reminder)
+        select(*(source.c[field] for field in REMINDER_RESPONSE_FIELDS))
         .where(*base_conditions)
         .offset(skip)
-        .order_by(Reminder.date_time.asc())
+        .order_by(source.c.date_time.asc())
     )
 
     # Only apply limit if provided
     if limit is not None:
         stmt = stmt.limit(limit)
 
-    reminders = list(db.scalars(stmt).all())
+    items = rows_to_dicts(db.execute(stmt))
 
-    return PaginatedResponse(
-        items=reminders,
-        total=total,
-        skip=skip,
-        limit=limit if limit is not None else total
+    # Rows already match ReminderResponse, so return them directly and skip
+    # response_model re-validation; response_model still documents the shape
+    return FastJSONResponse({
+        "items": items,
+        "total": total,
+        "skip": skip,
+        "limit": limit if limit is not None else total
+    })
+
+
+@router.get("/export")
+def export_reminders(
+    current_user: CurrentUser = Depends(get_current_user_from_cookie),
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="Export format (ndjson or csv)"),
+    status: Optional[str] = Query(None, description="Filter by status (scheduled, completed, failed)"),
+    search: Optional[str] = Query(None, description="Search in title and message"),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Stream the authenticated user's full reminder history.
+
+    - **format**: `ndjson` (one JSON object per line) or `csv` (with header row)
+    - **status**: Filter by reminder status (optional)
+    - **search**: Search text in title and message (optional)
+
+    Rows are read with a server-side cursor and written to the response as
+    they arrive, so memory use stays flat regardless of history size.
+    Archived reminders are included.
+    """
+    source = reminder_history(status)
+    conditions = build_reminder_conditions(current_user.id, status, search, source)
+
+    return StreamingResponse(
+        stream_export(db, source, conditions, format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="reminders.{format}"'}
     )
 
 
+@router.get("/events")
+async def stream_reminder_events(
+    request: Request,
+    current_user: CurrentUser = Depends(get_current_user_from_cookie),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Server-sent events stream of the authenticated user's reminder changes.
+
+    Emits an `event: reminder` message whenever one of the user's reminders is
+    created, updated, deleted or changes status (e.g. processing → completed),
+    so clients can refresh on change instead of polling list/stats.
+    Idle streams receive a keep-alive comment every SSE_HEARTBEAT_SECONDS.
+    """
+    user_id = current_user.id
+
+    # The session is only needed for authentication; release its connection
+    # instead of holding it for the lifetime of the stream
+    db.close()
+
+    subscription = event_bus.subscribe(user_id)
+
+    async def event_stream():
+        try:
+            yield "retry: 5000\n\n"
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(
+                        subscription.queue.get(),
+                        timeout=settings.SSE_HEARTBEAT_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+
+                message = f"event: reminder\ndata: {json.dumps(event)}\n\n"
+                if "id" in event:
+                    message = f"id: {event['id']}\n" + message
+                yield message
+        finally:
+            event_bus.unsubscribe(subscription)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+# Longest window the occurrences endpoint will expand in one request
+MAX_OCCURRENCE_WINDOW_DAYS = 366
+
+
+@router.get("/occurrences", response_model=List[ReminderOccurrence])
+def list_occurrences(
+    current_user: CurrentUser = Depends(get_current_user_from_cookie),
+    start: Optional[datetime] = Query(None, description="Window start in UTC (default: now)"),
+    end: Optional[datetime] = Query(None, description="Window end in UTC (default: start + 30 days)"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum occurrences to return"),
+    db: Session = Depends(get_read_db)
+):
+    """
+    List upcoming occurrences of the user's active reminders within a window.
+
+    Recurring reminders are expanded lazily from their RRULE in the reminder's
+    own timezone; one-off reminders appear once. Results are ordered by UTC time.
+
+    - **start** / **end**: UTC window (max 366 days)
+    - **limit**: Maximum occurrences to return (max 1000)
+    """
+    window_start = _to_naive_utc(start) if start else datetime.utcnow()
+    window_end = _to_naive_utc(end) if end else window_start + timedelta(days=30)
+
+    if window_end < window_start:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end must not be before start"
+        )
+    if window_end - window_start > timedelta(days=MAX_OCCURRENCE_WINDOW_DAYS):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Window must not exceed {MAX_OCCURRENCE_WINDOW_DAYS} days"
+        )
+
+    return expand_occurrences(db, current_user.id, window_start, window_end, limit)
+
+
 @router.get("/stats", response_model=ReminderStatsResponse)
 def get_reminder_stats(
-    current_user: User = Depends(get_current_user_from_cookie),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_from_cookie),
+    db: Session = Depends(get_read_db)
 ):
     """
     Get reminder statistics for the authenticated user.
 
-    Returns counts of reminders by status (total, scheduled, completed, failed).
+    Returns counts of reminders by status (total, scheduled, completed, failed),
+    including archived reminders.
     """
     # Base condition for user's reminders
     base_condition = Reminder.user_id == current_user.id
@@ -160,6 +331,12 @@ def get_reminder_stats(
     )
     failed = db.scalar(failed_stmt) or 0
 
+    # Finished reminders moved out of the hot table
+    archived = archived_status_counts(db, current_user.id)
+    total += sum(archived.values())
+    completed += archived.get(ReminderStatus.COMPLETED.value, 0)
+    failed += archived.get(ReminderStatus.FAILED.value, 0)
+
     return ReminderStatsResponse(
         total=total,
         scheduled=scheduled,
@@ -171,15 +348,15 @@ def get_reminder_stats(
 @router.get("/{reminder_id}", response_model=ReminderResponse)
 def get_reminder(
     reminder_id: int,
-    current_user: User = Depends(get_current_user_from_cookie),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_from_cookie),
+    db: Session = Depends(get_read_db)
 ):
-    """Get a specific reminder by ID."""
+    """Get a specific reminder by ID (active or archived)."""
     stmt = select(Reminder).where(
         Reminder.id == reminder_id,
         Reminder.user_id == current_user.id
     )
-    reminder = db.scalars(stmt).first()
+    reminder = db.scalars(stmt).first() or get_archived_reminder(db, current_user.id, reminder_id)
 
     if not reminder:
         raise HTTPException(
@@ -194,7 +371,7 @@ def get_reminder(
 def update_reminder(
     reminder_id: int,
     reminder_data: ReminderUpdate,
-    current_user: User = Depends(get_current_user_from_cookie),
+    current_user: CurrentUser = Depends(get_current_user_from_cookie_for_write),
     db: Session = Depends(get_db)
 ):
     """Update a reminder."""
@@ -206,6 +383,11 @@ def update_reminder(
     reminder = db.scalars(stmt).first()
 
     if not reminder:
+        if get_archived_reminder(db, current_user.id, reminder_id) is not None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Archived reminders cannot be modified"
+            )
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Reminder not found"
@@ -220,8 +402,16 @@ def update_reminder(
     if "date_time" in update_data or "timezone" in update_data:
         reminder.set_utc_datetime(reminder.date_time, reminder.timezone)
 
-    db.commit()
-    db.refresh(reminder)
+    # Re-anchor the recurrence when the rule or the start time changes
+    if "date_time" in update_data or "recurrence_rule" in update_data:
+        reminder.recurrence_start = reminder.date_time if reminder.recurrence_rule else None
+
+    def write(session) -> Reminder:
+        merged = session.merge(reminder)
+        stage_reminder_event(session, "updated", merged)
+        return merged
+
+    reminder = run_write(db, write)
 
     return reminder
 
@@ -229,15 +419,15 @@ def update_reminder(
 @router.delete("/{reminder_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_reminder(
     reminder_id: int,
-    current_user: User = Depends(get_current_user_from_cookie),
+    current_user: CurrentUser = Depends(get_current_user_from_cookie_for_write),
     db: Session = Depends(get_db)
 ):
-    """Delete a reminder."""
+    """Delete a reminder (active or archived)."""
     stmt = select(Reminder).where(
         Reminder.id == reminder_id,
         Reminder.user_id == current_user.id
     )
-    reminder = db.scalars(stmt).first()
+    reminder = db.scalars(stmt).first() or get_archived_reminder(db, current_user.id, reminder_id)
 
     if not reminder:
         raise HTTPException(
@@ -245,7 +435,10 @@ def delete_reminder(
             detail="Reminder not found"
         )
 
-    db.delete(reminder)
-    db.commit()
+    def write(session) -> None:
+        session.delete(session.merge(reminder))
+        stage_reminder_event(session, "deleted", reminder)
+
+    run_write(db, write)
 
     return None
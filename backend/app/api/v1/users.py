@@ -1,14 +1,14 @@
 from fastapi import APIRouter, Depends
 
 from app.dependencies import get_current_user_from_cookie
-from app.models.user import User
+from app.core.user_cache import CurrentUser
 from app.schemas.user import UserResponse
 
 router = APIRouter(prefix="/users", tags=["users"])
 
 
 @router.get("/me", response_model=UserResponse)
-def get_current_user_info(current_user: User = Depends(get_current_user_from_cookie)):
+def get_current_user_info(current_user: CurrentUser = Depends(get_current_user_from_cookie)):
     """
     Get current authenticated user information.
 
@@ -13,10 +13,43 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "sqlite:///./data/app.db"
     TEST_DATABASE_URL: str = "sqlite:///./data/app_test.db"
+    DATABASE_READ_URL: str = ""  # Optional read replica for read-only routes (empty = primary)
+    READ_YOUR_WRITES_SECONDS: int = 5  # Pin a client to the primary this long after its own write
+
+    # Database Connection Pools (API requests and scheduler jobs use separate pools)
+    DB_POOL_SIZE: int = 5  # Persistent connections for API requests
+    DB_MAX_OVERFLOW: int = 10  # Extra connections opened under burst load
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0  # Max wait for a free connection before erroring
+    DB_POOL_RECYCLE_SECONDS: int = 1800  # Replace connections older than this (-1 disables)
+    DB_POOL_PRE_PING: bool = True  # Test connections on checkout to survive server restarts
+    SCHEDULER_DB_POOL_SIZE: int = 2  # Persistent connections for scheduler jobs/pollers
+    SCHEDULER_DB_MAX_OVERFLOW: int = 2
+
+    # SQLite Profile (applied to every connection when DATABASE_URL is SQLite)
+    SQLITE_WAL: bool = True  # WAL journal: readers don't block the writer
+    SQLITE_SYNCHRONOUS: str = "NORMAL"  # fsync on checkpoint only; durable enough with WAL
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000  # Wait this long for a lock before "database is locked"
+    SQLITE_MMAP_SIZE_BYTES: int = 268435456  # 256 MiB memory-mapped I/O window
+    SQLITE_CACHE_SIZE_KB: int = 65536  # Page cache per connection
+    SQLITE_TEMP_STORE: str = "MEMORY"  # Keep temp tables/indices in memory
+    SQLITE_CHECKPOINT_INTERVAL_MINUTES: int = 5  # Periodic passive WAL checkpoint
+    SQLITE_WRITE_QUEUE: bool = False  # Funnel writes through one group-committing writer thread
+    SQLITE_WRITE_QUEUE_MAX_BATCH: int = 100  # Max operations per group commit
+    SQLITE_WRITE_QUEUE_TIMEOUT_SECONDS: float = 10.0  # Max time a caller waits for its commit
 
     # API
     API_V1_PREFIX: str = "/api/v1"
 
+    # Logging (records are queued and written by a background thread)
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "json"  # "json" (one object per line) or "text"
+    LOG_QUEUE_SIZE: int = 10000  # Records buffered for the writer; overflow is dropped and counted
+    LOG_SAMPLING: str = ""  # Keep a fraction of DEBUG/INFO records, e.g. "app.jobs.daily_calls=0.1"
+
+    # Request Metrics (Server-Timing headers and per-request logs)
+    SLOW_REQUEST_MS: int = 500  # Log requests slower than this with their SQL statements
+    SLOW_REQUEST_MAX_STATEMENTS: int = 50  # Statements kept per request for the slow-request log
+
     # CORS
     CORS_ORIGINS: list[str] = ["http://localhost:3000"]
 
@@ -30,6 +63,25 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    TOKEN_CACHE_MAX_ENTRIES: int = 10000  # Verified-token cache size (0 disables)
+    REFRESH_TOKEN_PURGE_INTERVAL_MINUTES: int = 60  # How often expired/revoked tokens are deleted
+    REFRESH_TOKEN_PURGE_CHUNK_SIZE: int = 1000  # Rows deleted per transaction
+
+    # Auth Rate Limiting (sliding window, checked before any DB/bcrypt work)
+    RATE_LIMIT_BACKEND: str = "memory"  # "memory" (per process) or "redis" (shared across workers)
+    TRUSTED_PROXIES: list[str] = []  # Proxy IPs/CIDRs whose X-Forwarded-For is trusted for the client IP
+    LOGIN_RATE_LIMIT_PER_IP: int = 20
+    LOGIN_RATE_LIMIT_PER_EMAIL: int = 5  # Failed logins only; cleared on success
+    LOGIN_RATE_LIMIT_WINDOW_SECONDS: int = 300
+    PASSWORD_RESET_RATE_LIMIT_PER_IP: int = 5
+    PASSWORD_RESET_RATE_LIMIT_PER_EMAIL: int = 3
+    PASSWORD_RESET_RATE_LIMIT_WINDOW_SECONDS: int = 3600
+
+    # Password Hashing Pool
+    PASSWORD_HASH_WORKERS: int = 2  # bcrypt worker processes in the server (0 = hash inline); scripts always hash inline
+    PASSWORD_HASH_MAX_QUEUE: int = 8  # Requests allowed to wait for a worker
+    PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS: float = 2.0  # Max wait before responding 503
+    PASSWORD_HASH_TIMEOUT_SECONDS: float = 10.0  # Max wait for a worker's result before responding 503
 
     # Vapi Configuration
     VAPI_API_KEY: str = ""
@@ -39,12 +91,38 @@ class Settings(BaseSettings):
     SCHEDULER_POLL_INTERVAL_SECONDS: int = 60
     SCHEDULER_TIMEZONE: str = "UTC"
     SCHEDULER_BATCH_SIZE: int = 10  # Max reminders to process per poll
+    SCHEDULER_SHUTDOWN_DRAIN_SECONDS: float = 20.0  # Max wait on shutdown for the call in flight
+
+    # Scheduler Leader Election (only the lease holder runs the dispatch jobs)
+    SCHEDULER_LEADER_ELECTION: bool = False  # Enable when running several workers or replicas
+    SCHEDULER_LEADER_LEASE_NAME: str = "dispatch"  # One leader per lease name (e.g. one per shard)
+    SCHEDULER_LEADER_LEASE_TTL_SECONDS: int = 15  # A dead leader is replaced within this time
+    SCHEDULER_LEADER_RENEW_SECONDS: int = 5  # How often the leader renews (others retry) the lease
 
     # Retry Configuration
     RETRY_MAX_ATTEMPTS: int = 3
     RETRY_BASE_DELAY_SECONDS: int = 60  # Base delay for exponential backoff
     STUCK_PROCESSING_TIMEOUT_MINUTES: int = 5  # Reset stuck reminders after this duration
 
+    # Reminder Archive (finished reminders leave the hot dispatch table)
+    REMINDER_ARCHIVE_AFTER_DAYS: int = 30  # Archive COMPLETED/FAILED reminders older than this (0 disables)
+    REMINDER_ARCHIVE_INTERVAL_MINUTES: int = 60  # How often the archive mover runs
+    REMINDER_ARCHIVE_CHUNK_SIZE: int = 1000  # Reminders moved per transaction
+
+    # Reminder Event Stream (SSE) Configuration
+    EVENTS_BACKEND: str = "memory"  # "memory" (single process) or "outbox" (DB table, multi-process)
+    EVENTS_OUTBOX_POLL_SECONDS: float = 1.0  # How often each worker polls the outbox table
+    EVENTS_OUTBOX_BATCH_SIZE: int = 500  # Max outbox rows read per query
+    EVENTS_OUTBOX_GAP_SECONDS: float = 30.0  # How long a skipped id is re-checked for a late commit
+    EVENTS_OUTBOX_RETENTION_MINUTES: int = 60  # Delete outbox rows older than this (maintenance job)
+    SSE_HEARTBEAT_SECONDS: int = 15  # Keep-alive comment interval for idle streams
+
+    # Authenticated User Cache
+    USER_CACHE_BACKEND: str = "memory"  # "memory" (per process; single worker only) or "redis" (shared across workers)
+    USER_CACHE_TTL_SECONDS: int = 60  # Max staleness of a cached user projection
+    USER_CACHE_MAX_ENTRIES: int = 10000
+    REDIS_URL: str = "redis://localhost:6379/0"  # Used by shared cache backends
+
     # Email Configuration (for password resets)
     EMAIL_FROM: str = "noreply@callmereminder.com"
     EMAIL_FROM_NAME: str = "Call Me Reminder"
@@ -77,6 +155,11 @@ class Settings(BaseSettings):
             return self.TEST_DATABASE_URL
         return self.DATABASE_URL
 
+    @property
+    def is_sqlite(self) -> bool:
+        """Check if the configured database is SQLite."""
+        return self.database_url.startswith("sqlite")
+
 
 # Singleton pattern for settings
 settings = Settings()
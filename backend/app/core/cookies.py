@@ -31,6 +31,10 @@ COOKIE_CONFIG = {
     "refresh_token_session": {
         **_base_config,
         "max_age": None,  # Session cookie (expires when browser closes)
+    },
+    "primary_pin": {
+        **_base_config,
+        "max_age": settings.READ_YOUR_WRITES_SECONDS,  # Read-your-writes window
     }
 }
 
@@ -0,0 +1,98 @@
+"""
+Connection pool instrumentation.
+
+InstrumentedQueuePool is a QueuePool that times every checkout, including
+the time spent waiting for a free connection, and counts checkout timeouts.
+Together with the pool's own gauges (checked out, idle, overflow) this makes
+pool starvation visible via snapshot_pools() and the /health/db endpoint.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+
+
+@dataclass
+class PoolStats:
+    """Cumulative checkout counters for one named pool."""
+    name: str
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, waited: float, timed_out: bool) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool recording checkout wait time into a PoolStats."""
+
+    stats: PoolStats | None = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except exc.TimeoutError:
+            if self.stats is not None:
+                self.stats.record(time.perf_counter() - start, timed_out=True)
+            raise
+        if self.stats is not None:
+            self.stats.record(time.perf_counter() - start, timed_out=False)
+        return conn
+
+    def recreate(self):
+        # engine.dispose() swaps in a fresh pool; keep counting into the same stats
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+
+# Registered engines by pool name ("api", "scheduler")
+_engines: dict = {}
+
+
+def register_engine(name: str, engine) -> None:
+    """Attach stats to an engine's pool (if instrumented) and track it for snapshots."""
+    if isinstance(engine.pool, InstrumentedQueuePool):
+        engine.pool.stats = PoolStats(name=name)
+    _engines[name] = engine
+
+
+def snapshot_pools() -> dict[str, dict]:
+    """Current gauges and cumulative checkout counters for every registered pool."""
+    snapshot = {}
+    for name, engine in _engines.items():
+        pool = engine.pool
+        if not isinstance(pool, QueuePool):
+            snapshot[name] = {"pool": type(pool).__name__}
+            continue
+
+        entry = {
+            "pool": type(pool).__name__,
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": pool.overflow(),
+        }
+        stats = getattr(pool, "stats", None)
+        if stats is not None:
+            entry.update({
+                "checkouts": stats.checkouts,
+                "timeouts": stats.timeouts,
+                "wait_ms_avg": round(stats.wait_seconds_total * 1000 / max(stats.checkouts + stats.timeouts, 1), 3),
+                "wait_ms_max": round(stats.wait_seconds_max * 1000, 3),
+            })
+        snapshot[name] = entry
+    return snapshot
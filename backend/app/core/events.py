@@ -0,0 +1,312 @@
+"""
+In-process pub/sub for reminder change events.
+
+The scheduler and the reminder API publish an event whenever a reminder is
+created, updated, deleted or changes status. SSE connections subscribe per
+user and receive those events without polling the list/stats endpoints.
+
+Events are staged on the session that makes the change (stage_reminder_event)
+and only take effect if that transaction commits. Delivery between processes
+is delegated to a pluggable backend:
+- MemoryEventBackend: dispatches directly to subscribers in this process,
+  once the staging session has committed.
+- OutboxEventBackend: adds a reminder_events row to the staging session, so
+  the event is committed atomically with the change (transactional outbox);
+  every worker polls the table and dispatches new rows to its own subscribers.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable
+
+from sqlalchemy import event as sa_event, select, func
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal, SchedulerSessionLocal
+from app.core.write_queue import run_write
+from app.models.reminder_event import ReminderEvent
+
+logger = logging.getLogger(__name__)
+
+# Max events buffered per SSE connection before new events are dropped
+SUBSCRIBER_QUEUE_SIZE = 100
+
+# Session.info key for events staged in the current transaction
+_PENDING_EVENTS = "pending_reminder_events"
+
+# Id jumps wider than this are not tracked as possible late commits
+MAX_TRACKED_GAP = 1000
+
+
+@dataclass(eq=False)
+class Subscription:
+    """A single SSE connection's mailbox, bound to the event loop that owns it."""
+    user_id: int
+    loop: asyncio.AbstractEventLoop
+    queue: asyncio.Queue = field(default_factory=lambda: asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE))
+
+    def deliver(self, event: dict) -> None:
+        """Enqueue an event; must run on self.loop."""
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            logger.debug("Dropping event for slow subscriber (user %s)", self.user_id)
+
+
+class EventBackend:
+    """Interface for cross-process event delivery."""
+
+    def publish(self, event: dict) -> None:
+        raise NotImplementedError
+
+    def stage(self, session: Session, event: dict) -> None:
+        """Publish event once session commits; it is dropped if the session rolls back."""
+        session.info.setdefault(_PENDING_EVENTS, []).append(event)
+
+    async def start(self, dispatch: Callable[[dict], None]) -> None:
+        """Start receiving events published by other processes."""
+
+    async def stop(self) -> None:
+        """Stop receiving events."""
+
+
+class MemoryEventBackend(EventBackend):
+    """Single-process backend: publish dispatches straight to local subscribers."""
+
+    def __init__(self):
+        self._dispatch: Callable[[dict], None] | None = None
+
+    def publish(self, event: dict) -> None:
+        if self._dispatch is not None:
+            self._dispatch(event)
+
+    async def start(self, dispatch: Callable[[dict], None]) -> None:
+        self._dispatch = dispatch
+
+    async def stop(self) -> None:
+        self._dispatch = None
+
+
+class OutboxEventBackend(EventBackend):
+    """
+    Multi-process backend backed by the reminder_events table.
+
+    stage() adds the row to the caller's transaction. Each worker runs a
+    poller that reads, in bounded batches, rows newer than the last id it has
+    seen and dispatches them locally.
+
+    Ids are assigned when a row is inserted but become visible when its
+    transaction commits, so a row can appear after a higher id has already
+    been read (concurrent writers on PostgreSQL). Ids skipped over are kept
+    as gaps and re-checked for EVENTS_OUTBOX_GAP_SECONDS; gaps that never
+    fill were rolled back. Old rows are purged by a maintenance job.
+    """
+
+    def __init__(
+        self,
+        poll_seconds: float = settings.EVENTS_OUTBOX_POLL_SECONDS,
+        batch_size: int = settings.EVENTS_OUTBOX_BATCH_SIZE,
+        gap_seconds: float = settings.EVENTS_OUTBOX_GAP_SECONDS
+    ):
+        self.poll_seconds = poll_seconds
+        self.batch_size = batch_size
+        self.gap_seconds = gap_seconds
+        self._task: asyncio.Task | None = None
+        self._last_id = 0
+        self._gaps: dict[int, float] = {}  # unseen id below _last_id -> time.monotonic() when skipped
+
+    @staticmethod
+    def _row(event: dict) -> ReminderEvent:
+        return ReminderEvent(
+            user_id=event["user_id"],
+            reminder_id=event["reminder_id"],
+            event_type=event["event"],
+            status=event["status"]
+        )
+
+    def publish(self, event: dict) -> None:
+        # Standalone event, outside any business transaction
+        with SessionLocal() as db:
+            run_write(db, lambda s: s.add(self._row(event)))
+
+    def stage(self, session: Session, event: dict) -> None:
+        session.add(self._row(event))
+
+    async def start(self, dispatch: Callable[[dict], None]) -> None:
+        self._last_id = await asyncio.to_thread(self._max_id)
+        self._task = asyncio.create_task(self._poll_loop(dispatch))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _max_id(self) -> int:
+        with SchedulerSessionLocal() as db:
+            return db.scalar(select(func.max(ReminderEvent.id))) or 0
+
+    def _fetch_new(self) -> list[dict]:
+        now = time.monotonic()
+        # Gaps that stayed empty this long were rolled back, not committed late
+        self._gaps = {row_id: seen for row_id, seen in self._gaps.items() if now - seen < self.gap_seconds}
+
+        columns = (
+            ReminderEvent.id,
+            ReminderEvent.user_id,
+            ReminderEvent.reminder_id,
+            ReminderEvent.event_type,
+            ReminderEvent.status,
+            ReminderEvent.created_at
+        )
+        with SchedulerSessionLocal() as db:
+            late = []
+            if self._gaps:
+                late = db.execute(
+                    select(*columns).where(ReminderEvent.id.in_(self._gaps)).order_by(ReminderEvent.id.asc())
+                ).all()
+            rows = db.execute(
+                select(*columns)
+                .where(ReminderEvent.id > self._last_id)
+                .order_by(ReminderEvent.id.asc())
+                .limit(self.batch_size)
+            ).all()
+
+        for row in late:
+            del self._gaps[row.id]
+        for row in rows:
+            if row.id - self._last_id - 1 <= MAX_TRACKED_GAP:
+                for missing in range(self._last_id + 1, row.id):
+                    self._gaps[missing] = now
+            self._last_id = row.id
+
+        return [
+            {
+                "id": row.id,
+                "event": row.event_type,
+                "reminder_id": row.reminder_id,
+                "user_id": row.user_id,
+                "status": row.status,
+                "at": row.created_at.isoformat()
+            }
+            for row in [*late, *rows]
+        ]
+
+    async def _poll_loop(self, dispatch: Callable[[dict], None]) -> None:
+        while True:
+            try:
+                # Drain a backlog batch by batch, then wait for the next poll
+                while True:
+                    events = await asyncio.to_thread(self._fetch_new)
+                    for event in events:
+                        dispatch(event)
+                    if len(events) < self.batch_size:
+                        break
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Error polling reminder event outbox: %s", e)
+
+            await asyncio.sleep(self.poll_seconds)
+
+
+class ReminderEventBus:
+    """Fans reminder events out to the SSE subscriptions of the owning user."""
+
+    def __init__(self, backend: EventBackend):
+        self.backend = backend
+        self._subscribers: dict[int, set[Subscription]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, user_id: int) -> Subscription:
+        """Register a subscription; must be called from a running event loop."""
+        subscription = Subscription(user_id=user_id, loop=asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.user_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.user_id]
+
+    def dispatch(self, event: dict) -> None:
+        """Deliver an event to local subscribers. Safe to call from any thread."""
+        with self._lock:
+            subscribers = list(self._subscribers.get(event["user_id"], ()))
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.deliver, event)
+            except RuntimeError:
+                # Subscriber's loop already closed
+                self.unsubscribe(subscription)
+
+    def publish(self, event: dict) -> None:
+        """
+        Publish an event through the configured backend.
+
+        Never raises: event delivery is best-effort and must not break the
+        scheduler or API write that triggered it.
+        """
+        try:
+            self.backend.publish(event)
+        except Exception as e:
+            logger.error("Failed to publish reminder event: %s", e)
+
+    def stage(self, session: Session, event: dict) -> None:
+        """Publish event as part of session's transaction (see module docstring)."""
+        self.backend.stage(session, event)
+
+    async def start(self) -> None:
+        await self.backend.start(self.dispatch)
+
+    async def stop(self) -> None:
+        await self.backend.stop()
+
+
+def build_reminder_event(event_type: str, reminder_id: int, user_id: int, status: str) -> dict:
+    """Build the event payload sent to SSE clients."""
+    return {
+        "event": event_type,
+        "reminder_id": reminder_id,
+        "user_id": user_id,
+        "status": status,
+        "at": datetime.utcnow().isoformat()
+    }
+
+
+def stage_reminder_event(session: Session, event_type: str, reminder) -> None:
+    """Stage an event for a Reminder instance in the session that changes it (the id must be assigned)."""
+    event_bus.stage(session, build_reminder_event(event_type, reminder.id, reminder.user_id, reminder.status))
+
+
+def _create_backend() -> EventBackend:
+    if settings.EVENTS_BACKEND == "outbox":
+        return OutboxEventBackend()
+    return MemoryEventBackend()
+
+
+# Process-wide event bus
+event_bus = ReminderEventBus(_create_backend())
+
+
+@sa_event.listens_for(Session, "after_commit")
+def _publish_staged_events(session: Session) -> None:
+    for staged in session.info.pop(_PENDING_EVENTS, ()):
+        event_bus.publish(staged)
+
+
+@sa_event.listens_for(Session, "after_rollback")
+def _drop_staged_events(session: Session) -> None:
+    session.info.pop(_PENDING_EVENTS, None)
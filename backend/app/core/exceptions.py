@@ -20,3 +20,17 @@ class ValidationException(HTTPException):
 
     def __init__(self, detail: str):
         super().__init__(status_code=422, detail=detail)
+
+
+class ServiceUnavailableException(HTTPException):
+    """Exception raised when a capacity-limited resource is saturated."""
+
+    def __init__(self, detail: str = "Service temporarily unavailable", retry_after: int = 1):
+        super().__init__(status_code=503, detail=detail, headers={"Retry-After": str(retry_after)})
+
+
+class TooManyRequestsException(HTTPException):
+    """Exception raised when a client exceeds a rate limit."""
+
+    def __init__(self, detail: str = "Too many attempts, please try again later", retry_after: int = 60):
+        super().__init__(status_code=429, detail=detail, headers={"Retry-After": str(retry_after)})
@@ -0,0 +1,179 @@
+"""
+Scheduler leader election over a database lease row.
+
+Every API worker runs the APScheduler instance, so without coordination
+each process polls for due reminders and races the others to claim them.
+With SCHEDULER_LEADER_ELECTION enabled, the processes compete for the
+scheduler_leases row named SCHEDULER_LEADER_LEASE_NAME and only its holder
+runs the dispatch jobs. Use one lease name per shard to get one leader per
+shard.
+
+The holder renews the lease every SCHEDULER_LEADER_RENEW_SECONDS. If it dies,
+another process takes the lease over once it expires, i.e. within
+SCHEDULER_LEADER_LEASE_TTL_SECONDS. A graceful shutdown releases the lease
+so failover is immediate. Acquisition and renewal are a single conditional
+UPDATE, so this works the same on SQLite and PostgreSQL. Lease expiry is
+compared against each process's own clock: keep hosts NTP-synced, with a
+skew well below the TTL.
+
+Each takeover increments the lease's fencing token. Claims made by the
+leader are guarded on its token (see fence()), so a paused ex-leader that
+still believes it holds the lease cannot claim reminders after a newer
+leader took over.
+"""
+
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, case, exists, false, insert, or_, select, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+from app.config import settings
+from app.database import SchedulerSessionLocal
+from app.core.write_queue import run_write
+from app.models.scheduler_lease import SchedulerLease
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderLease:
+    """This process's view of one named scheduler lease."""
+
+    def __init__(self, name: str, ttl_seconds: int):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.holder = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.token: int | None = None
+        self._valid_until = 0.0  # time.monotonic() deadline of the current lease
+        self._row_exists = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_leader(self) -> bool:
+        return self.token is not None and time.monotonic() < self._valid_until
+
+    def fence(self):
+        """SQL condition that holds only while this process still owns the lease with its token."""
+        token = self.token
+        if token is None:
+            return false()
+        return exists().where(
+            SchedulerLease.name == self.name,
+            SchedulerLease.holder == self.holder,
+            SchedulerLease.fencing_token == token
+        )
+
+    def _ensure_row(self, db) -> None:
+        if self._row_exists:
+            return
+        if db.scalar(select(SchedulerLease.id).where(SchedulerLease.name == self.name)) is None:
+            try:
+                # Born expired, so the first renew() below can take it
+                run_write(db, lambda s: s.execute(insert(SchedulerLease).values(
+                    name=self.name, holder="", fencing_token=0,
+                    expires_at=datetime.utcnow() - timedelta(seconds=1)
+                )))
+            except IntegrityError:
+                # Another process created it first
+                db.rollback()
+        self._row_exists = True
+
+    def _take(self, session, now: datetime) -> int | None:
+        """Renew our lease, or take it over if it has expired; returns the fencing token."""
+        is_ours = SchedulerLease.holder == self.holder
+        stmt = (
+            update(SchedulerLease)
+            .where(
+                and_(
+                    SchedulerLease.name == self.name,
+                    or_(is_ours, SchedulerLease.expires_at < now)
+                )
+            )
+            .values(
+                fencing_token=case(
+                    (is_ours, SchedulerLease.fencing_token),
+                    else_=SchedulerLease.fencing_token + 1
+                ),
+                holder=self.holder,
+                expires_at=now + timedelta(seconds=self.ttl_seconds),
+                updated_at=now
+            )
+            .returning(SchedulerLease.fencing_token)
+        )
+        return session.execute(stmt).scalar()
+
+    def renew(self) -> bool:
+        """Acquire or renew the lease; returns whether this process is the leader."""
+        with self._lock:
+            started = time.monotonic()
+            db = SchedulerSessionLocal()
+            try:
+                self._ensure_row(db)
+                token = run_write(db, lambda s: self._take(s, datetime.utcnow()))
+            except SQLAlchemyError as e:
+                # Keep the current lease until it runs out locally; the next renewal retries
+                logger.error("Scheduler leader lease renewal failed: %s", e)
+                db.rollback()
+                return self.is_leader
+            finally:
+                db.close()
+
+            if token is None:
+                if self.token is not None:
+                    logger.warning("Lost scheduler leader lease %r", self.name)
+                self.token = None
+                return False
+
+            if token != self.token:
+                logger.info("Acquired scheduler leader lease %r (fencing token %d)", self.name, token)
+            self.token = token
+            self._valid_until = started + self.ttl_seconds
+            return True
+
+    def release(self) -> None:
+        """Give the lease up (on shutdown) so another process takes over immediately."""
+        with self._lock:
+            if self.token is None:
+                return
+            token, self.token = self.token, None
+            db = SchedulerSessionLocal()
+            try:
+                stmt = (
+                    update(SchedulerLease)
+                    .where(
+                        SchedulerLease.name == self.name,
+                        SchedulerLease.holder == self.holder,
+                        SchedulerLease.fencing_token == token
+                    )
+                    .values(expires_at=datetime.utcnow() - timedelta(seconds=1))
+                )
+                run_write(db, lambda s: s.execute(stmt))
+                logger.info("Released scheduler leader lease %r", self.name)
+            except SQLAlchemyError as e:
+                logger.error("Failed to release scheduler leader lease: %s", e)
+                db.rollback()
+            finally:
+                db.close()
+
+
+leader_lease: LeaderLease | None = None
+if settings.SCHEDULER_LEADER_ELECTION:
+    leader_lease = LeaderLease(
+        settings.SCHEDULER_LEADER_LEASE_NAME,
+        settings.SCHEDULER_LEADER_LEASE_TTL_SECONDS
+    )
+
+
+def is_scheduler_leader() -> bool:
+    """Whether this process should run the dispatch jobs (always, when election is off)."""
+    return leader_lease is None or leader_lease.is_leader
+
+
+def release_leader_lease() -> None:
+    if leader_lease is not None:
+        leader_lease.release()
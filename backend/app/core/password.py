@@ -1,13 +1,120 @@
-"""Password hashing and verification utilities using bcrypt."""
+"""
+Password hashing and verification utilities using bcrypt.
+
+bcrypt at 12 rounds costs ~250 ms of CPU per call. To keep a login burst from
+starving the API threadpool (and holding the GIL), hashing and verification
+run in a dedicated, size-limited process pool. Callers pass through an
+admission gate of PASSWORD_HASH_WORKERS + PASSWORD_HASH_MAX_QUEUE slots and
+get a 503 if no slot frees up within PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS, or
+if the worker doesn't answer within PASSWORD_HASH_TIMEOUT_SECONDS.
+
+The pool is only used once the application starts it (start_password_pool()
+in the lifespan). Workers are spawned, which re-imports the caller's
+__main__ module; scripts, tests and the REPL, which may lack an
+`if __name__ == "__main__"` guard, therefore hash inline. Set
+PASSWORD_HASH_WORKERS=0 to hash inline in the server as well.
+"""
+
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
 
 from passlib.context import CryptContext
 
+from app.config import settings
+from app.core.exceptions import ServiceUnavailableException
+
+logger = logging.getLogger(__name__)
+
 pwd_context = CryptContext(
     schemes=["bcrypt"],
     deprecated="auto",
     bcrypt__rounds=12
 )
 
+_pool: ProcessPoolExecutor | None = None
+_pool_enabled = False
+_pool_lock = threading.Lock()
+_admission = threading.BoundedSemaphore(
+    max(settings.PASSWORD_HASH_WORKERS, 0) + settings.PASSWORD_HASH_MAX_QUEUE
+)
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Create the worker pool on first use (spawned, so no threads are forked)."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _pool
+
+
+def start_password_pool() -> None:
+    """Route hashing through the worker pool from now on (called on application startup)."""
+    global _pool_enabled
+    _pool_enabled = settings.PASSWORD_HASH_WORKERS > 0
+
+
+def shutdown_password_pool() -> None:
+    """Stop the worker processes (called on application shutdown)."""
+    global _pool, _pool_enabled
+    with _pool_lock:
+        _pool_enabled = False
+        if _pool is not None:
+            _pool.shutdown(wait=True, cancel_futures=True)
+            _pool = None
+
+
+def _discard_pool(broken: ProcessPoolExecutor) -> None:
+    """Forget a broken pool so _get_pool() starts a fresh one; the pool stays enabled."""
+    global _pool
+    with _pool_lock:
+        # Another caller may already have replaced it
+        if _pool is broken:
+            _pool = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+def _run_bounded(fn, *args):
+    """Run fn in the process pool, waiting at most the configured time for a slot."""
+    if not _pool_enabled:
+        return fn(*args)
+
+    if not _admission.acquire(timeout=settings.PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS):
+        logger.warning("Password hashing pool saturated; rejecting request")
+        raise ServiceUnavailableException("Authentication is temporarily busy, please retry")
+
+    pool = None
+    try:
+        pool = _get_pool()
+        future = pool.submit(fn, *args)
+        try:
+            return future.result(timeout=settings.PASSWORD_HASH_TIMEOUT_SECONDS)
+        except FutureTimeoutError:
+            future.cancel()
+            logger.warning("Password hashing timed out after %ss", settings.PASSWORD_HASH_TIMEOUT_SECONDS)
+            raise ServiceUnavailableException("Authentication is temporarily busy, please retry")
+    except BrokenProcessPool:
+        # A worker died; drop the pool so the next call starts a fresh one
+        logger.error("Password hashing pool broken; restarting")
+        _discard_pool(pool)
+        raise ServiceUnavailableException("Authentication is temporarily unavailable, please retry")
+    finally:
+        _admission.release()
+
+
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
 
 def hash_password(password: str) -> str:
     """
@@ -18,8 +125,11 @@ def hash_password(password: str) -> str:
 
     Returns:
         Hashed password string with salt
+
+    Raises:
+        ServiceUnavailableException: If the hashing pool stays saturated
     """
-    return pwd_context.hash(password)
+    return _run_bounded(_hash, password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -32,8 +142,11 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
     Returns:
         True if password matches, False otherwise
+
+    Raises:
+        ServiceUnavailableException: If the hashing pool stays saturated
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return _run_bounded(_verify, plain_password, hashed_password)
 
 
 def validate_password_strength(password: str) -> None:
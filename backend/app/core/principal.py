@@ -0,0 +1,92 @@
+"""
+Request-scoped principal resolution.
+
+The bearer and cookie auth dependencies share a single implementation:
+the access token is decoded and validated, the user projection is loaded
+(through the user cache), and the outcome - principal or auth error - is
+memoized on `request.state` so any further dependency in the same request
+reuses it instead of re-running the work.
+
+The time spent resolving the principal is reported as `auth` in the
+Server-Timing header by app.core.request_metrics.RequestMetricsMiddleware.
+"""
+
+import time
+from dataclasses import dataclass
+
+from fastapi import HTTPException, Request, status
+from sqlalchemy.orm import Session
+
+from app.core.security import decode_token
+from app.core.user_cache import CurrentUser, user_cache
+
+
+@dataclass
+class AuthResult:
+    """Outcome of resolving a token for the current request."""
+    token: str | None
+    principal: CurrentUser | None
+    error: str | None
+    duration_ms: float
+
+
+def _authenticate(db: Session, token: str | None) -> tuple[CurrentUser | None, str | None]:
+    """Validate an access token and load its user; returns (principal, error detail)."""
+    if not token:
+        return None, "Not authenticated"
+
+    payload = decode_token(token)
+    if payload is None:
+        return None, "Could not validate credentials"
+
+    if payload.get("type") != "access":
+        return None, "Invalid token type"
+
+    try:
+        user_id = int(payload["sub"])
+    except (KeyError, ValueError, TypeError):
+        return None, "Could not validate credentials"
+
+    # Cached projection; avoids a SELECT on most authenticated requests
+    user = user_cache.get_user(db, user_id)
+    if user is None:
+        return None, "User not found"
+
+    return user, None
+
+
+def resolve_principal(request: Request, db: Session, token: str | None, bearer: bool = False) -> CurrentUser:
+    """
+    Resolve the authenticated user once per request.
+
+    Args:
+        request: Current request; the result is stored on request.state.auth
+        db: Database session used on a user cache miss
+        token: Access token from the cookie or Authorization header
+        bearer: Add a WWW-Authenticate challenge to 401 responses
+
+    Raises:
+        HTTPException: 401 if the token is missing, invalid or its user is gone
+    """
+    result: AuthResult | None = getattr(request.state, "auth", None)
+    if result is None or result.token != token:
+        start = time.perf_counter()
+        principal, error = _authenticate(db, token)
+        result = AuthResult(
+            token=token,
+            principal=principal,
+            error=error,
+            duration_ms=(time.perf_counter() - start) * 1000
+        )
+        request.state.auth = result
+        request.state.principal = principal
+
+    if result.error is not None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=result.error,
+            headers={"WWW-Authenticate": "Bearer"} if bearer else None,
+        )
+
+    return result.principal
+
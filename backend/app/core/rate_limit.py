@@ -0,0 +1,289 @@
+"""
+Sliding-window rate limiting for abuse-prone auth endpoints.
+
+Limits are checked per dimension (client IP, email) before any database or
+bcrypt work, so rejected attempts cost microseconds. Each backend keeps a
+sliding log of attempt timestamps per key:
+- MemoryRateLimitBackend: per-process, bounded number of tracked keys.
+- RedisRateLimitBackend: shared across workers (optional `redis` package).
+
+Dimensions listed in a limiter's failure_dimensions (login's email) only
+count failed attempts and are cleared on success, so a user's own logins
+never use up their budget. Failed attempts by anyone count, though, so
+repeated guessing at an address can still lock its owner out for the window.
+
+The client IP is the direct peer, unless that peer is listed in
+TRUSTED_PROXIES; then X-Forwarded-For is walked from the right, skipping
+trusted proxies, and the first untrusted address is used.
+"""
+
+import ipaddress
+import math
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+
+from starlette.requests import Request
+
+from app.config import settings
+from app.core.exceptions import TooManyRequestsException
+
+_trusted_proxies = [ipaddress.ip_network(proxy, strict=False) for proxy in settings.TRUSTED_PROXIES]
+
+
+def _is_trusted_proxy(address: str) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in _trusted_proxies)
+
+
+def client_ip(request: Request) -> str | None:
+    """Address of the client, resolved through X-Forwarded-For set by trusted proxies only."""
+    peer = request.client.host if request.client else None
+    if peer is None or not _is_trusted_proxy(peer):
+        return peer
+
+    forwarded = [hop.strip() for hop in request.headers.get("x-forwarded-for", "").split(",") if hop.strip()]
+    for hop in reversed(forwarded):
+        if not _is_trusted_proxy(hop):
+            return hop
+    # Every hop is a trusted proxy: the leftmost one is as close to the client as we can tell
+    return forwarded[0] if forwarded else peer
+
+
+class RateLimitBackend:
+    """Interface for sliding-window attempt logs."""
+
+    def hit(self, key: str, limit: int, window_seconds: float) -> tuple[bool, float]:
+        """
+        Record an attempt for key if it is within the limit.
+
+        Returns:
+            (allowed, retry_after_seconds); rejected attempts are not recorded
+        """
+        raise NotImplementedError
+
+    def peek(self, key: str, limit: int, window_seconds: float) -> tuple[bool, float]:
+        """Like hit(), without recording an attempt."""
+        raise NotImplementedError
+
+    def add(self, key: str, window_seconds: float) -> None:
+        """Record an attempt unconditionally."""
+        raise NotImplementedError
+
+    def clear(self, key: str) -> None:
+        """Forget all attempts for key."""
+        raise NotImplementedError
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """Per-process sliding log, evicting the least recently used keys past max_keys."""
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._logs: OrderedDict[str, deque] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _log(self, key: str, now: float, window_seconds: float) -> deque:
+        """Key's log with expired attempts dropped; caller holds the lock."""
+        log = self._logs.get(key)
+        if log is None:
+            log = deque()
+            self._logs[key] = log
+            while len(self._logs) > self.max_keys:
+                self._logs.popitem(last=False)
+        self._logs.move_to_end(key)
+
+        cutoff = now - window_seconds
+        while log and log[0] <= cutoff:
+            log.popleft()
+        return log
+
+    def hit(self, key: str, limit: int, window_seconds: float, record: bool = True) -> tuple[bool, float]:
+        now = time.monotonic()
+        with self._lock:
+            log = self._log(key, now, window_seconds)
+            if len(log) >= limit:
+                return False, log[0] + window_seconds - now
+            if record:
+                log.append(now)
+            return True, 0.0
+
+    def peek(self, key: str, limit: int, window_seconds: float) -> tuple[bool, float]:
+        return self.hit(key, limit, window_seconds, record=False)
+
+    def add(self, key: str, window_seconds: float) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._log(key, now, window_seconds).append(now)
+
+    def clear(self, key: str) -> None:
+        with self._lock:
+            self._logs.pop(key, None)
+
+
+# Trim, check and record in one atomic step. Scores are returned as strings:
+# Lua numbers are truncated to integers on the way back to the client.
+_REDIS_HIT_SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, now - window)
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[3]) then
+    local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+    return {0, oldest[2] or ARGV[1]}
+end
+redis.call('ZADD', KEYS[1], now, ARGV[4])
+redis.call('PEXPIRE', KEYS[1], math.ceil(window * 1000))
+return {1, '0'}
+"""
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Shared sliding log stored as a Redis sorted set per key."""
+
+    def __init__(self, url: str, prefix: str = "ratelimit:"):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("The redis rate limit backend requires the 'redis' package") from e
+
+        self._client = redis.Redis.from_url(url)
+        self._prefix = prefix
+        self._hit_script = self._client.register_script(_REDIS_HIT_SCRIPT)
+
+    def hit(self, key: str, limit: int, window_seconds: float) -> tuple[bool, float]:
+        now = time.time()
+        allowed, oldest_ts = self._hit_script(
+            keys=[self._prefix + key],
+            args=[now, window_seconds, limit, uuid.uuid4().hex]
+        )
+        if not allowed:
+            return False, float(oldest_ts) + window_seconds - now
+        return True, 0.0
+
+    def peek(self, key: str, limit: int, window_seconds: float) -> tuple[bool, float]:
+        redis_key = self._prefix + key
+        now = time.time()
+
+        pipe = self._client.pipeline()
+        pipe.zremrangebyscore(redis_key, 0, now - window_seconds)
+        pipe.zrange(redis_key, 0, 0, withscores=True)
+        pipe.zcard(redis_key)
+        _, oldest, count = pipe.execute()
+
+        if count >= limit:
+            oldest_ts = oldest[0][1] if oldest else now
+            return False, oldest_ts + window_seconds - now
+        return True, 0.0
+
+    def add(self, key: str, window_seconds: float) -> None:
+        redis_key = self._prefix + key
+        pipe = self._client.pipeline()  # MULTI/EXEC
+        pipe.zadd(redis_key, {uuid.uuid4().hex: time.time()})
+        pipe.pexpire(redis_key, int(window_seconds * 1000))
+        pipe.execute()
+
+    def clear(self, key: str) -> None:
+        self._client.delete(self._prefix + key)
+
+
+class SlidingWindowLimiter:
+    """
+    Named limiter with one limit per key dimension.
+
+    Usage:
+        login_limiter.check(ip=client_ip(request), email=user_data.email)
+        ...
+        login_limiter.record_failure(email=user_data.email)  # wrong password
+        login_limiter.reset(email=user_data.email)  # success
+    """
+
+    def __init__(
+        self,
+        name: str,
+        backend: RateLimitBackend,
+        window_seconds: float,
+        limits: dict[str, int],
+        failure_dimensions: frozenset[str] = frozenset()
+    ):
+        self.name = name
+        self.backend = backend
+        self.window_seconds = window_seconds
+        self.limits = limits
+        self.failure_dimensions = failure_dimensions
+
+    def _keys(self, keys: dict[str, str | None]):
+        for dimension, value in keys.items():
+            limit = self.limits.get(dimension)
+            if value and limit:
+                yield dimension, f"{self.name}:{dimension}:{value.lower()}", limit
+
+    def check(self, **keys: str | None) -> None:
+        """
+        Check every provided dimension, then record the attempt against the
+        dimensions that count all attempts (failure dimensions are only
+        checked; see record_failure). A rejected request is not recorded.
+
+        Raises:
+            TooManyRequestsException: If any dimension is over its limit
+        """
+        dimensions = list(self._keys(keys))
+        for _, key, limit in dimensions:
+            allowed, retry_after = self.backend.peek(key, limit, self.window_seconds)
+            if not allowed:
+                raise TooManyRequestsException(retry_after=max(1, math.ceil(retry_after)))
+
+        for dimension, key, limit in dimensions:
+            if dimension in self.failure_dimensions:
+                continue
+            # hit() re-checks atomically, in case a concurrent request took the last slot
+            allowed, retry_after = self.backend.hit(key, limit, self.window_seconds)
+            if not allowed:
+                raise TooManyRequestsException(retry_after=max(1, math.ceil(retry_after)))
+
+    def record_failure(self, **keys: str | None) -> None:
+        """Count a failed attempt against the failure dimensions."""
+        for dimension, key, _ in self._keys(keys):
+            if dimension in self.failure_dimensions:
+                self.backend.add(key, self.window_seconds)
+
+    def reset(self, **keys: str | None) -> None:
+        """Forget the failures recorded for the failure dimensions (after a success)."""
+        for dimension, key, _ in self._keys(keys):
+            if dimension in self.failure_dimensions:
+                self.backend.clear(key)
+
+
+def _create_backend() -> RateLimitBackend:
+    if settings.RATE_LIMIT_BACKEND == "redis":
+        return RedisRateLimitBackend(settings.REDIS_URL)
+    return MemoryRateLimitBackend()
+
+
+_backend = _create_backend()
+
+login_limiter = SlidingWindowLimiter(
+    "login",
+    _backend,
+    window_seconds=settings.LOGIN_RATE_LIMIT_WINDOW_SECONDS,
+    limits={
+        "ip": settings.LOGIN_RATE_LIMIT_PER_IP,
+        "email": settings.LOGIN_RATE_LIMIT_PER_EMAIL,
+    },
+    # Only failed logins count per email, so the owner's successful logins never use up its budget.
+    # Failures from anyone still do: guessing at an address can lock its owner out for the window.
+    failure_dimensions=frozenset({"email"})
+)
+
+password_reset_limiter = SlidingWindowLimiter(
+    "password_reset",
+    _backend,
+    window_seconds=settings.PASSWORD_RESET_RATE_LIMIT_WINDOW_SECONDS,
+    limits={
+        "ip": settings.PASSWORD_RESET_RATE_LIMIT_PER_IP,
+        "email": settings.PASSWORD_RESET_RATE_LIMIT_PER_EMAIL,
+    }
+)
@@ -0,0 +1,54 @@
+"""
+Read-your-writes routing between the primary and a read replica.
+
+Read-only routes use get_read_db, which serves them from DATABASE_READ_URL.
+A replica may lag behind the primary, so a client that just wrote would not
+see its own change. ReadYourWritesMiddleware sets a short-lived
+`primary_pin` cookie on every successful write request (any method other
+than GET/HEAD/OPTIONS); while the cookie is present, the client's reads are
+served from the primary.
+
+The cookie is stateless, so pinning works across workers without shared
+storage. Clients that don't keep cookies are never pinned.
+"""
+
+from fastapi import Request, Response
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.cookies import COOKIE_CONFIG
+
+PRIMARY_PIN_COOKIE = "primary_pin"
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def should_read_primary(request: Request) -> bool:
+    """True if the client wrote recently and must read from the primary."""
+    return PRIMARY_PIN_COOKIE in request.cookies
+
+
+def _pin_cookie_header() -> str:
+    response = Response()
+    response.set_cookie(key=PRIMARY_PIN_COOKIE, value="1", **COOKIE_CONFIG[PRIMARY_PIN_COOKIE])
+    return response.headers["set-cookie"]
+
+
+class ReadYourWritesMiddleware:
+    """Pin clients to the primary for READ_YOUR_WRITES_SECONDS after a write."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._set_cookie = _pin_cookie_header()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_pin(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                MutableHeaders(scope=message).append("set-cookie", self._set_cookie)
+            await send(message)
+
+        await self.app(scope, receive, send_with_pin)
@@ -0,0 +1,78 @@
+"""
+RRULE-style recurrence helpers for reminders.
+
+Rules are RFC 5545 RRULE bodies (e.g. "FREQ=WEEKLY;BYDAY=MO,WE;INTERVAL=2")
+evaluated against the reminder's naive *local* start time. Occurrences are
+therefore generated in wall-clock time and only converted to UTC afterwards,
+so a 09:00 daily reminder stays at 09:00 local across DST transitions.
+"""
+
+from datetime import datetime
+from functools import lru_cache
+from typing import Iterator
+
+from dateutil.rrule import rrule, rrulestr
+
+# Sub-daily frequencies are rejected to keep per-reminder call volume sane
+ALLOWED_FREQUENCIES = {"DAILY", "WEEKLY", "MONTHLY", "YEARLY"}
+
+# Arbitrary anchor used only to check that a rule parses
+_VALIDATION_DTSTART = datetime(2000, 1, 1)
+
+
+def normalize_recurrence_rule(rule: str) -> str:
+    """
+    Validate an RRULE body and return it in canonical upper-case form.
+
+    Args:
+        rule: RRULE body, optionally prefixed with "RRULE:"
+
+    Raises:
+        ValueError: If the rule does not parse or uses an unsupported FREQ
+    """
+    body = rule.strip().upper()
+    if body.startswith("RRULE:"):
+        body = body[len("RRULE:"):]
+
+    parts = {}
+    for part in body.split(";"):
+        if not part:
+            continue
+        key, sep, value = part.partition("=")
+        if not sep:
+            raise ValueError(f"Invalid recurrence rule part: {part}")
+        parts[key] = value
+
+    if parts.get("FREQ") not in ALLOWED_FREQUENCIES:
+        raise ValueError(
+            f"Recurrence FREQ must be one of: {', '.join(sorted(ALLOWED_FREQUENCIES))}"
+        )
+    if "DTSTART" in parts:
+        raise ValueError("DTSTART is not allowed; the reminder's date_time is the start")
+
+    try:
+        rrulestr(body, dtstart=_VALIDATION_DTSTART)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid recurrence rule: {e}") from e
+
+    return body
+
+
+@lru_cache(maxsize=1024)
+def build_rule(rule: str, dtstart: datetime) -> rrule:
+    """Parse a normalized rule anchored at a naive local dtstart (cached)."""
+    return rrulestr(rule, dtstart=dtstart)
+
+
+def next_occurrence(rule: str, dtstart: datetime, after: datetime) -> datetime | None:
+    """
+    Return the first local occurrence strictly after `after`.
+
+    Returns None when the rule is exhausted (COUNT/UNTIL reached).
+    """
+    return build_rule(rule, dtstart).after(after, inc=False)
+
+
+def iter_occurrences(rule: str, dtstart: datetime, after: datetime, inc: bool = False) -> Iterator[datetime]:
+    """Lazily yield local occurrences after `after` in ascending order."""
+    return build_rule(rule, dtstart).xafter(after, inc=inc)
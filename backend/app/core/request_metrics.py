@@ -0,0 +1,162 @@
+"""
+Per-request timing and SQL statement accounting.
+
+install_query_instrumentation() hooks an engine's cursor-execute and commit
+events. While a RequestMetrics is active in the current context (set by
+RequestMetricsMiddleware for every HTTP request, or by track_queries() for
+ad-hoc measurement), each statement's count and duration is added to it.
+The context propagates into the threadpool that runs sync endpoints and
+dependencies, so their queries are attributed to the right request.
+Statements run by the write queue's writer thread belong to no request and
+are not counted.
+
+RequestMetricsMiddleware reports, per request:
+- a `Server-Timing` header with total app time, DB time (with the statement
+  count as its description) and principal resolution time when auth ran
+- one log line with method, path, status, wall time, DB time, statement
+  and commit counts
+- for requests slower than SLOW_REQUEST_MS, a warning that lists the
+  statements (up to SLOW_REQUEST_MAX_STATEMENTS) with their durations
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_SUMMARY_FORMAT = "method=%s path=%s status=%s duration_ms=%.1f db_ms=%.1f queries=%d commits=%d"
+
+
+@dataclass
+class RequestMetrics:
+    """SQL activity observed while the metrics are active."""
+    statement_count: int = 0
+    commit_count: int = 0
+    db_seconds: float = 0.0
+    max_statements: int = 0
+    statements: list[tuple[str, float]] = field(default_factory=list)
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.statement_count += 1
+        self.db_seconds += seconds
+        if len(self.statements) < self.max_statements:
+            self.statements.append((statement, seconds))
+
+
+_current: ContextVar[RequestMetrics | None] = ContextVar("request_metrics", default=None)
+
+
+def current_metrics() -> RequestMetrics | None:
+    return _current.get()
+
+
+@contextmanager
+def track_queries(max_statements: int = 0) -> Iterator[RequestMetrics]:
+    """Count statements and commits on instrumented engines within the block."""
+    metrics = RequestMetrics(max_statements=max_statements)
+    token = _current.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _current.reset(token)
+
+
+# The start time lives on the statement's execution context, which is
+# discarded with it, so a statement that raises leaves nothing behind
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None and context is not None:
+        context._query_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    metrics = _current.get()
+    started = getattr(context, "_query_start", None)
+    if metrics is not None and started is not None:
+        metrics.record(statement, time.perf_counter() - started)
+
+
+def _commit(conn):
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.commit_count += 1
+
+
+def install_query_instrumentation(engine: Engine) -> None:
+    """Attribute the engine's statements and commits to the active RequestMetrics."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "commit", _commit)
+
+
+class RequestMetricsMiddleware:
+    """Time each request, count its SQL and report it via Server-Timing and logs."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.slow_seconds = settings.SLOW_REQUEST_MS / 1000
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        state = scope.setdefault("state", {})
+        response: dict = {"status": None, "streaming": False}
+        start = time.perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                response["status"] = message["status"]
+                # Event streams stay open for the connection's lifetime
+                response["streaming"] = headers.get("content-type", "").startswith("text/event-stream")
+                headers.append("Server-Timing", self._server_timing(metrics, state, time.perf_counter() - start))
+            await send(message)
+
+        with track_queries(max_statements=settings.SLOW_REQUEST_MAX_STATEMENTS) as metrics:
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                self._log(scope, response, metrics, time.perf_counter() - start)
+
+    @staticmethod
+    def _server_timing(metrics: RequestMetrics, state: dict, elapsed: float) -> str:
+        entries = [
+            f"app;dur={elapsed * 1000:.2f}",
+            f'db;dur={metrics.db_seconds * 1000:.2f};desc="{metrics.statement_count} queries"',
+        ]
+        auth = state.get("auth")
+        if auth is not None:
+            entries.append(f"auth;dur={auth.duration_ms:.2f}")
+        return ", ".join(entries)
+
+    def _log(self, scope: Scope, response: dict, metrics: RequestMetrics, elapsed: float) -> None:
+        args = (
+            scope["method"], scope["path"], response["status"], elapsed * 1000,
+            metrics.db_seconds * 1000, metrics.statement_count, metrics.commit_count
+        )
+        if elapsed < self.slow_seconds or response["streaming"]:
+            logger.info(_SUMMARY_FORMAT, *args)
+            return
+        if not logger.isEnabledFor(logging.WARNING):
+            return
+
+        statements = "\n".join(
+            f"  {seconds * 1000:8.2f} ms  {' '.join(statement.split())}"
+            for statement, seconds in metrics.statements
+        )
+        omitted = metrics.statement_count - len(metrics.statements)
+        if omitted > 0:
+            statements += f"\n  ... {omitted} more"
+        logger.warning("Slow request " + _SUMMARY_FORMAT + "%s", *args, f"\n{statements}" if statements else "")
@@ -0,0 +1,22 @@
+"""Custom response classes for high-volume endpoints."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response encoded with orjson.
+
+    orjson serializes dicts, lists and naive/aware datetimes natively and is
+    several times faster than the stdlib encoder. Content is expected to be
+    already shaped for the client (plain dicts), so no Pydantic validation
+    or jsonable_encoder pass is performed.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
@@ -1,6 +1,20 @@
 from datetime import datetime, timedelta
+import hashlib
+import logging
+import time
+import uuid
 from jose import JWTError, jwt
 from app.config import settings
+from app.core.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Verified payloads keyed by token digest. Each entry expires no later than
+# the token's own `exp`, so a cached payload is never served past expiry.
+_verified_tokens = TTLCache(
+    maxsize=settings.TOKEN_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+)
 
 
 def create_access_token(data: dict) -> str:
@@ -32,25 +46,60 @@ def create_refresh_token(data: dict) -> str:
     """
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-    to_encode.update({"exp": expire, "type": "refresh"})
+    # jti makes every refresh token unique, even when issued in the same second
+    to_encode.update({"exp": expire, "type": "refresh", "jti": uuid.uuid4().hex})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
 
+def hash_token(token: str) -> str:
+    """
+    Compute the fixed-size digest used to store and look up refresh tokens.
+
+    Args:
+        token: Encoded JWT
+
+    Returns:
+        64-character hex SHA-256 digest
+    """
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def refresh_token_expiry() -> datetime:
+    """Expiry timestamp (naive UTC) matching tokens from create_refresh_token."""
+    return datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+
+
 def decode_token(token: str) -> dict | None:
     """
     Decode and verify JWT token.
 
+    Successfully verified payloads are cached by token digest until the
+    token expires, so repeated requests with the same token skip the HMAC
+    verification and JSON decoding.
+
     Args:
         token: JWT token string to decode
 
     Returns:
         Decoded payload dictionary if valid, None if invalid or expired
     """
+    digest = hashlib.sha256(token.encode()).digest()
+    payload = _verified_tokens.get(digest)
+    if payload is not None:
+        return dict(payload)
+
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        print(f"Token decoded successfully: {payload}")
-        return payload
     except JWTError as e:
-        print(f"JWT decode error: {e}")
+        logger.debug("JWT decode error: %s", e)
         return None
+
+    logger.debug("Token decoded successfully: sub=%s type=%s", payload.get("sub"), payload.get("type"))
+
+    # Only tokens with an expiry are cached, and only for their remaining lifetime
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        _verified_tokens.set(digest, payload, ttl_seconds=exp - time.time())
+
+    return dict(payload)
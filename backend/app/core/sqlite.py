@@ -0,0 +1,94 @@
+"""
+SQLite performance profile.
+
+With the default rollback journal, every writer blocks all readers and
+concurrent scheduler/API commits fail with "database is locked". The
+profile applied to each new connection switches to WAL (readers never block
+the writer), relaxes fsync to synchronous=NORMAL (safe in WAL mode), waits
+on locks via busy_timeout and enlarges the page cache and mmap window.
+
+WAL files only shrink when checkpointed; checkpoint_wal() is run
+periodically by the maintenance jobs.
+"""
+
+import logging
+import sqlite3
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# RETURNING (used to claim reminders) requires SQLite 3.35+
+MIN_SQLITE_VERSION = (3, 35, 0)
+
+
+def profile_pragmas() -> dict[str, str | int]:
+    """PRAGMA name -> value for the configured profile."""
+    return {
+        "journal_mode": "WAL" if settings.SQLITE_WAL else "DELETE",
+        "synchronous": settings.SQLITE_SYNCHRONOUS,
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+        "mmap_size": settings.SQLITE_MMAP_SIZE_BYTES,
+        # Negative cache_size is in KiB rather than pages
+        "cache_size": -settings.SQLITE_CACHE_SIZE_KB,
+        "temp_store": settings.SQLITE_TEMP_STORE,
+    }
+
+
+def install_sqlite_profile(engine: Engine, pragmas: dict[str, str | int] | None = None) -> None:
+    """Apply the PRAGMAs to every connection the engine opens."""
+    pragmas = profile_pragmas() if pragmas is None else pragmas
+
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def check_sqlite_profile(engine: Engine) -> dict[str, str | int]:
+    """
+    Verify the profile took effect and log the effective settings.
+
+    Raises:
+        RuntimeError: If the SQLite library is too old for this application
+    """
+    if sqlite3.sqlite_version_info < MIN_SQLITE_VERSION:
+        raise RuntimeError(
+            f"SQLite {sqlite3.sqlite_version} is too old; "
+            f"{'.'.join(map(str, MIN_SQLITE_VERSION))}+ is required"
+        )
+
+    with engine.connect() as conn:
+        effective = {
+            name: conn.execute(text(f"PRAGMA {name}")).scalar()
+            for name in ("journal_mode", "synchronous", "busy_timeout", "cache_size", "mmap_size")
+        }
+
+    if settings.SQLITE_WAL and str(effective["journal_mode"]).lower() != "wal":
+        # e.g. in-memory databases or filesystems without shared memory support
+        logger.warning(
+            "SQLite WAL requested but journal_mode is %s; concurrent writes will contend on the rollback journal",
+            effective["journal_mode"]
+        )
+
+    logger.info("SQLite %s profile: %s", sqlite3.sqlite_version, effective)
+    return effective
+
+
+def checkpoint_wal(engine: Engine, mode: str = "PASSIVE") -> tuple[int, int, int]:
+    """
+    Checkpoint the WAL into the main database file.
+
+    PASSIVE never blocks readers or the writer; frames still in use are
+    checkpointed on a later run. Returns (busy, wal_frames, checkpointed_frames).
+    """
+    with engine.connect() as conn:
+        busy, log_frames, checkpointed = conn.execute(text(f"PRAGMA wal_checkpoint({mode})")).one()
+    return busy, log_frames, checkpointed
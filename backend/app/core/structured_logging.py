@@ -0,0 +1,170 @@
+"""
+Non-blocking, structured logging.
+
+setup_logging() routes the root logger through a bounded in-memory queue:
+callers (request handlers, the dispatch loop) only append the LogRecord,
+and a QueueListener thread formats and writes it. A slow or blocked stdout
+therefore never stalls a caller; if the queue fills up, records are dropped
+and counted instead, and the count is logged once space frees up.
+
+Records are formatted lazily on the listener thread. Log with %-style
+arguments (logger.info("Reminder %s done", reminder_id)) so that records
+dropped by level or sampling are never formatted at all. Pass immutable
+values as arguments, since formatting happens later on another thread.
+
+LOG_FORMAT=json writes one JSON object per line (timestamp, level, logger,
+message, any `extra=` fields and the exception text); LOG_FORMAT=text keeps
+the classic human-readable line.
+
+LOG_SAMPLING keeps only a fraction of the DEBUG/INFO records of high-volume
+loggers, e.g. "app.jobs.daily_calls=0.1,app.core.request_metrics=0.05".
+WARNING and above are never sampled.
+"""
+
+import atexit
+import logging
+import queue
+import random
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+import orjson
+
+from app.config import settings
+
+# Attributes every LogRecord has; anything else came from `extra=`
+_RECORD_ATTRS = frozenset(logging.makeLogRecord({}).__dict__) | {"message", "asctime", "taskName"}
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry, default=str).decode()
+
+
+def parse_sampling(spec: str) -> dict[str, float]:
+    """Parse "logger=rate,logger=rate" into {logger: rate}."""
+    rates = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, rate = item.partition("=")
+        rates[name.strip()] = min(max(float(rate), 0.0), 1.0)
+    return rates
+
+
+class SamplingFilter(logging.Filter):
+    """Keep a fraction of below-WARNING records from the configured loggers (and their children)."""
+
+    def __init__(self, rates: dict[str, float]):
+        super().__init__()
+        self.rates = rates
+        self._resolved: dict[str, float | None] = {}
+
+    def _rate(self, name: str) -> float | None:
+        if name not in self._resolved:
+            # Most specific configured ancestor wins
+            candidate = name
+            while candidate and candidate not in self.rates:
+                candidate = candidate.rpartition(".")[0]
+            self._resolved[name] = self.rates.get(candidate)
+        return self._resolved[name]
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self._rate(record.name)
+        return rate is None or random.random() < rate
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """Enqueue records as-is; never block, drop (and count) when the queue is full."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The stdlib formats here, on the caller's thread; defer it to the listener
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return
+
+        if self.dropped:
+            with self._lock:
+                dropped, self.dropped = self.dropped, 0
+            notice = logging.makeLogRecord({
+                "name": __name__, "levelno": logging.WARNING, "levelname": "WARNING",
+                "msg": "Dropped %d log records (log queue full)", "args": (dropped,),
+            })
+            try:
+                self.queue.put_nowait(notice)
+            except queue.Full:
+                with self._lock:
+                    self.dropped += dropped
+
+
+_listener: QueueListener | None = None
+_queue_handler: NonBlockingQueueHandler | None = None
+
+
+def setup_logging() -> None:
+    """Install the queue handler on the root logger and start the writer thread."""
+    global _listener, _queue_handler
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(JsonFormatter() if settings.LOG_FORMAT == "json" else logging.Formatter(TEXT_FORMAT))
+
+    log_queue: queue.Queue = queue.Queue(maxsize=settings.LOG_QUEUE_SIZE)
+    _queue_handler = NonBlockingQueueHandler(log_queue)
+    rates = parse_sampling(settings.LOG_SAMPLING)
+    if rates:
+        _queue_handler.addFilter(SamplingFilter(rates))
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(_queue_handler)
+    root.setLevel(settings.LOG_LEVEL.upper())
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the writer thread; later records are written directly."""
+    global _listener, _queue_handler
+    if _listener is None:
+        return
+
+    root = logging.getLogger()
+    root.removeHandler(_queue_handler)
+    _listener.stop()
+    for handler in _listener.handlers:
+        root.addHandler(handler)
+    _listener = None
+    _queue_handler = None
@@ -0,0 +1,72 @@
+"""
+Timezone registry shared by reminder validation and UTC conversion.
+
+The set of IANA identifiers is read from tzdata once at import (walking the
+tzdata tree costs milliseconds per call), and resolved tzinfo objects, both
+ZoneInfo zones and legacy "UTC±H[:MM]" fixed offsets, are cached so
+validating and converting a reminder never touches the filesystem or
+re-parses an offset string.
+"""
+
+import re
+from datetime import timedelta, timezone as dt_timezone, tzinfo
+from functools import lru_cache
+from zoneinfo import ZoneInfo, available_timezones
+
+# All IANA timezone identifiers known to this interpreter's tzdata
+IANA_TIMEZONES: frozenset[str] = frozenset(available_timezones())
+
+_LEGACY_OFFSET = re.compile(r'^([+-])?(\d{1,2})(?::(\d{2}))?$')
+
+
+def _parse_legacy_offset(tz_identifier: str) -> tzinfo:
+    """Parse the legacy UTC±X / UTC±X:XX format into a fixed-offset tzinfo."""
+    offset_str = tz_identifier[3:]
+
+    if not offset_str or offset_str == '+0' or offset_str == '-0':
+        # UTC with no offset
+        return dt_timezone.utc
+
+    match = _LEGACY_OFFSET.match(offset_str)
+    if not match:
+        raise ValueError(f"Invalid UTC offset format: {tz_identifier}")
+
+    sign = -1 if match.group(1) == '-' else 1
+    hours = int(match.group(2))
+    minutes = int(match.group(3) or 0)
+    return dt_timezone(sign * timedelta(hours=hours, minutes=minutes))
+
+
+# Bounded: IANA keys are a fixed set and legacy offsets match a narrow pattern;
+# invalid identifiers raise and are never cached
+@lru_cache(maxsize=2048)
+def resolve_timezone(tz_identifier: str) -> tzinfo:
+    """
+    Resolve a reminder timezone string to a (cached) tzinfo.
+
+    Args:
+        tz_identifier: IANA timezone identifier (e.g., "America/New_York")
+                      or legacy UTC offset format (e.g., "UTC-5", "UTC+5:30")
+
+    Raises:
+        ValueError: If the identifier is not a valid timezone or offset
+    """
+    # Handle legacy UTC±X format for backward compatibility
+    if tz_identifier.startswith('UTC'):
+        return _parse_legacy_offset(tz_identifier)
+
+    # Handle IANA timezone identifier
+    try:
+        return ZoneInfo(tz_identifier)
+    except Exception as e:
+        raise ValueError(f"Invalid timezone identifier: {tz_identifier}") from e
+
+
+def is_legacy_offset(tz_identifier: str) -> bool:
+    """True for the legacy UTC±X format accepted for backward compatibility."""
+    return tz_identifier.startswith('UTC')
+
+
+def is_iana_timezone(tz_identifier: str) -> bool:
+    """Membership test against the precomputed IANA identifier set."""
+    return tz_identifier in IANA_TIMEZONES
@@ -0,0 +1,125 @@
+"""
+TTL cache of the authenticated user projection.
+
+Authenticated routes only need a user's id, email and timestamps, yet every
+request used to SELECT the full User row. The projection is cached per user
+id for USER_CACHE_TTL_SECONDS and invalidated whenever a User row is updated
+or deleted through the ORM and the transaction commits. Core/bulk
+update()/delete() statements bypass those hooks, so code that changes users
+that way must call user_cache.invalidate(); the credential paths (password
+change/reset) call it explicitly as well.
+
+The memory backend is per process: with several workers, an invalidation
+only reaches the worker that made the change and the others serve the old
+projection for up to USER_CACHE_TTL_SECONDS. Multi-worker deployments must
+use the redis backend.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, object_session
+
+from app.config import settings
+from app.core.cache import CacheBackend, MemoryCacheBackend, RedisCacheBackend
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+_PENDING_INVALIDATIONS = "user_cache_invalidations"
+
+
+@dataclass(frozen=True)
+class CurrentUser:
+    """Read-only projection of the authenticated user."""
+    id: int
+    email: str
+    created_at: datetime
+    updated_at: datetime
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "email": self.email,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CurrentUser":
+        return cls(
+            id=data["id"],
+            email=data["email"],
+            created_at=datetime.fromisoformat(data["created_at"]),
+            updated_at=datetime.fromisoformat(data["updated_at"]),
+        )
+
+
+class UserCache:
+    """Read-through cache of CurrentUser projections keyed by user id."""
+
+    def __init__(self, backend: CacheBackend, ttl_seconds: float):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+
+    def get_user(self, db: Session, user_id: int) -> CurrentUser | None:
+        """Return the cached projection, loading it from the database on a miss."""
+        key = str(user_id)
+        cached = self.backend.get(key)
+        if cached is not None:
+            return CurrentUser.from_dict(cached)
+
+        row = db.execute(
+            select(User.id, User.email, User.created_at, User.updated_at)
+            .where(User.id == user_id)
+        ).first()
+        if row is None:
+            return None
+
+        user = CurrentUser(id=row.id, email=row.email, created_at=row.created_at, updated_at=row.updated_at)
+        self.backend.set(key, user.to_dict(), self.ttl_seconds)
+        return user
+
+    def invalidate(self, user_id: int) -> None:
+        self.backend.delete(str(user_id))
+
+
+def _create_backend() -> CacheBackend:
+    if settings.USER_CACHE_BACKEND == "redis":
+        return RedisCacheBackend(settings.REDIS_URL, prefix="user:")
+    return MemoryCacheBackend(
+        maxsize=settings.USER_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.USER_CACHE_TTL_SECONDS
+    )
+
+
+def check_user_cache_backend() -> None:
+    """Warn at startup when the settings point to several workers but the cache is per process."""
+    multi_process = settings.EVENTS_BACKEND == "outbox" or settings.SCHEDULER_LEADER_ELECTION
+    if multi_process and settings.USER_CACHE_BACKEND == "memory":
+        logger.warning(
+            "USER_CACHE_BACKEND=memory with multiple workers: other workers may serve a changed "
+            "or deleted user for up to %ss; use USER_CACHE_BACKEND=redis", settings.USER_CACHE_TTL_SECONDS
+        )
+
+
+# Process-wide user cache
+user_cache = UserCache(_create_backend(), settings.USER_CACHE_TTL_SECONDS)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _queue_user_invalidation(mapper, connection, target: User) -> None:
+    """Remember changed users; they are evicted once the transaction commits."""
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_INVALIDATIONS, set()).add(target.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_user_invalidations(session: Session) -> None:
+    for user_id in session.info.pop(_PENDING_INVALIDATIONS, ()):
+        user_cache.invalidate(user_id)
+
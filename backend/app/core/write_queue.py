@@ -0,0 +1,190 @@
+"""
+Single-writer queue for SQLite deployments.
+
+SQLite allows one writer at a time, so many threads each committing a small
+transaction mostly wait on the database lock (and fsync once per commit).
+When SQLITE_WRITE_QUEUE is enabled, write operations are handed to one
+dedicated writer thread instead. The writer drains whatever is queued,
+runs the operations in a single transaction and commits once (group
+commit), then hands each caller its result.
+
+A write operation is a callable taking a Session, e.g.
+`lambda s: s.merge(reminder)`. Operations must only touch the database:
+if one raises, the batch is rolled back and every operation is replayed
+in its own transaction so only the failing caller sees the error.
+
+Callers use run_write(db, op), which falls back to running op in their own
+session and committing when the queue is disabled.
+
+A caller that waits longer than SQLITE_WRITE_QUEUE_TIMEOUT_SECONDS has its
+operation cancelled if the writer has not picked it up yet, and gets a
+TimeoutError knowing nothing was written. An operation the writer already
+started is waited for instead, so a caller never sees a timeout for a write
+that went on to commit.
+"""
+
+import logging
+import queue
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from typing import Any, Callable, TypeVar
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.config import settings
+from app.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class _WriteRequest:
+    op: Callable[[Session], Any]
+    future: Future = field(default_factory=Future)
+
+
+class WriteCoordinator:
+    """Dedicated writer thread that group-commits queued write operations."""
+
+    def __init__(
+        self,
+        session_factory: sessionmaker,
+        max_batch: int = settings.SQLITE_WRITE_QUEUE_MAX_BATCH,
+        timeout_seconds: float = settings.SQLITE_WRITE_QUEUE_TIMEOUT_SECONDS
+    ):
+        self.session_factory = session_factory
+        self.max_batch = max_batch
+        self.timeout_seconds = timeout_seconds
+        self._queue: queue.Queue[_WriteRequest | None] = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="sqlite-writer", daemon=True)
+                self._thread.start()
+                logger.info("SQLite write queue started (max batch %d)", self.max_batch)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Commit everything already queued, then stop the writer thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join(timeout)
+
+    def submit(self, op: Callable[[Session], T]) -> "Future[T]":
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("Write operations cannot be submitted from the writer thread")
+        self.start()
+        request = _WriteRequest(op)
+        self._queue.put(request)
+        return request.future
+
+    def run(self, op: Callable[[Session], T]) -> T:
+        """
+        Submit op and wait for it to be committed; returns op's result.
+
+        Raises:
+            TimeoutError: If op was still queued after timeout_seconds; it is
+                cancelled and will not run
+        """
+        future = self.submit(op)
+        try:
+            return future.result(timeout=self.timeout_seconds)
+        except FutureTimeoutError:
+            if future.cancel():
+                # Still queued: the writer skips cancelled requests
+                logger.warning("Write operation cancelled after waiting %.1fs in the queue", self.timeout_seconds)
+                raise
+            # Already in the writer's current batch; its outcome is imminent
+            return future.result()
+
+    def _run(self) -> None:
+        while True:
+            request = self._queue.get()
+            if request is None:
+                return
+
+            # Group everything that queued up while the previous batch committed
+            batch = [request]
+            stopping = False
+            while len(batch) < self.max_batch:
+                try:
+                    request = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if request is None:
+                    stopping = True
+                    break
+                batch.append(request)
+
+            self._commit_batch([r for r in batch if r.future.set_running_or_notify_cancel()])
+            if stopping:
+                return
+
+    def _commit_batch(self, batch: list[_WriteRequest]) -> None:
+        if not batch:
+            return
+        try:
+            results = self._execute(batch)
+        except Exception as e:
+            if len(batch) == 1:
+                batch[0].future.set_exception(e)
+                return
+            # Isolate the failing operation(s) by replaying each one alone
+            logger.debug("Write batch of %d failed (%s); replaying individually", len(batch), e)
+            for request in batch:
+                self._commit_batch([request])
+            return
+
+        for request, result in zip(batch, results):
+            request.future.set_result(result)
+
+    def _execute(self, batch: list[_WriteRequest]) -> list:
+        with self.session_factory() as session:
+            try:
+                results = []
+                for request in batch:
+                    results.append(request.op(session))
+                    session.flush()
+                session.commit()
+                return results
+            except Exception:
+                session.rollback()
+                raise
+
+
+def _create_coordinator() -> WriteCoordinator | None:
+    if settings.SQLITE_WRITE_QUEUE and settings.is_sqlite:
+        return WriteCoordinator(SessionLocal)
+    return None
+
+
+# Process-wide writer; None when writes commit directly in the caller's session
+write_coordinator = _create_coordinator()
+
+
+def run_write(db: Session, op: Callable[[Session], T]) -> T:
+    """
+    Run a write operation and commit it.
+
+    With the write queue enabled the operation runs on the writer thread in
+    its own session; db must not hold uncommitted writes. Otherwise op runs
+    in db, which is committed.
+    """
+    if write_coordinator is not None:
+        return write_coordinator.run(op)
+
+    result = op(db)
+    db.commit()
+    return result
+
+
+def shutdown_write_queue() -> None:
+    if write_coordinator is not None:
+        write_coordinator.stop()
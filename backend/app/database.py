@@ -1,30 +1,92 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, DeclarativeBase, Session
 from app.config import settings
+from app.core.db_pool import InstrumentedQueuePool, register_engine
+from app.core.request_metrics import install_query_instrumentation
+from app.core.sqlite import install_sqlite_profile
 
 
-# Build engine arguments based on database type
-engine_args = {
-    "echo": settings.DEBUG,  # Log SQL queries in debug mode
-    "future": True  # Use SQLAlchemy 2.0 style
-}
+def _engine_args(url: str, pool_size: int, max_overflow: int) -> dict:
+    """Build engine arguments based on database type and pool settings."""
+    is_sqlite = url.startswith("sqlite")
+    engine_args = {
+        "echo": settings.DEBUG,  # Log SQL queries in debug mode
+        "future": True  # Use SQLAlchemy 2.0 style
+    }
 
-# SQLite requires check_same_thread=False, PostgreSQL doesn't support this argument
-if settings.database_url.startswith("sqlite"):
-    engine_args["connect_args"] = {"check_same_thread": False}
+    # SQLite requires check_same_thread=False, PostgreSQL doesn't support this argument
+    if is_sqlite:
+        engine_args["connect_args"] = {"check_same_thread": False}
 
-# Create SQLAlchemy engine
-engine = create_engine(settings.database_url, **engine_args)
+    # In-memory SQLite keeps a single connection per thread; pool settings don't apply
+    if is_sqlite and ":memory:" in url:
+        return engine_args
 
-# Create SessionLocal class
-SessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=engine,
-    class_=Session,
-    expire_on_commit=False
+    engine_args.update({
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    })
+    return engine_args
+
+
+def _sessionmaker(bind) -> sessionmaker:
+    return sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=bind,
+        class_=Session,
+        expire_on_commit=False
+    )
+
+
+# Engine for API requests
+engine = create_engine(
+    settings.database_url,
+    **_engine_args(settings.database_url, settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW)
+)
+
+# Separate pool for scheduler jobs and background pollers, so they can't
+# starve request handling (and vice versa)
+scheduler_engine = create_engine(
+    settings.database_url,
+    **_engine_args(settings.database_url, settings.SCHEDULER_DB_POOL_SIZE, settings.SCHEDULER_DB_MAX_OVERFLOW)
 )
 
+# Optional read replica for read-only routes; falls back to the primary
+if settings.DATABASE_READ_URL:
+    read_engine = create_engine(
+        settings.DATABASE_READ_URL,
+        **_engine_args(settings.DATABASE_READ_URL, settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW)
+    )
+    if settings.DATABASE_READ_URL.startswith("sqlite"):
+        install_sqlite_profile(read_engine)
+    register_engine("read", read_engine)
+    install_query_instrumentation(read_engine)
+else:
+    read_engine = engine
+
+if settings.is_sqlite:
+    install_sqlite_profile(engine)
+    install_sqlite_profile(scheduler_engine)
+
+register_engine("api", engine)
+register_engine("scheduler", scheduler_engine)
+install_query_instrumentation(engine)
+install_query_instrumentation(scheduler_engine)
+
+# Create SessionLocal class
+SessionLocal = _sessionmaker(engine)
+
+# Sessions for scheduler jobs and background tasks
+SchedulerSessionLocal = _sessionmaker(scheduler_engine)
+
+# Sessions for read-only API routes (the primary when no replica is configured)
+ReadSessionLocal = _sessionmaker(read_engine) if read_engine is not engine else SessionLocal
+
 
 # SQLAlchemy 2.0 declarative base
 class Base(DeclarativeBase):
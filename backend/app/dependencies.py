@@ -1,12 +1,12 @@
 from typing import Generator
-from fastapi import Depends, HTTPException, status, Request
+from fastapi import Depends, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
-from sqlalchemy import select
 
-from app.database import SessionLocal
-from app.models.user import User
-from app.core.security import decode_token
+from app.database import SessionLocal, ReadSessionLocal
+from app.core.read_routing import should_read_primary
+from app.core.principal import resolve_principal
+from app.core.user_cache import CurrentUser
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -28,74 +28,49 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def get_read_db(request: Request) -> Generator[Session, None, None]:
+    """
+    FastAPI dependency that provides a session for read-only routes.
+
+    Uses the read replica when DATABASE_READ_URL is set, except for clients
+    that wrote within READ_YOUR_WRITES_SECONDS, which read from the primary.
+    """
+    db = SessionLocal() if should_read_primary(request) else ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
 # HTTP Bearer token scheme
 security = HTTPBearer()
 
+# The user dependencies below come in pairs: FastAPI caches a dependency per
+# request, so an auth dependency that shares the route's session dependency
+# also shares its session. Read-only routes (get_read_db) use
+# get_current_user / get_current_user_from_cookie; routes that write
+# (get_db) use the *_for_write variants, so neither opens a second
+# connection just to authenticate.
+
 
 def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
+    db: Session = Depends(get_read_db)
+) -> CurrentUser:
     """
     Dependency to get current authenticated user from JWT token.
 
     Usage in routes:
-        current_user: User = Depends(get_current_user)
+        current_user: CurrentUser = Depends(get_current_user)
     """
-    token = credentials.credentials
-
-    # Decode token
-    payload = decode_token(token)
-    if payload is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    # Verify token type
-    if payload.get("type") != "access":
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token type",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    # Get user from database
-    user_id_str = payload.get("sub")
-    if user_id_str is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    try:
-        user_id = int(user_id_str)
-    except (ValueError, TypeError):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    stmt = select(User).where(User.id == user_id)
-    user = db.scalars(stmt).first()
-
-    if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    return user
+    return resolve_principal(request, db, credentials.credentials, bearer=True)
 
 
 def get_current_user_from_cookie(
     request: Request,
-    db: Session = Depends(get_db)
-) -> User:
+    db: Session = Depends(get_read_db)
+) -> CurrentUser:
     """
     Dependency to get current authenticated user from httpOnly cookie.
 
@@ -103,54 +78,29 @@ def get_current_user_from_cookie(
     Reads the access token from the httpOnly cookie instead of the Authorization header.
 
     Usage in routes:
-        current_user: User = Depends(get_current_user_from_cookie)
+        current_user: CurrentUser = Depends(get_current_user_from_cookie)
     """
-    token = request.cookies.get("access_token")
-
-    if not token:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated",
-        )
-
-    # Decode token
-    payload = decode_token(token)
-    if payload is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-        )
-
-    # Verify token type
-    if payload.get("type") != "access":
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token type",
-        )
-
-    # Get user from database
-    user_id_str = payload.get("sub")
-    if user_id_str is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-        )
+    return resolve_principal(request, db, request.cookies.get("access_token"))
 
-    try:
-        user_id = int(user_id_str)
-    except (ValueError, TypeError):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-        )
-
-    stmt = select(User).where(User.id == user_id)
-    user = db.scalars(stmt).first()
-
-    if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-        )
-
-    return user
+
+def get_current_user_for_write(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db)
+) -> CurrentUser:
+    """get_current_user for routes that use get_db."""
+    return resolve_principal(request, db, credentials.credentials, bearer=True)
+
+
+def get_current_user_from_cookie_for_write(
+    request: Request,
+    db: Session = Depends(get_db)
+) -> CurrentUser:
+    """
+    get_current_user_from_cookie for routes that use get_db.
+
+    Usage in routes:
+        current_user: CurrentUser = Depends(get_current_user_from_cookie_for_write),
+        db: Session = Depends(get_db)
+    """
+    return resolve_principal(request, db, request.cookies.get("access_token"))
@@ -1,16 +1,30 @@
 from datetime import datetime, timezone as tz, timedelta
-from sqlalchemy import select, and_, or_, update
+from sqlalchemy import select, and_, or_, update, case
 from sqlalchemy.exc import OperationalError
-from app.database import SessionLocal
+from app.database import SchedulerSessionLocal
 from app.models.reminder import Reminder, ReminderStatus
+from app.models.call_attempt import CallAttempt, CallAttemptStatus
 from app.services.vapi_service import VapiService
 from app.scheduler import scheduler
 from app.config import settings
+from app.core.events import event_bus, build_reminder_event, stage_reminder_event
+from app.core.write_queue import run_write
+from app.core.leader import leader_lease, is_scheduler_leader
 from apscheduler.triggers.interval import IntervalTrigger
 import logging
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+# Shutdown drain state (see drain_dispatch), guarded by _drain_cond
+_drain_cond = threading.Condition()
+_stopping = False
+_drained = False
+_active_batches = 0
+# Reminders claimed after the drain began, before their call started: id -> status before the claim
+_unstarted_claims: dict[int, str] = {}
+
 
 def acquire_reminder_for_processing(db, reminder_id: int) -> Reminder | None:
     """
@@ -30,27 +44,57 @@ def acquire_reminder_for_processing(db, reminder_id: int) -> Reminder | None:
             )
         )
         .values(status=ReminderStatus.PROCESSING.value)
-        .returning(Reminder.id)
+        .returning(Reminder.id, Reminder.user_id)
     )
-
-    result = db.execute(stmt)
-    db.commit()
+    if leader_lease is not None:
+        # Fencing: a deposed leader's claims match no rows
+        stmt = stmt.where(leader_lease.fence())
+
+    def claim(session):
+        # RETURNING rows must be consumed before commit (SQLite refuses to
+        # commit with a pending cursor)
+        row = session.execute(stmt).fetchone()
+        if row is not None:
+            event_bus.stage(session, build_reminder_event(
+                "status_changed", row.id, row.user_id, ReminderStatus.PROCESSING.value
+            ))
+        return row
 
     # Check if we successfully claimed the reminder
-    claimed = result.fetchone()
-    if claimed:
+    if run_write(db, claim):
         # Fetch the full reminder object
         return db.get(Reminder, reminder_id)
     return None
 
 
-def get_due_reminder_ids(db, now_utc: datetime, window_end: datetime, limit: int) -> list[int]:
+def start_call_attempt(db, reminder: Reminder, idempotency_key: str, started_at: datetime) -> None:
+    """
+    Commit the reminder's new attempt count together with an IN_FLIGHT ledger
+    row, before the provider is called, so a call cut short by a crash still
+    leaves a record of its key and start time.
+    """
+    attempt = CallAttempt(
+        reminder_id=reminder.id,
+        attempt_number=reminder.attempt_count,
+        idempotency_key=idempotency_key,
+        status=CallAttemptStatus.IN_FLIGHT.value,
+        started_at=started_at
+    )
+
+    def write(session) -> None:
+        session.merge(reminder)
+        session.add(attempt)
+
+    run_write(db, write)
+
+
+def get_due_reminders(db, now_utc: datetime, window_end: datetime, limit: int) -> list[tuple[int, str]]:
     """
-    Get IDs of reminders that are due for processing.
+    Get (id, status) of reminders that are due for processing.
     Includes both scheduled reminders and those pending retry.
     """
     stmt = (
-        select(Reminder.id)
+        select(Reminder.id, Reminder.status)
         .where(
             or_(
                 # Scheduled reminders that are due
@@ -69,26 +113,96 @@ def get_due_reminder_ids(db, now_utc: datetime, window_end: datetime, limit: int
         .limit(limit)
     )
 
-    return [row[0] for row in db.execute(stmt).fetchall()]
+    return [tuple(row) for row in db.execute(stmt).fetchall()]
+
+
+def release_claims(db, claims: dict[int, str]) -> int:
+    """
+    Hand reminders claimed by this process, whose call never started, back
+    to the status they were claimed from, in one UPDATE.
+    Returns the number of reminders released.
+    """
+    stmt = (
+        update(Reminder)
+        .where(
+            and_(
+                Reminder.id.in_(claims),
+                Reminder.status == ReminderStatus.PROCESSING.value
+            )
+        )
+        .values(status=case(claims, value=Reminder.id))
+        .returning(Reminder.id, Reminder.user_id, Reminder.status)
+    )
+
+    def release(session) -> int:
+        rows = session.execute(stmt).fetchall()
+        for reminder_id, user_id, status in rows:
+            event_bus.stage(session, build_reminder_event("status_changed", reminder_id, user_id, status))
+        return len(rows)
+
+    return run_write(db, release)
+
+
+def _may_start_call(db, reminder_id: int, previous_status: str) -> bool:
+    """
+    Whether the call for a just-claimed reminder may start. Once the drain
+    has begun it may not: the claim is recorded for drain_dispatch to
+    release (or released here if the drain has already finished).
+    """
+    with _drain_cond:
+        if not _stopping:
+            return True
+        if not _drained:
+            _unstarted_claims[reminder_id] = previous_status
+            return False
+    release_claims(db, {reminder_id: previous_status})
+    return False
+
+
+def build_call_attempt(
+    reminder: Reminder,
+    idempotency_key: str,
+    started_at: datetime,
+    started: float,
+    call_id: str | None = None,
+    error: str | None = None,
+    error_class: str | None = None
+) -> CallAttempt:
+    """Ledger row for the attempt that started at started_at (time.perf_counter() value `started`)."""
+    return CallAttempt(
+        reminder_id=reminder.id,
+        attempt_number=reminder.attempt_count,
+        idempotency_key=idempotency_key,
+        status=CallAttemptStatus.FAILED.value if error is not None else CallAttemptStatus.SUCCEEDED.value,
+        provider_call_id=call_id,
+        error_class=error_class,
+        error=error,
+        started_at=started_at,
+        finished_at=datetime.utcnow(),
+        latency_ms=round((time.perf_counter() - started) * 1000)
+    )
 
 
 def process_single_reminder(db, reminder: Reminder, vapi_service: VapiService) -> None:
     """
     Process a single reminder: generate idempotency key, make Vapi call, handle result.
     """
+    # Generate idempotency key for this attempt
+    idempotency_key = reminder.generate_idempotency_key()
+    started_at = datetime.utcnow()
+    started = time.perf_counter()
+
     try:
-        # Generate idempotency key for this attempt
-        idempotency_key = reminder.generate_idempotency_key()
         reminder.attempt_count += 1
-        db.commit()
+        start_call_attempt(db, reminder, idempotency_key, started_at)
 
         logger.info(
-            f"Processing reminder {reminder.id} "
-            f"(attempt {reminder.attempt_count}/{reminder.max_attempts}, "
-            f"idempotency_key={idempotency_key})"
+            "Processing reminder %s (attempt %s/%s, idempotency_key=%s)",
+            reminder.id, reminder.attempt_count, reminder.max_attempts, idempotency_key
         )
 
         # Make Vapi call with idempotency key
+        started = time.perf_counter()
         result = vapi_service.make_reminder_call(
             phone_number=reminder.phone_number,
             reminder_title=reminder.title,
@@ -98,47 +212,110 @@ def process_single_reminder(db, reminder: Reminder, vapi_service: VapiService) -
 
         if result["success"]:
             # Success - mark as completed
+            attempt = build_call_attempt(reminder, idempotency_key, started_at, started, call_id=result.get("call_id"))
             reminder.status = ReminderStatus.COMPLETED.value
-            reminder.vapi_call_id = result.get("call_id")
-            reminder.last_error = None
-            logger.info(f"Call initiated for reminder {reminder.id}, call_id={result.get('call_id')}")
+            logger.info("Call initiated for reminder %s, call_id=%s", reminder.id, result.get("call_id"))
         else:
             # Failed - check if we should retry
-            handle_reminder_failure(reminder, result.get("error", "Unknown error"))
+            error = result.get("error", "Unknown error")
+            attempt = build_call_attempt(
+                reminder, idempotency_key, started_at, started,
+                error=error, error_class=result.get("error_class")
+            )
+            handle_reminder_failure(reminder, error)
 
-        db.commit()
+        finish_occurrence(db, reminder, attempt)
 
     except Exception as e:
-        logger.error(f"Exception processing reminder {reminder.id}: {e}")
+        logger.error("Exception processing reminder %s: %s", reminder.id, e)
         db.rollback()
 
-        # Refresh the reminder and handle failure
-        db.refresh(reminder)
-        handle_reminder_failure(reminder, str(e))
-        db.commit()
+        try:
+            # The failure may have come after the outcome was committed; it
+            # must not be overwritten
+            recorded = db.scalar(select(CallAttempt.status).where(CallAttempt.idempotency_key == idempotency_key))
+            if recorded is not None and recorded != CallAttemptStatus.IN_FLIGHT.value:
+                return
+
+            # Refresh the reminder and handle failure
+            db.refresh(reminder)
+            attempt = build_call_attempt(
+                reminder, idempotency_key, started_at, started,
+                error=str(e), error_class=type(e).__name__
+            )
+            handle_reminder_failure(reminder, str(e))
+            finish_occurrence(db, reminder, attempt)
+        except Exception as fallback_error:
+            # Leave the reminder in PROCESSING for reset_stuck_reminders rather
+            # than failing the rest of the batch
+            logger.error("Failed to record failure of reminder %s: %s", reminder.id, fallback_error)
+            db.rollback()
 
 
 def handle_reminder_failure(reminder: Reminder, error: str) -> None:
     """
     Handle a failed reminder: either schedule retry or mark as permanently failed.
     """
-    reminder.last_error = error
-
     if reminder.attempt_count < reminder.max_attempts:
         # Schedule retry with exponential backoff
         reminder.status = ReminderStatus.PENDING_RETRY.value
         next_retry = reminder.calculate_next_retry(settings.RETRY_BASE_DELAY_SECONDS)
         logger.warning(
-            f"Reminder {reminder.id} failed (attempt {reminder.attempt_count}/{reminder.max_attempts}), "
-            f"scheduling retry at {next_retry}. Error: {error}"
+            "Reminder %s failed (attempt %s/%s), scheduling retry at %s. Error: %s",
+            reminder.id, reminder.attempt_count, reminder.max_attempts, next_retry, error
         )
     else:
         # Max retries exceeded - mark as permanently failed
         reminder.status = ReminderStatus.FAILED.value
         reminder.next_retry_at = None
         logger.error(
-            f"Reminder {reminder.id} permanently failed after {reminder.attempt_count} attempts. "
-            f"Error: {error}"
+            "Reminder %s permanently failed after %s attempts. Error: %s",
+            reminder.id, reminder.attempt_count, error
+        )
+
+
+def finish_occurrence(db, reminder: Reminder, attempt: CallAttempt) -> None:
+    """
+    Commit the outcome of an attempt, together with its ledger row, and publish it.
+
+    The attempt's IN_FLIGHT row is updated with the outcome; it is inserted
+    instead if start_call_attempt never committed it.
+
+    For recurring reminders that reached a terminal status (COMPLETED or
+    FAILED), the next occurrence is materialized in the same commit so the
+    row goes straight back to SCHEDULED for its next date_time_utc.
+    """
+    outcome = reminder.status
+    next_local = None
+    if outcome in (ReminderStatus.COMPLETED.value, ReminderStatus.FAILED.value):
+        next_local = reminder.advance_to_next_occurrence(datetime.now(tz.utc))
+
+    def write(session) -> None:
+        session.merge(reminder)
+        recorded = session.execute(
+            update(CallAttempt)
+            .where(CallAttempt.idempotency_key == attempt.idempotency_key)
+            .values(
+                status=attempt.status,
+                provider_call_id=attempt.provider_call_id,
+                error_class=attempt.error_class,
+                error=attempt.error,
+                finished_at=attempt.finished_at,
+                latency_ms=attempt.latency_ms
+            )
+        ).rowcount
+        if not recorded:
+            session.add(attempt)
+        event_bus.stage(session, build_reminder_event("status_changed", reminder.id, reminder.user_id, outcome))
+        if next_local is not None:
+            stage_reminder_event(session, "rescheduled", reminder)
+
+    run_write(db, write)
+
+    if next_local is not None:
+        logger.info(
+            "Recurring reminder %s rescheduled to %s %s (%s UTC)",
+            reminder.id, next_local, reminder.timezone, reminder.date_time_utc
         )
 
 
@@ -148,7 +325,10 @@ def reset_stuck_reminders() -> int:
     This handles cases where a server crashes mid-processing.
     Returns the number of reminders reset.
     """
-    db = SessionLocal()
+    if not is_scheduler_leader():
+        return 0
+
+    db = SchedulerSessionLocal()
 
     try:
         timeout_threshold = datetime.now(tz.utc) - timedelta(
@@ -165,26 +345,33 @@ def reset_stuck_reminders() -> int:
                 )
             )
             .values(status=ReminderStatus.PENDING_RETRY.value)
+            .returning(Reminder.id, Reminder.user_id)
         )
 
-        result = db.execute(stmt)
-        reset_count = result.rowcount
-        db.commit()
+        def reset(session) -> int:
+            rows = session.execute(stmt).fetchall()
+            for reminder_id, user_id in rows:
+                event_bus.stage(session, build_reminder_event(
+                    "status_changed", reminder_id, user_id, ReminderStatus.PENDING_RETRY.value
+                ))
+            return len(rows)
+
+        reset_count = run_write(db, reset)
 
         if reset_count > 0:
             logger.warning(
-                f"Reset {reset_count} stuck reminders from PROCESSING to PENDING_RETRY "
-                f"(stuck for >{settings.STUCK_PROCESSING_TIMEOUT_MINUTES} minutes)"
+                "Reset %d stuck reminders from PROCESSING to PENDING_RETRY (stuck for >%s minutes)",
+                reset_count, settings.STUCK_PROCESSING_TIMEOUT_MINUTES
             )
 
         return reset_count
 
     except OperationalError as e:
-        logger.error(f"Database error in reset_stuck_reminders: {e}")
+        logger.error("Database error in reset_stuck_reminders: %s", e)
         db.rollback()
         return 0
     except Exception as e:
-        logger.error(f"Error in reset_stuck_reminders: {e}")
+        logger.error("Error in reset_stuck_reminders: %s", e)
         return 0
     finally:
         db.close()
@@ -195,62 +382,128 @@ def process_due_reminders():
     Poll database for due reminders and trigger Vapi calls.
     Uses optimistic locking to prevent double-processing in multi-server deployments.
     """
-    db = SessionLocal()
+    global _active_batches
+    if not is_scheduler_leader():
+        return
+    with _drain_cond:
+        if _stopping:
+            return
+        _active_batches += 1
+
+    db = SchedulerSessionLocal()
     vapi_service = VapiService()
 
     try:
         now_utc = datetime.now(tz.utc)
         window_end = now_utc + timedelta(seconds=settings.SCHEDULER_POLL_INTERVAL_SECONDS)
 
-        # Get IDs of due reminders (limited batch size)
-        reminder_ids = get_due_reminder_ids(
+        # Get due reminders (limited batch size)
+        due = get_due_reminders(
             db, now_utc, window_end, settings.SCHEDULER_BATCH_SIZE
         )
 
-        if not reminder_ids:
+        if not due:
             logger.debug("No due reminders found")
             return
 
-        logger.info(f"Found {len(reminder_ids)} potentially due reminders")
+        logger.info("Found %d potentially due reminders", len(due))
 
         processed_count = 0
-        for reminder_id in reminder_ids:
+        for reminder_id, previous_status in due:
+            if _stopping:
+                # Shutting down: leave the rest unclaimed for the next process
+                break
+
             # Try to acquire the reminder atomically
             reminder = acquire_reminder_for_processing(db, reminder_id)
 
             if reminder is None:
                 # Another instance already claimed this reminder
-                logger.debug(f"Reminder {reminder_id} already being processed by another instance")
+                logger.debug("Reminder %s already being processed by another instance", reminder_id)
                 continue
 
+            if not _may_start_call(db, reminder_id, previous_status):
+                break
+
             # Process the reminder
             process_single_reminder(db, reminder, vapi_service)
             processed_count += 1
 
-        logger.info(f"Processed {processed_count} reminders this cycle")
+        logger.info("Processed %d reminders this cycle", processed_count)
 
     except OperationalError as e:
-        logger.error(f"Database error in process_due_reminders: {e}")
+        logger.error("Database error in process_due_reminders: %s", e)
         db.rollback()
     except Exception as e:
-        logger.error(f"Error in process_due_reminders: {e}")
+        logger.error("Error in process_due_reminders: %s", e)
+    finally:
+        db.close()
+        with _drain_cond:
+            _active_batches -= 1
+            _drain_cond.notify_all()
+
+
+def drain_dispatch(timeout_seconds: float) -> None:
+    """
+    Shut the dispatch loop down without stranding reminders in PROCESSING.
+
+    Stops claiming new reminders, waits up to timeout_seconds for the call in
+    flight to finish, then releases reminders that were claimed but whose call
+    never started back to SCHEDULED/PENDING_RETRY. A call still running at the
+    deadline is left to reset_stuck_reminders. Its retry is a new attempt with
+    a new key, so the call is placed again. The first attempt's in_flight
+    ledger row records that it may also have gone out.
+    """
+    global _stopping, _drained
+    with _drain_cond:
+        _stopping = True
+        finished = _drain_cond.wait_for(lambda: _active_batches == 0, timeout_seconds)
+        claims = dict(_unstarted_claims)
+        _unstarted_claims.clear()
+        _drained = True
+
+    if not finished:
+        logger.warning(
+            "Dispatch drain timed out after %ss with a call in flight; "
+            "reset_stuck_reminders will recover its reminder", timeout_seconds
+        )
+    if not claims:
+        return
+
+    db = SchedulerSessionLocal()
+    try:
+        released = release_claims(db, claims)
+        logger.info("Released %d claimed reminders on shutdown", released)
+    except OperationalError as e:
+        logger.error("Database error in drain_dispatch: %s", e)
+        db.rollback()
     finally:
         db.close()
 
 
-# Register jobs with scheduler
-scheduler.add_job(
-    func=process_due_reminders,
-    trigger=IntervalTrigger(seconds=settings.SCHEDULER_POLL_INTERVAL_SECONDS),
-    id="process_due_reminders",
-    name="Process due reminders and make Vapi calls",
-    replace_existing=True
-)
-
-scheduler.add_job(
-    func=reset_stuck_reminders,
-    trigger=IntervalTrigger(minutes=settings.STUCK_PROCESSING_TIMEOUT_MINUTES),
-    id="reset_stuck_reminders",
-    name="Reset reminders stuck in PROCESSING state",
-    replace_existing=True
-)
+def register_jobs() -> None:
+    """Add this module's jobs to the scheduler (called at startup)."""
+    global _stopping, _drained
+    # Re-arm dispatch after a previous drain_dispatch (e.g. a second lifespan in
+    # the same process). _active_batches is left alone: a batch that outlived
+    # the last drain still decrements it when it finishes.
+    with _drain_cond:
+        _stopping = False
+        _drained = False
+        _unstarted_claims.clear()
+
+    scheduler.add_job(
+        func=process_due_reminders,
+        trigger=IntervalTrigger(seconds=settings.SCHEDULER_POLL_INTERVAL_SECONDS),
+        id="process_due_reminders",
+        name="Process due reminders and make Vapi calls",
+        replace_existing=True
+    )
+
+    scheduler.add_job(
+        func=reset_stuck_reminders,
+        trigger=IntervalTrigger(minutes=settings.STUCK_PROCESSING_TIMEOUT_MINUTES),
+        id="reset_stuck_reminders",
+        name="Reset reminders stuck in PROCESSING state",
+        replace_existing=True
+    )
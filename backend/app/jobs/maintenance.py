@@ -0,0 +1,222 @@
+from datetime import datetime, timedelta
+from sqlalchemy import select, delete, insert, or_
+from sqlalchemy.exc import OperationalError
+from app.database import SchedulerSessionLocal, scheduler_engine
+from app.core.sqlite import checkpoint_wal
+from app.core.write_queue import run_write
+from app.models.refresh_token import RefreshToken
+from app.models.reminder import Reminder
+from app.models.reminder_archive import ReminderArchive
+from app.models.reminder_event import ReminderEvent
+from app.services.reminder_history import ARCHIVED_STATUSES
+from app.scheduler import scheduler
+from app.config import settings
+from apscheduler.triggers.interval import IntervalTrigger
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def purge_refresh_tokens(chunk_size: int = settings.REFRESH_TOKEN_PURGE_CHUNK_SIZE) -> int:
+    """
+    Delete expired and revoked refresh tokens in chunks.
+
+    Each chunk is deleted and committed in its own short transaction so the
+    purge never holds long locks on refresh_tokens, even after a large backlog.
+    Returns the total number of rows deleted.
+    """
+    db = SchedulerSessionLocal()
+    total_deleted = 0
+
+    try:
+        now = datetime.utcnow()
+        while True:
+            ids = db.scalars(
+                select(RefreshToken.id)
+                .where(
+                    or_(
+                        RefreshToken.expires_at <= now,
+                        RefreshToken.is_revoked == True
+                    )
+                )
+                .limit(chunk_size)
+            ).all()
+
+            if not ids:
+                break
+
+            run_write(db, lambda s: s.execute(delete(RefreshToken).where(RefreshToken.id.in_(ids))))
+            total_deleted += len(ids)
+
+            if len(ids) < chunk_size:
+                break
+
+        if total_deleted > 0:
+            logger.info("Purged %d expired or revoked refresh tokens", total_deleted)
+
+        return total_deleted
+
+    except OperationalError as e:
+        logger.error("Database error in purge_refresh_tokens: %s", e)
+        db.rollback()
+        return total_deleted
+    except Exception as e:
+        logger.error("Error in purge_refresh_tokens: %s", e)
+        return total_deleted
+    finally:
+        db.close()
+
+
+def archive_finished_reminders(chunk_size: int = settings.REMINDER_ARCHIVE_CHUNK_SIZE) -> int:
+    """
+    Move COMPLETED/FAILED reminders older than REMINDER_ARCHIVE_AFTER_DAYS
+    from reminders to reminders_archive, keeping the hot table small.
+
+    Each chunk is moved in one transaction: rows are deleted with RETURNING
+    and the returned rows inserted into the archive, so a row is never in
+    both tables or lost, even if its status changes concurrently.
+    Returns the total number of reminders archived.
+    """
+    db = SchedulerSessionLocal()
+    total_archived = 0
+
+    try:
+        cutoff = datetime.utcnow() - timedelta(days=settings.REMINDER_ARCHIVE_AFTER_DAYS)
+        columns = Reminder.__table__.c
+
+        while True:
+            ids = db.scalars(
+                select(Reminder.id)
+                .where(
+                    Reminder.status.in_(ARCHIVED_STATUSES),
+                    Reminder.updated_at < cutoff
+                )
+                .order_by(Reminder.id.asc())
+                .limit(chunk_size)
+            ).all()
+
+            if not ids:
+                break
+
+            def move_chunk(session, ids=ids) -> int:
+                rows = session.execute(
+                    delete(Reminder)
+                    .where(Reminder.id.in_(ids), Reminder.status.in_(ARCHIVED_STATUSES))
+                    .returning(*columns)
+                ).mappings().all()
+                if rows:
+                    archived_at = datetime.utcnow()
+                    session.execute(
+                        insert(ReminderArchive),
+                        [{**row, "archived_at": archived_at} for row in rows]
+                    )
+                return len(rows)
+
+            total_archived += run_write(db, move_chunk)
+
+            if len(ids) < chunk_size:
+                break
+
+        if total_archived > 0:
+            logger.info("Archived %d finished reminders", total_archived)
+
+        return total_archived
+
+    except OperationalError as e:
+        logger.error("Database error in archive_finished_reminders: %s", e)
+        db.rollback()
+        return total_archived
+    except Exception as e:
+        logger.error("Error in archive_finished_reminders: %s", e)
+        return total_archived
+    finally:
+        db.close()
+
+
+def purge_reminder_events(chunk_size: int = 1000) -> int:
+    """
+    Delete reminder_events outbox rows older than EVENTS_OUTBOX_RETENTION_MINUTES,
+    in chunks. Returns the total number of rows deleted.
+    """
+    db = SchedulerSessionLocal()
+    total_deleted = 0
+
+    try:
+        cutoff = datetime.utcnow() - timedelta(minutes=settings.EVENTS_OUTBOX_RETENTION_MINUTES)
+        while True:
+            ids = db.scalars(
+                select(ReminderEvent.id)
+                .where(ReminderEvent.created_at < cutoff)
+                .limit(chunk_size)
+            ).all()
+
+            if not ids:
+                break
+
+            run_write(db, lambda s: s.execute(delete(ReminderEvent).where(ReminderEvent.id.in_(ids))))
+            total_deleted += len(ids)
+
+            if len(ids) < chunk_size:
+                break
+
+        if total_deleted > 0:
+            logger.info("Purged %d reminder outbox events", total_deleted)
+
+        return total_deleted
+
+    except OperationalError as e:
+        logger.error("Database error in purge_reminder_events: %s", e)
+        db.rollback()
+        return total_deleted
+    finally:
+        db.close()
+
+
+def checkpoint_sqlite_wal() -> None:
+    """
+    Passively checkpoint the SQLite WAL so it doesn't grow without bound
+    between SQLite's automatic checkpoints under sustained write load.
+    """
+    try:
+        busy, wal_frames, checkpointed = checkpoint_wal(scheduler_engine)
+        logger.debug("WAL checkpoint: %s/%s frames (busy=%s)", checkpointed, wal_frames, busy)
+    except OperationalError as e:
+        logger.error("Database error in checkpoint_sqlite_wal: %s", e)
+
+
+def register_jobs() -> None:
+    """Add this module's jobs to the scheduler (called at startup)."""
+    scheduler.add_job(
+        func=purge_refresh_tokens,
+        trigger=IntervalTrigger(minutes=settings.REFRESH_TOKEN_PURGE_INTERVAL_MINUTES),
+        id="purge_refresh_tokens",
+        name="Purge expired and revoked refresh tokens",
+        replace_existing=True
+    )
+
+    if settings.REMINDER_ARCHIVE_AFTER_DAYS > 0:
+        scheduler.add_job(
+            func=archive_finished_reminders,
+            trigger=IntervalTrigger(minutes=settings.REMINDER_ARCHIVE_INTERVAL_MINUTES),
+            id="archive_finished_reminders",
+            name="Move finished reminders to the archive table",
+            replace_existing=True
+        )
+
+    if settings.EVENTS_BACKEND == "outbox":
+        scheduler.add_job(
+            func=purge_reminder_events,
+            trigger=IntervalTrigger(minutes=max(1, settings.EVENTS_OUTBOX_RETENTION_MINUTES // 4)),
+            id="purge_reminder_events",
+            name="Purge old reminder outbox events",
+            replace_existing=True
+        )
+
+    if settings.is_sqlite and settings.SQLITE_WAL:
+        scheduler.add_job(
+            func=checkpoint_sqlite_wal,
+            trigger=IntervalTrigger(minutes=settings.SQLITE_CHECKPOINT_INTERVAL_MINUTES),
+            id="checkpoint_sqlite_wal",
+            name="Checkpoint SQLite WAL",
+            replace_existing=True
+        )
@@ -3,5 +3,9 @@ from app.models.base import BaseModel
 from app.models.user import User
 from app.models.reminder import Reminder, ReminderStatus
 from app.models.refresh_token import RefreshToken
+from app.models.reminder_event import ReminderEvent
+from app.models.reminder_archive import ReminderArchive
+from app.models.scheduler_lease import SchedulerLease
+from app.models.call_attempt import CallAttempt, CallAttemptStatus
 
-__all__ = ["BaseModel", "User", "Reminder", "ReminderStatus", "RefreshToken"]
+__all__ = ["BaseModel", "User", "Reminder", "ReminderStatus", "RefreshToken", "ReminderEvent", "ReminderArchive", "SchedulerLease", "CallAttempt", "CallAttemptStatus"]
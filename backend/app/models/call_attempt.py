@@ -0,0 +1,43 @@
+from datetime import datetime
+import enum
+from sqlalchemy import String, Integer, Text, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+from app.models.base import BaseModel
+
+
+class CallAttemptStatus(str, enum.Enum):
+    """Enum for call attempt status."""
+    IN_FLIGHT = "in_flight"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class CallAttempt(BaseModel):
+    """
+    One provider call made for a reminder (attempt ledger).
+
+    The dispatcher inserts the row as IN_FLIGHT, in the same commit as the
+    reminder's attempt count, before calling the provider, and updates it
+    once with the outcome, in the same commit as the reminder's new status.
+    A row left IN_FLIGHT is a call whose process died mid-call: the call may
+    or may not have been placed. Keeping the attempt details here leaves the
+    hot reminders row with just its scheduling state.
+    reminder_id is not a foreign key: attempts outlive reminders that are
+    archived or deleted.
+    """
+
+    __tablename__ = "call_attempts"
+
+    reminder_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    attempt_number: Mapped[int] = mapped_column(Integer, nullable=False)
+    idempotency_key: Mapped[str] = mapped_column(String(64), nullable=False, unique=True)
+    status: Mapped[str] = mapped_column(String(20), default=CallAttemptStatus.IN_FLIGHT.value, nullable=False)
+    provider_call_id: Mapped[str | None] = mapped_column(String(100), nullable=True, index=True)
+    error_class: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    started_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    latency_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<CallAttempt(id={self.id}, reminder_id={self.reminder_id}, attempt={self.attempt_number}, status='{self.status}')>"
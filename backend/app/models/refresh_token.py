@@ -1,14 +1,22 @@
-from sqlalchemy import String, ForeignKey, Boolean
+from datetime import datetime
+from sqlalchemy import String, ForeignKey, Boolean, DateTime
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import BaseModel
 
 
 class RefreshToken(BaseModel):
-    """Model for storing refresh tokens."""
+    """
+    Model for storing refresh tokens.
+
+    Only a fixed-size SHA-256 digest of the JWT is stored (see hash_token),
+    keeping the unique index narrow and the raw token out of the database.
+    Expired and revoked rows are removed by the purge_refresh_tokens job.
+    """
 
     __tablename__ = "refresh_tokens"
 
-    token: Mapped[str] = mapped_column(String(500), unique=True, index=True, nullable=False)
+    token_hash: Mapped[str] = mapped_column(String(64), unique=True, index=True, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
     is_revoked: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
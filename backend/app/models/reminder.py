@@ -1,11 +1,25 @@
 from sqlalchemy import String, Text, DateTime, ForeignKey, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
+from datetime import datetime, timedelta, timezone as dt_timezone
 import enum
-import re
 import uuid
 from app.models.base import BaseModel
+from app.core.recurrence import next_occurrence
+from app.core.timezones import resolve_timezone
+
+
+def local_to_utc(local_dt: datetime, tz_identifier: str) -> datetime:
+    """Convert a naive local datetime in tz_identifier to a naive UTC datetime."""
+    tz = resolve_timezone(tz_identifier)
+    # Localize the naive datetime to the user's timezone, then convert to UTC
+    return local_dt.replace(tzinfo=tz).astimezone(dt_timezone.utc).replace(tzinfo=None)
+
+
+def utc_to_local(utc_dt: datetime, tz_identifier: str) -> datetime:
+    """Convert a UTC datetime (naive or aware) to a naive local datetime in tz_identifier."""
+    if utc_dt.tzinfo is None:
+        utc_dt = utc_dt.replace(tzinfo=dt_timezone.utc)
+    return utc_dt.astimezone(resolve_timezone(tz_identifier)).replace(tzinfo=None)
 
 
 class ReminderStatus(str, enum.Enum):
@@ -21,6 +35,9 @@ class Reminder(BaseModel):
     """Reminder model for storing user reminders."""
 
     __tablename__ = "reminders"
+    # Archived reminders keep their id in reminders_archive (and call_attempts),
+    # so SQLite must never hand out the id of a row that was archived away
+    __table_args__ = {"sqlite_autoincrement": True}
 
     # Foreign key to User
     user_id: Mapped[int] = mapped_column(
@@ -51,17 +68,19 @@ class Reminder(BaseModel):
     attempt_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     max_attempts: Mapped[int] = mapped_column(Integer, default=3, nullable=False)
     next_retry_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True, index=True)
-    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
 
-    # Idempotency tracking
-    idempotency_key: Mapped[str | None] = mapped_column(String(64), nullable=True, unique=True, index=True)
-    vapi_call_id: Mapped[str | None] = mapped_column(String(100), nullable=True, index=True)
+    # Recurrence (RRULE body, e.g. "FREQ=WEEKLY;BYDAY=MO,WE"). Only the next
+    # occurrence is materialized into date_time/date_time_utc; recurrence_start
+    # anchors the rule so COUNT/INTERVAL stay stable as occurrences advance.
+    recurrence_rule: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    recurrence_start: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    # Per-attempt details (idempotency key, provider call id, error) live in
+    # the call_attempts ledger, keeping dispatch writes to this row narrow
 
     def generate_idempotency_key(self) -> str:
         """Generate a unique idempotency key for this reminder attempt."""
-        key = f"{self.id}-{self.attempt_count}-{uuid.uuid4().hex[:8]}"
-        self.idempotency_key = key
-        return key
+        return f"{self.id}-{self.attempt_count}-{uuid.uuid4().hex[:8]}"
 
     def calculate_next_retry(self, base_delay_seconds: int = 60) -> datetime:
         """Calculate next retry time using exponential backoff."""
@@ -81,36 +100,38 @@ class Reminder(BaseModel):
             tz_identifier: IANA timezone identifier (e.g., "America/New_York", "Asia/Kolkata")
                           or legacy UTC offset format (e.g., "UTC-5", "UTC+5:30")
         """
-        # Handle legacy UTC±X format for backward compatibility
-        if tz_identifier.startswith('UTC'):
-            offset_str = tz_identifier.replace('UTC', '')
-
-            if not offset_str or offset_str == '+0' or offset_str == '-0':
-                # UTC with no offset
-                self.date_time_utc = local_dt
-                return
-
-            # Parse UTC±X or UTC±X:XX format
-            match = re.match(r'^([+-])?(\d{1,2})(?::(\d{2}))?$', offset_str)
-            if match:
-                sign = -1 if match.group(1) == '-' else 1
-                hours = int(match.group(2))
-                minutes = int(match.group(3) or 0)
-                total_minutes = sign * (hours * 60 + minutes)
-                self.date_time_utc = local_dt - timedelta(minutes=total_minutes)
-                return
-            else:
-                raise ValueError(f"Invalid UTC offset format: {tz_identifier}")
-
-        # Handle IANA timezone identifier
-        try:
-            tz = ZoneInfo(tz_identifier)
-            # Localize the naive datetime to the user's timezone
-            localized_dt = local_dt.replace(tzinfo=tz)
-            # Convert to UTC
-            self.date_time_utc = localized_dt.astimezone(ZoneInfo('UTC')).replace(tzinfo=None)
-        except Exception as e:
-            raise ValueError(f"Invalid timezone identifier: {tz_identifier}") from e
+        self.date_time_utc = local_to_utc(local_dt, tz_identifier)
+
+    def advance_to_next_occurrence(self, now_utc: datetime) -> datetime | None:
+        """
+        Materialize the next occurrence of a recurring reminder.
+
+        Moves date_time/date_time_utc to the first occurrence after both the
+        current occurrence and now (missed occurrences are skipped rather than
+        fired in a burst) and resets per-occurrence retry state.
+
+        Returns:
+            The new local date_time, or None if the reminder is not recurring
+            or its rule is exhausted (the reminder is left untouched).
+        """
+        if not self.recurrence_rule:
+            return None
+
+        now_local = utc_to_local(now_utc, self.timezone)
+        next_local = next_occurrence(
+            self.recurrence_rule,
+            self.recurrence_start or self.date_time,
+            max(self.date_time, now_local)
+        )
+        if next_local is None:
+            return None
+
+        self.date_time = next_local
+        self.set_utc_datetime(next_local, self.timezone)
+        self.status = ReminderStatus.SCHEDULED.value
+        self.attempt_count = 0
+        self.next_retry_at = None
+        return next_local
 
     def __repr__(self) -> str:
         return f"<Reminder(id={self.id}, title='{self.title}', status='{self.status}')>"
@@ -0,0 +1,41 @@
+from datetime import datetime
+from sqlalchemy import String, Integer, Text, DateTime, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from app.models.base import BaseModel
+
+
+class ReminderArchive(BaseModel):
+    """
+    Finished (COMPLETED/FAILED) reminders moved out of the hot reminders table.
+
+    Rows keep their original id, columns and timestamps so history endpoints
+    can read both tables as one (reminders ids are never reused, see
+    Reminder.__table_args__). Populated by the archive maintenance job.
+    """
+
+    __tablename__ = "reminders_archive"
+    __table_args__ = (
+        Index("ix_reminders_archive_user_id_date_time", "user_id", "date_time"),
+    )
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+
+    title: Mapped[str] = mapped_column(String(200), nullable=False)
+    message: Mapped[str] = mapped_column(Text, nullable=False)
+    phone_number: Mapped[str] = mapped_column(String(20), nullable=False)
+    date_time: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    timezone: Mapped[str] = mapped_column(String(100), nullable=False)
+    date_time_utc: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
+
+    attempt_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False)
+    next_retry_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    recurrence_rule: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    recurrence_start: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    archived_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<ReminderArchive(id={self.id}, title='{self.title}', status='{self.status}')>"
@@ -0,0 +1,23 @@
+from sqlalchemy import String, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+from app.models.base import BaseModel
+
+
+class ReminderEvent(BaseModel):
+    """
+    Outbox row for a reminder change event.
+
+    Written by the outbox event backend so that SSE subscribers in other
+    worker processes can pick up changes made by the scheduler or the API.
+    Rows are short-lived and purged after EVENTS_OUTBOX_RETENTION_MINUTES.
+    """
+
+    __tablename__ = "reminder_events"
+
+    user_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    reminder_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    event_type: Mapped[str] = mapped_column(String(20), nullable=False)
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<ReminderEvent(id={self.id}, reminder_id={self.reminder_id}, type='{self.event_type}')>"
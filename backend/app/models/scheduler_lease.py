@@ -0,0 +1,25 @@
+from datetime import datetime
+from sqlalchemy import String, Integer, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+from app.models.base import BaseModel
+
+
+class SchedulerLease(BaseModel):
+    """
+    Time-bounded leadership lease for the scheduler's dispatch jobs.
+
+    One row per lease name. The process named in `holder` runs the polling
+    jobs until `expires_at`; it renews well before then. `fencing_token`
+    increases every time the lease changes hands, so writes guarded on the
+    token are rejected once a newer leader has taken over.
+    """
+
+    __tablename__ = "scheduler_leases"
+
+    name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
+    holder: Mapped[str] = mapped_column(String(255), nullable=False, default="")
+    fencing_token: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<SchedulerLease(name='{self.name}', holder='{self.holder}', token={self.fencing_token})>"
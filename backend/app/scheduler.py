@@ -1,4 +1,6 @@
+from datetime import datetime
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.interval import IntervalTrigger
 from app.config import settings
 import logging
 
@@ -7,6 +9,31 @@ logger = logging.getLogger(__name__)
 scheduler = AsyncIOScheduler(timezone=settings.SCHEDULER_TIMEZONE)
 
 
+def register_jobs():
+    """
+    Import the job modules and add their jobs to the scheduler.
+
+    Deferred to application startup so that importing the app (tooling,
+    migrations, worker boot before the lifespan runs) stays light.
+    """
+    from app.jobs import daily_calls, maintenance
+    from app.core.leader import leader_lease
+
+    if leader_lease is not None:
+        # First attempt right away so a sole process doesn't wait a period to lead
+        scheduler.add_job(
+            func=leader_lease.renew,
+            trigger=IntervalTrigger(seconds=settings.SCHEDULER_LEADER_RENEW_SECONDS),
+            id="renew_leader_lease",
+            name="Acquire or renew the scheduler leader lease",
+            next_run_time=datetime.now(scheduler.timezone),
+            replace_existing=True
+        )
+
+    daily_calls.register_jobs()
+    maintenance.register_jobs()
+
+
 def start_scheduler():
     """Start the APScheduler instance."""
     if not scheduler.running:
@@ -15,7 +42,14 @@ def start_scheduler():
 
 
 def shutdown_scheduler():
-    """Gracefully shutdown the scheduler."""
+    """Stop scheduling new job runs; in-flight runs are finished by drain_jobs()."""
     if scheduler.running:
-        scheduler.shutdown()
+        scheduler.shutdown(wait=False)
         logger.info("Scheduler shut down successfully")
+
+
+def drain_jobs(timeout_seconds: float = settings.SCHEDULER_SHUTDOWN_DRAIN_SECONDS) -> None:
+    """Let the dispatch loop finish its in-flight call (up to the deadline) and release unstarted claims."""
+    from app.jobs import daily_calls
+
+    daily_calls.drain_dispatch(timeout_seconds)
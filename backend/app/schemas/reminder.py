@@ -1,7 +1,21 @@
 from datetime import datetime
 from pydantic import BaseModel, Field, field_validator
 from typing import Literal, List, Generic, TypeVar
-from zoneinfo import ZoneInfo, available_timezones
+from app.core.recurrence import normalize_recurrence_rule
+from app.core.timezones import is_iana_timezone, is_legacy_offset, resolve_timezone
+
+
+def validate_timezone_identifier(v: str) -> str:
+    """Validate an IANA identifier or legacy UTC±X offset against the timezone registry."""
+    # Also support legacy UTC±X format for backward compatibility
+    if is_legacy_offset(v):
+        # Parsed once and cached; rejects malformed offsets up front
+        resolve_timezone(v)
+        return v
+
+    if not is_iana_timezone(v):
+        raise ValueError(f"Invalid timezone identifier: {v}. Must be a valid IANA timezone (e.g., 'America/New_York', 'Asia/Kolkata')")
+    return v
 
 
 class ReminderCreate(BaseModel):
@@ -11,19 +25,21 @@ class ReminderCreate(BaseModel):
     phone_number: str = Field(..., pattern=r'^\+\d{10,15}$')
     date_time: datetime
     timezone: str = Field(..., min_length=1, max_length=100)  # IANA timezone identifier e.g., "America/New_York", "Asia/Kolkata"
+    recurrence_rule: str | None = Field(None, max_length=255)  # RRULE body e.g., "FREQ=WEEKLY;BYDAY=MO,WE"
 
     @field_validator('timezone')
     @classmethod
     def validate_timezone(cls, v: str) -> str:
         """Validate that the timezone is a valid IANA timezone identifier."""
-        # Also support legacy UTC±X format for backward compatibility
-        if v.startswith('UTC'):
-            # Allow UTC, UTC+X, UTC-X formats (legacy support)
-            return v
+        return validate_timezone_identifier(v)
 
-        if v not in available_timezones():
-            raise ValueError(f"Invalid timezone identifier: {v}. Must be a valid IANA timezone (e.g., 'America/New_York', 'Asia/Kolkata')")
-        return v
+    @field_validator('recurrence_rule')
+    @classmethod
+    def validate_recurrence_rule(cls, v: str | None) -> str | None:
+        """Validate and normalize an RRULE-style recurrence rule."""
+        if v is None:
+            return v
+        return normalize_recurrence_rule(v)
 
 
 class ReminderUpdate(BaseModel):
@@ -33,6 +49,7 @@ class ReminderUpdate(BaseModel):
     phone_number: str | None = Field(None, pattern=r'^\+\d{10,15}$')
     date_time: datetime | None = None
     timezone: str | None = Field(None, min_length=1, max_length=100)
+    recurrence_rule: str | None = Field(None, max_length=255)
     status: Literal["scheduled", "completed", "failed"] | None = None
 
     @field_validator('timezone')
@@ -41,14 +58,15 @@ class ReminderUpdate(BaseModel):
         """Validate that the timezone is a valid IANA timezone identifier."""
         if v is None:
             return v
+        return validate_timezone_identifier(v)
 
-        # Also support legacy UTC±X format for backward compatibility
-        if v.startswith('UTC'):
+    @field_validator('recurrence_rule')
+    @classmethod
+    def validate_recurrence_rule(cls, v: str | None) -> str | None:
+        """Validate and normalize an RRULE-style recurrence rule."""
+        if v is None:
             return v
-
-        if v not in available_timezones():
-            raise ValueError(f"Invalid timezone identifier: {v}. Must be a valid IANA timezone (e.g., 'America/New_York', 'Asia/Kolkata')")
-        return v
+        return normalize_recurrence_rule(v)
 
 
 class ReminderResponse(BaseModel):
@@ -61,6 +79,7 @@ class ReminderResponse(BaseModel):
     date_time: datetime
     timezone: str
     status: str
+    recurrence_rule: str | None = None
     created_at: datetime
     updated_at: datetime
 
@@ -68,6 +87,16 @@ class ReminderResponse(BaseModel):
         from_attributes = True
 
 
+class ReminderOccurrence(BaseModel):
+    """Schema for one expanded occurrence of a (possibly recurring) reminder."""
+    reminder_id: int
+    title: str
+    timezone: str
+    date_time: datetime = Field(..., description="Occurrence in the reminder's local time")
+    date_time_utc: datetime = Field(..., description="Occurrence in UTC")
+    recurring: bool
+
+
 class ReminderStatsResponse(BaseModel):
     """Schema for reminder statistics."""
     total: int = Field(..., description="Total number of reminders")
@@ -0,0 +1,95 @@
+"""Streaming export of a user's reminder history."""
+
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Iterator
+
+from sqlalchemy import FromClause, select
+from sqlalchemy.orm import Session
+
+from app.services.reminder_serialization import REMINDER_RESPONSE_FIELDS
+
+# Rows fetched from the cursor per round trip; memory use is bounded by this
+EXPORT_CHUNK_SIZE = 1000
+
+# Columns written to the export, in output order (mirrors ReminderResponse)
+EXPORT_FIELDS = REMINDER_RESPONSE_FIELDS
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _format_value(value):
+    """Render datetimes as ISO 8601 strings; pass everything else through."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def iter_reminder_rows(db: Session, source: FromClause, conditions: list) -> Iterator[tuple]:
+    """
+    Yield reminder rows from source (see reminder_history()) as plain tuples
+    using a server-side cursor.
+
+    Rows are fetched EXPORT_CHUNK_SIZE at a time, so no more than one chunk
+    is held in memory regardless of how many reminders the user has.
+    """
+    stmt = (
+        select(*(source.c[field] for field in EXPORT_FIELDS))
+        .where(*conditions)
+        .order_by(source.c.date_time.asc(), source.c.id.asc())
+        .execution_options(yield_per=EXPORT_CHUNK_SIZE)
+    )
+
+    result = db.execute(stmt)
+    try:
+        for partition in result.partitions():
+            for row in partition:
+                yield tuple(row)
+    finally:
+        result.close()
+
+
+def stream_ndjson(rows: Iterator[tuple]) -> Iterator[str]:
+    """Encode rows as newline-delimited JSON, one chunk per cursor partition."""
+    buffer = []
+    for row in rows:
+        record = {field: _format_value(value) for field, value in zip(EXPORT_FIELDS, row)}
+        buffer.append(json.dumps(record))
+        if len(buffer) >= EXPORT_CHUNK_SIZE:
+            yield "\n".join(buffer) + "\n"
+            buffer = []
+    if buffer:
+        yield "\n".join(buffer) + "\n"
+
+
+def stream_csv(rows: Iterator[tuple]) -> Iterator[str]:
+    """Encode rows as CSV with a header line, one chunk per cursor partition."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_FIELDS)
+
+    pending = 0
+    for row in rows:
+        writer.writerow([_format_value(value) for value in row])
+        pending += 1
+        if pending >= EXPORT_CHUNK_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+            pending = 0
+
+    # Always flush so the header is sent even for an empty history
+    yield buffer.getvalue()
+
+
+def stream_export(db: Session, source: FromClause, conditions: list, export_format: str) -> Iterator[str]:
+    """Return a text iterator for the requested export format."""
+    rows = iter_reminder_rows(db, source, conditions)
+    if export_format == "csv":
+        return stream_csv(rows)
+    return stream_ndjson(rows)
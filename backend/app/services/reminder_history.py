@@ -0,0 +1,59 @@
+"""
+Reading reminder history across the hot and archive tables.
+
+Finished reminders are moved from `reminders` to `reminders_archive` by the
+archive maintenance job. History endpoints select from reminder_history(),
+which is the hot table alone when the status filter can only match active
+reminders and a UNION ALL of both tables otherwise.
+"""
+
+from typing import Optional
+
+from sqlalchemy import FromClause, func, select, union_all
+from sqlalchemy.orm import Session
+
+from app.models.reminder import Reminder, ReminderStatus
+from app.models.reminder_archive import ReminderArchive
+from app.services.reminder_serialization import REMINDER_RESPONSE_FIELDS
+
+# Statuses that are final and eligible for archiving
+ARCHIVED_STATUSES = (
+    ReminderStatus.COMPLETED.value,
+    ReminderStatus.FAILED.value,
+)
+
+
+def reminder_history(status_filter: Optional[str] = None) -> FromClause:
+    """
+    Selectable exposing REMINDER_RESPONSE_FIELDS for hot and archived reminders.
+
+    Conditions and ordering should be built against its `.c` columns.
+    """
+    if status_filter is not None and status_filter not in ARCHIVED_STATUSES:
+        return Reminder.__table__
+
+    hot = Reminder.__table__.c
+    archived = ReminderArchive.__table__.c
+    return union_all(
+        select(*(hot[field] for field in REMINDER_RESPONSE_FIELDS)),
+        select(*(archived[field] for field in REMINDER_RESPONSE_FIELDS)),
+    ).subquery("reminder_history")
+
+
+def archived_status_counts(db: Session, user_id: int) -> dict[str, int]:
+    """Count a user's archived reminders by status."""
+    rows = db.execute(
+        select(ReminderArchive.status, func.count())
+        .where(ReminderArchive.user_id == user_id)
+        .group_by(ReminderArchive.status)
+    )
+    return {status: count for status, count in rows}
+
+
+def get_archived_reminder(db: Session, user_id: int, reminder_id: int) -> ReminderArchive | None:
+    return db.scalars(
+        select(ReminderArchive).where(
+            ReminderArchive.id == reminder_id,
+            ReminderArchive.user_id == user_id
+        )
+    ).first()
@@ -0,0 +1,103 @@
+"""Lazy expansion of reminder occurrences within a time window."""
+
+import heapq
+from datetime import datetime, timedelta
+from itertools import chain, islice
+from typing import Iterator
+
+from sqlalchemy import select, or_
+from sqlalchemy.orm import Session
+
+from app.core.recurrence import iter_occurrences
+from app.models.reminder import Reminder, ReminderStatus, local_to_utc, utc_to_local
+
+# Statuses whose current occurrence is still upcoming or in flight
+ACTIVE_STATUSES = (
+    ReminderStatus.SCHEDULED.value,
+    ReminderStatus.PENDING_RETRY.value,
+    ReminderStatus.PROCESSING.value,
+)
+
+
+def _occurrences_for(row, window_start: datetime, window_end: datetime) -> Iterator[tuple]:
+    """
+    Yield (utc, local, row) for one reminder's occurrences within the window.
+
+    Recurring rules are walked lazily in local time from the materialized
+    occurrence, so nothing past window_end is ever generated.
+    """
+    if not row.recurrence_rule:
+        yield row.date_time_utc, row.date_time, row
+        return
+
+    # Start a day before the window in local time so DST/offset differences
+    # can never skip an occurrence; exact filtering happens in UTC below
+    window_start_local = utc_to_local(window_start, row.timezone) - timedelta(days=1)
+    first = row.date_time
+    if first >= window_start_local:
+        # The materialized occurrence always counts, even if dtstart itself
+        # does not match the rule (e.g. BYDAY excludes the start date)
+        candidates = chain(
+            [first],
+            iter_occurrences(row.recurrence_rule, row.recurrence_start or first, first)
+        )
+    else:
+        candidates = iter_occurrences(row.recurrence_rule, row.recurrence_start or first, window_start_local)
+
+    for local in candidates:
+        utc = local_to_utc(local, row.timezone)
+        if utc > window_end:
+            return
+        if utc >= window_start:
+            yield utc, local, row
+
+
+def expand_occurrences(
+    db: Session,
+    user_id: int,
+    window_start: datetime,
+    window_end: datetime,
+    limit: int
+) -> list[dict]:
+    """
+    Return up to `limit` occurrences of a user's active reminders, ordered by
+    UTC time, within [window_start, window_end] (naive UTC datetimes).
+    """
+    stmt = (
+        select(
+            Reminder.id,
+            Reminder.title,
+            Reminder.timezone,
+            Reminder.date_time,
+            Reminder.date_time_utc,
+            Reminder.recurrence_rule,
+            Reminder.recurrence_start
+        )
+        .where(
+            Reminder.user_id == user_id,
+            Reminder.status.in_(ACTIVE_STATUSES),
+            Reminder.date_time_utc <= window_end,
+            or_(
+                Reminder.recurrence_rule.is_not(None),
+                Reminder.date_time_utc >= window_start
+            )
+        )
+    )
+    rows = db.execute(stmt).all()
+
+    merged = heapq.merge(
+        *(_occurrences_for(row, window_start, window_end) for row in rows),
+        key=lambda occurrence: (occurrence[0], occurrence[2].id)
+    )
+
+    return [
+        {
+            "reminder_id": row.id,
+            "title": row.title,
+            "timezone": row.timezone,
+            "date_time": local,
+            "date_time_utc": utc,
+            "recurring": row.recurrence_rule is not None
+        }
+        for utc, local, row in islice(merged, limit)
+    ]
@@ -0,0 +1,28 @@
+"""Column projections for serializing reminders without loading ORM objects."""
+
+from typing import Iterable, Sequence
+
+from app.models.reminder import Reminder
+
+# Columns exposed by ReminderResponse, in schema order. Selecting only these
+# skips the retry/idempotency columns and the ORM identity map entirely.
+REMINDER_RESPONSE_COLUMNS = (
+    Reminder.id,
+    Reminder.user_id,
+    Reminder.title,
+    Reminder.message,
+    Reminder.phone_number,
+    Reminder.date_time,
+    Reminder.timezone,
+    Reminder.status,
+    Reminder.recurrence_rule,
+    Reminder.created_at,
+    Reminder.updated_at,
+)
+REMINDER_RESPONSE_FIELDS = tuple(column.key for column in REMINDER_RESPONSE_COLUMNS)
+
+
+def rows_to_dicts(rows: Iterable[Sequence]) -> list[dict]:
+    """Convert rows selected with REMINDER_RESPONSE_COLUMNS into response dicts."""
+    fields = REMINDER_RESPONSE_FIELDS
+    return [dict(zip(fields, row)) for row in rows]
@@ -0,0 +1,171 @@
+"""
+Bulk recomputation of date_time_utc after tzdata or DST rule changes.
+
+date_time (local wall-clock time) plus timezone is the source of truth;
+date_time_utc is derived once when a reminder is saved. When tzdata changes
+a zone's offset or DST rules, the stored UTC times of future reminders in
+that zone become wrong. recompute_utc() walks SCHEDULED reminders whose
+stored or corrected UTC time is in the future, one timezone at a time in id-ordered chunks, converts each chunk with a single
+resolved tzinfo (memoizing repeated wall-clock times), and writes back only
+the rows whose UTC time changed with one executemany UPDATE per chunk.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Iterable
+
+from sqlalchemy import bindparam, func, select, update
+from sqlalchemy.orm import Session
+
+from app.core.timezones import resolve_timezone
+from app.core.write_queue import run_write
+from app.models.reminder import Reminder, ReminderStatus, local_to_utc
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 5000
+
+# A rule change moves a UTC time by less than a day, so a reminder whose stale
+# UTC time is within this much of the past may still be in the future
+RULE_CHANGE_SLACK = timedelta(days=1)
+
+
+@dataclass
+class ZoneRecomputeResult:
+    """Outcome of recomputing one timezone."""
+    timezone: str
+    scanned: int = 0
+    changed: int = 0
+    max_shift: timedelta = timedelta(0)
+    error: str | None = None
+
+
+def _future_scheduled(now_utc: datetime) -> list:
+    """Candidates only: callers check the corrected UTC time against now_utc."""
+    return [
+        Reminder.status == ReminderStatus.SCHEDULED.value,
+        Reminder.date_time_utc >= now_utc - RULE_CHANGE_SLACK,
+    ]
+
+
+def future_timezones(db: Session, now_utc: datetime) -> list[tuple[str, int]]:
+    """(timezone, candidate count) for SCHEDULED reminders that may be in the future, largest first."""
+    rows = db.execute(
+        select(Reminder.timezone, func.count())
+        .where(*_future_scheduled(now_utc))
+        .group_by(Reminder.timezone)
+        .order_by(func.count().desc())
+    )
+    return [(tz_identifier, count) for tz_identifier, count in rows]
+
+
+def recompute_zone(
+    db: Session,
+    tz_identifier: str,
+    now_utc: datetime,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    dry_run: bool = False
+) -> ZoneRecomputeResult:
+    """Recompute date_time_utc for one timezone's future SCHEDULED reminders."""
+    result = ZoneRecomputeResult(timezone=tz_identifier)
+    try:
+        resolve_timezone(tz_identifier)
+    except ValueError as e:
+        result.error = str(e)
+        return result
+
+    last_id = 0
+    while True:
+        rows = db.execute(
+            select(Reminder.id, Reminder.date_time, Reminder.date_time_utc)
+            .where(
+                *_future_scheduled(now_utc),
+                Reminder.timezone == tz_identifier,
+                Reminder.id > last_id
+            )
+            .order_by(Reminder.id.asc())
+            .limit(chunk_size)
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+
+        # Reminders cluster on the same wall-clock times; convert each once
+        converted: dict[datetime, datetime] = {}
+        changes = []
+        for row in rows:
+            new_utc = converted.get(row.date_time)
+            if new_utc is None:
+                new_utc = local_to_utc(row.date_time, tz_identifier)
+                converted[row.date_time] = new_utc
+            if new_utc < now_utc:
+                continue
+            result.scanned += 1
+            if new_utc != row.date_time_utc:
+                changes.append({"id": row.id, "date_time_utc": new_utc})
+                result.max_shift = max(result.max_shift, abs(new_utc - row.date_time_utc))
+
+        if changes:
+            result.changed += len(changes)
+            if not dry_run:
+                _write_changes(db, changes)
+
+        if len(rows) < chunk_size:
+            break
+
+    return result
+
+
+def _write_changes(db: Session, changes: list[dict]) -> None:
+    """Bulk UPDATE by primary key, guarded so rows that left SCHEDULED are skipped."""
+    reminders = Reminder.__table__
+    statement = (
+        update(reminders)
+        .where(
+            reminders.c.id == bindparam("b_id"),
+            reminders.c.status == ReminderStatus.SCHEDULED.value
+        )
+        .values(date_time_utc=bindparam("b_date_time_utc"))
+    )
+    params = [{"b_id": change["id"], "b_date_time_utc": change["date_time_utc"]} for change in changes]
+
+    def apply(session: Session) -> None:
+        session.connection().execute(statement, params)
+
+    run_write(db, apply)
+
+
+def recompute_utc(
+    db: Session,
+    timezones: Iterable[str] | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    dry_run: bool = False
+) -> list[ZoneRecomputeResult]:
+    """
+    Recompute date_time_utc for future SCHEDULED reminders, zone by zone.
+
+    Args:
+        db: Session used for reading (writes go through run_write)
+        timezones: Limit to these identifiers (default: every zone in use)
+        chunk_size: Rows read and updated per round trip
+        dry_run: Report changes without writing them
+    """
+    now_utc = datetime.utcnow()
+    zones = [tz for tz, _ in future_timezones(db, now_utc)]
+    if timezones is not None:
+        wanted = set(timezones)
+        zones = [tz for tz in zones if tz in wanted]
+
+    results = []
+    for tz_identifier in zones:
+        result = recompute_zone(db, tz_identifier, now_utc, chunk_size, dry_run)
+        if result.error:
+            logger.error("Skipped timezone %s: %s", tz_identifier, result.error)
+        elif result.changed:
+            logger.info(
+                "%s: %d/%d reminders %s (max shift %s)", tz_identifier, result.changed, result.scanned,
+                "would change" if dry_run else "updated", result.max_shift
+            )
+        results.append(result)
+    return results
@@ -1,17 +1,32 @@
-from vapi import Vapi
+from functools import lru_cache
 from app.config import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _vapi_client():
+    """
+    Shared Vapi client, created on first use.
+
+    Importing the SDK and building the client costs ~0.5s, which would
+    otherwise be paid on every worker boot and on every scheduler poll.
+    """
+    from vapi import Vapi
+    return Vapi(token=settings.VAPI_API_KEY)
+
+
 class VapiService:
     """Service for making outbound calls via Vapi."""
 
     def __init__(self):
-        self.client = Vapi(token=settings.VAPI_API_KEY)
         self.phone_number_id = settings.VAPI_PHONE_NUMBER_ID
 
+    @property
+    def client(self):
+        return _vapi_client()
+
     def make_reminder_call(
         self,
         phone_number: str,
@@ -29,7 +44,7 @@ class VapiService:
             idempotency_key: Unique key to prevent duplicate calls
 
         Returns:
-            dict: {"success": bool, "call_id": str, "error": str}
+            dict: {"success": bool, "call_id": str, "error": str, "error_class": str}
         """
         try:
             # Build call parameters
@@ -59,14 +74,14 @@ class VapiService:
             # Add idempotency key to metadata if provided
             if idempotency_key:
                 call_params["metadata"] = {"idempotency_key": idempotency_key}
-                logger.info(f"Making Vapi call with idempotency_key={idempotency_key}")
+                logger.debug("Making Vapi call with idempotency_key=%s", idempotency_key)
 
             # Create transient assistant for this call
             response = self.client.calls.create(**call_params)
 
-            logger.info(f"Vapi call created: {response.id}")
+            logger.debug("Vapi call created: %s", response.id)
             return {"success": True, "call_id": response.id}
 
         except Exception as e:
-            logger.error(f"Vapi call failed: {e}")
-            return {"success": False, "error": str(e)}
+            logger.error("Vapi call failed: %s", e)
+            return {"success": False, "error": str(e), "error_class": type(e).__name__}
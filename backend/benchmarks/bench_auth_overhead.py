@@ -0,0 +1,67 @@
+"""
+Benchmark: per-request JWT authentication overhead, before vs after caching.
+
+Measures the token handling done by the auth dependencies on every request:
+
+- before: jose HS256 verify + JSON decode + unconditional print of the payload
+          (the previous decode_token hot path), stdout sent to /dev/null
+- uncached: jose verify + decode with level-gated logging (cache miss path)
+- cached: decode_token with a warm verified-token cache (steady state)
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_auth_overhead [--iterations 20000]
+"""
+
+import argparse
+import contextlib
+import os
+import time
+
+from jose import jwt
+
+from app.config import settings
+from app.core import security
+from app.core.security import create_access_token, decode_token
+
+
+def legacy_decode(token: str) -> dict | None:
+    """The pre-cache implementation of decode_token."""
+    payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    print(f"Token decoded successfully: {payload}")
+    return payload
+
+
+def uncached_decode(token: str) -> dict | None:
+    security._verified_tokens.clear()
+    return decode_token(token)
+
+
+def measure(fn, token: str, iterations: int) -> float:
+    """Return mean seconds per call."""
+    fn(token)  # warm up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn(token)
+    return (time.perf_counter() - start) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20_000)
+    args = parser.parse_args()
+
+    token = create_access_token(data={"sub": "42", "email": "bench@example.com"})
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        before = measure(legacy_decode, token, args.iterations)
+    uncached = measure(uncached_decode, token, args.iterations)
+    cached = measure(decode_token, token, args.iterations)
+
+    print(f"JWT auth overhead per request, {args.iterations} iterations")
+    for name, per_call in (("before", before), ("uncached", uncached), ("cached", cached)):
+        print(f"{name:>9}: {per_call * 1e6:8.2f} us/request")
+    print(f"speedup (before -> cached): {before / cached:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Benchmark: API cold start, from interpreter launch to the first served request.
+
+Two measurements, each in fresh subprocesses:
+
+- import:  `python -X importtime -c "import main"`, summarized as total import
+           time, self time per top-level package and the slowest modules
+- startup: `uvicorn main:app` launched on a free port, timed until the first
+           successful GET /health (import + lifespan startup + first request)
+
+With --max-import-ms / --max-startup-ms the script exits non-zero when the
+median exceeds the budget, so it can gate CI.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_cold_start [--runs 5] [--top 15]
+        [--max-import-ms 1500] [--max-startup-ms 4000]
+"""
+
+import argparse
+import os
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from collections import defaultdict
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int, int]]:
+    """(module, self_us, cumulative_us, depth) for each `-X importtime` line."""
+    entries = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append((module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return entries
+
+
+def measure_import(env: dict) -> list[tuple[str, int, int, int]]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        env=env, capture_output=True, text=True, check=True
+    )
+    return parse_importtime(result.stderr)
+
+
+def summarize_import(entries: list[tuple[str, int, int, int]], top: int) -> None:
+    by_package: dict[str, int] = defaultdict(int)
+    for module, self_us, _, _ in entries:
+        by_package[module.split(".")[0]] += self_us
+
+    print(f"  self time by top-level package (top {top}):")
+    for package, self_us in sorted(by_package.items(), key=lambda item: -item[1])[:top]:
+        print(f"    {self_us / 1000:8.1f} ms  {package}")
+
+    print(f"  slowest modules by self time (top {top}):")
+    for module, self_us, cumulative_us, _ in sorted(entries, key=lambda entry: -entry[1])[:top]:
+        print(f"    {self_us / 1000:8.1f} ms  (cumulative {cumulative_us / 1000:7.1f} ms)  {module}")
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_startup(env: dict, timeout: float = 30.0) -> float:
+    """Seconds from launching uvicorn until GET /health returns 200."""
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}/health"
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            if server.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with status {server.returncode}")
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - start
+            except OSError:
+                time.sleep(0.01)
+        raise RuntimeError(f"no response from {url} within {timeout}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="Rows in the import breakdown")
+    parser.add_argument("--max-import-ms", type=float, help="Fail if median import time exceeds this")
+    parser.add_argument("--max-startup-ms", type=float, help="Fail if median time to first request exceeds this")
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+
+    import_runs = [measure_import(env) for _ in range(args.runs)]
+    import_ms = [max(cumulative for _, _, cumulative, _ in entries) / 1000 for entries in import_runs]
+    median_import_ms = statistics.median(import_ms)
+    print(f"import main: median {median_import_ms:.0f} ms over {args.runs} runs (min {min(import_ms):.0f} ms)")
+    summarize_import(import_runs[import_ms.index(min(import_ms))], args.top)
+
+    startup_ms = [measure_startup(env) * 1000 for _ in range(args.runs)]
+    median_startup_ms = statistics.median(startup_ms)
+    print(f"first request: median {median_startup_ms:.0f} ms over {args.runs} runs (min {min(startup_ms):.0f} ms)")
+
+    failures = []
+    if args.max_import_ms is not None and median_import_ms > args.max_import_ms:
+        failures.append(f"import {median_import_ms:.0f} ms > budget {args.max_import_ms:.0f} ms")
+    if args.max_startup_ms is not None and median_startup_ms > args.max_startup_ms:
+        failures.append(f"first request {median_startup_ms:.0f} ms > budget {args.max_startup_ms:.0f} ms")
+    if failures:
+        print("FAILED: " + "; ".join(failures))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
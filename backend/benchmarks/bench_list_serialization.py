@@ -0,0 +1,136 @@
+"""
+Benchmark: list_reminders serialization, ORM path vs column fast path.
+
+Seeds an in-memory SQLite database with one user and N reminders, then
+builds the full JSON body for a single page containing every row using:
+
+- orm:  select(Reminder) -> PaginatedResponse[ReminderResponse] validation
+        -> model_dump(mode="json") -> stdlib json.dumps (FastAPI's default path)
+- fast: select(*REMINDER_RESPONSE_COLUMNS) -> plain dicts -> orjson
+
+Reports per-item CPU time and peak traced memory for each path.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_list_serialization [--rows 10000] [--repeat 5]
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.models import User, Reminder
+from app.schemas.reminder import ReminderResponse, PaginatedResponse
+from app.services.reminder_serialization import REMINDER_RESPONSE_COLUMNS, rows_to_dicts
+from app.core.responses import FastJSONResponse
+
+
+def seed(session, rows: int) -> int:
+    """Insert one user with `rows` reminders and return the user id."""
+    user = User(email="bench@example.com", password_hash=None)
+    session.add(user)
+    session.flush()
+
+    start = datetime(2030, 1, 1, 9, 0)
+    session.execute(
+        Reminder.__table__.insert(),
+        [
+            {
+                "user_id": user.id,
+                "title": f"Reminder {i}",
+                "message": "Call the pharmacy and pick up the prescription " * 4,
+                "phone_number": "+12025550123",
+                "date_time": start + timedelta(minutes=i),
+                "timezone": "America/New_York",
+                "date_time_utc": start + timedelta(minutes=i, hours=5),
+                "status": "scheduled",
+                "attempt_count": 0,
+                "max_attempts": 3,
+                "created_at": start,
+                "updated_at": start,
+            }
+            for i in range(rows)
+        ],
+    )
+    session.commit()
+    return user.id
+
+
+def orm_path(session, user_id: int) -> bytes:
+    reminders = list(session.scalars(
+        select(Reminder).where(Reminder.user_id == user_id).order_by(Reminder.date_time.asc())
+    ).all())
+    page = PaginatedResponse[ReminderResponse].model_validate(
+        {"items": reminders, "total": len(reminders), "skip": 0, "limit": len(reminders)},
+        from_attributes=True,
+    )
+    return json.dumps(page.model_dump(mode="json")).encode("utf-8")
+
+
+def fast_path(session, user_id: int) -> bytes:
+    items = rows_to_dicts(session.execute(
+        select(*REMINDER_RESPONSE_COLUMNS).where(Reminder.user_id == user_id).order_by(Reminder.date_time.asc())
+    ))
+    return FastJSONResponse({"items": items, "total": len(items), "skip": 0, "limit": len(items)}).body
+
+
+def measure(name, fn, session_factory, user_id, rows, repeat):
+    cpu_times = []
+    peaks = []
+    size = 0
+    for _ in range(repeat):
+        with session_factory() as session:
+            tracemalloc.start()
+            cpu_start = time.process_time()
+            body = fn(session, user_id)
+            cpu_times.append(time.process_time() - cpu_start)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            peaks.append(peak)
+            size = len(body)
+
+    best = min(cpu_times)
+    print(
+        f"{name:>5}: {best * 1000:8.1f} ms CPU  "
+        f"{best / rows * 1e6:6.2f} us/item  "
+        f"peak {max(peaks) / 1024 / 1024:7.2f} MiB  "
+        f"({max(peaks) / rows:7.0f} B/item)  body {size / 1024:.0f} KiB"
+    )
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+
+    with session_factory() as session:
+        user_id = seed(session, args.rows)
+
+    # Sanity check: both paths produce the same payload
+    with session_factory() as session:
+        assert json.loads(orm_path(session, user_id)) == json.loads(fast_path(session, user_id))
+
+    print(f"list_reminders serialization, {args.rows} rows, best of {args.repeat}")
+    orm = measure("orm", orm_path, session_factory, user_id, args.rows, args.repeat)
+    fast = measure("fast", fast_path, session_factory, user_id, args.rows, args.repeat)
+    print(f"speedup: {orm / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
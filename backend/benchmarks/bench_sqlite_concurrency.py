@@ -0,0 +1,237 @@
+"""
+Benchmark: concurrent API writes, reads and dispatch on SQLite across profiles.
+
+Runs the same mixed workload against a fresh SQLite file per profile:
+
+- writers:    API-style threads, each creating reminders and then updating
+              them, one short transaction per operation
+- readers:    list-style threads (count + first page), paced by --read-interval-ms,
+              looping until writers finish
+- dispatcher: scheduler-style thread selecting due reminders, claiming each
+              with UPDATE ... RETURNING and marking it completed
+
+Profiles:
+- default: the previous engine setup (rollback journal, pysqlite defaults)
+- tuned:   app.core.sqlite profile (WAL, synchronous=NORMAL, busy_timeout, ...)
+- queued:  tuned profile with writes funneled through the single-writer
+           queue (app.core.write_queue), group-committed in batches
+
+Reports committed writes/s, "database is locked" errors and read latency.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_sqlite_concurrency [--writers 8] [--readers 4] [--ops 200]
+        [--read-interval-ms 5]
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, func, select, update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.core.sqlite import install_sqlite_profile, profile_pragmas
+from app.core.write_queue import WriteCoordinator
+from app.database import Base
+from app.models import Reminder, User
+
+
+class Counters:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.writes = 0
+        self.locked_errors = 0
+        self.read_latencies: list[float] = []
+
+    def add(self, writes: int = 0, locked: int = 0) -> None:
+        with self.lock:
+            self.writes += writes
+            self.locked_errors += locked
+
+
+def build_engine(path: str, tuned: bool):
+    engine = create_engine(
+        f"sqlite:///{path}",
+        connect_args={"check_same_thread": False},
+        pool_size=32,
+        max_overflow=0,
+    )
+    if tuned:
+        install_sqlite_profile(engine, profile_pragmas())
+    return engine
+
+
+def seed_user(session_factory) -> int:
+    with session_factory() as session:
+        user = User(email="bench@example.com", password_hash=None)
+        session.add(user)
+        session.commit()
+        return user.id
+
+
+def run_op(session_factory, counters: Counters, op, coordinator: WriteCoordinator | None = None) -> None:
+    """Run one transaction, counting lock errors instead of failing the thread."""
+    if coordinator is not None:
+        try:
+            coordinator.run(op)
+            counters.add(writes=1)
+        except OperationalError as e:
+            if "locked" not in str(e):
+                raise
+            counters.add(locked=1)
+        return
+
+    with session_factory() as session:
+        try:
+            op(session)
+            session.commit()
+            counters.add(writes=1)
+        except OperationalError as e:
+            session.rollback()
+            if "locked" not in str(e):
+                raise
+            counters.add(locked=1)
+
+
+def writer(session_factory, counters: Counters, user_id: int, ops: int, coordinator=None) -> None:
+    now = datetime.utcnow()
+    created: list[int] = []
+
+    def create(session):
+        reminder = Reminder(
+            user_id=user_id,
+            title="Bench reminder",
+            message="Call the pharmacy",
+            phone_number="+12025550123",
+            date_time=now,
+            timezone="UTC",
+            date_time_utc=now - timedelta(seconds=1),
+            status="scheduled",
+        )
+        session.add(reminder)
+        session.flush()
+        created.append(reminder.id)
+
+    def rename(session):
+        if created:
+            session.execute(update(Reminder).where(Reminder.id == created[-1]).values(title="Renamed"))
+
+    for i in range(ops):
+        run_op(session_factory, counters, create if i % 2 == 0 else rename, coordinator)
+
+
+def reader(session_factory, counters: Counters, user_id: int, stop: threading.Event, interval: float) -> None:
+    while not stop.wait(interval):
+        start = time.perf_counter()
+        with session_factory() as session:
+            try:
+                session.scalar(select(func.count(Reminder.id)).where(Reminder.user_id == user_id))
+                session.execute(
+                    select(Reminder.id, Reminder.title)
+                    .where(Reminder.user_id == user_id)
+                    .order_by(Reminder.date_time.asc())
+                    .limit(20)
+                ).all()
+            except OperationalError:
+                counters.add(locked=1)
+                continue
+        with counters.lock:
+            counters.read_latencies.append(time.perf_counter() - start)
+
+
+def dispatcher(session_factory, counters: Counters, stop: threading.Event, coordinator=None) -> None:
+    while not stop.is_set():
+        with session_factory() as session:
+            try:
+                due_ids = session.scalars(
+                    select(Reminder.id)
+                    .where(Reminder.status == "scheduled", Reminder.date_time_utc <= datetime.utcnow())
+                    .limit(10)
+                ).all()
+            except OperationalError:
+                counters.add(locked=1)
+                continue
+
+        for reminder_id in due_ids:
+            def claim(session, reminder_id=reminder_id):
+                session.execute(
+                    update(Reminder)
+                    .where(Reminder.id == reminder_id, Reminder.status == "scheduled")
+                    .values(status="processing")
+                    .returning(Reminder.id)
+                ).fetchone()
+
+            def complete(session, reminder_id=reminder_id):
+                session.execute(update(Reminder).where(Reminder.id == reminder_id).values(status="completed"))
+
+            run_op(session_factory, counters, claim, coordinator)
+            run_op(session_factory, counters, complete, coordinator)
+
+
+def run_profile(name: str, tuned: bool, args, queued: bool = False) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = build_engine(os.path.join(tmp, "bench.db"), tuned)
+        Base.metadata.create_all(engine)
+        session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+        user_id = seed_user(session_factory)
+        coordinator = WriteCoordinator(session_factory, max_batch=100, timeout_seconds=60) if queued else None
+
+        counters = Counters()
+        stop = threading.Event()
+        writers = [
+            threading.Thread(target=writer, args=(session_factory, counters, user_id, args.ops, coordinator))
+            for _ in range(args.writers)
+        ]
+        background = [
+            threading.Thread(target=reader, args=(session_factory, counters, user_id, stop, args.read_interval_ms / 1000))
+            for _ in range(args.readers)
+        ]
+        background.append(threading.Thread(target=dispatcher, args=(session_factory, counters, stop, coordinator)))
+
+        start = time.perf_counter()
+        for thread in writers + background:
+            thread.start()
+        for thread in writers:
+            thread.join()
+        stop.set()
+        for thread in background:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        if coordinator is not None:
+            coordinator.stop()
+        engine.dispose()
+
+    latencies = sorted(counters.read_latencies) or [0.0]
+    p95 = latencies[int(len(latencies) * 0.95) - 1] if len(latencies) > 1 else latencies[0]
+    print(
+        f"{name:>8}: {counters.writes / elapsed:8.0f} writes/s  "
+        f"{counters.locked_errors:5d} locked errors  "
+        f"reads p50 {statistics.median(latencies) * 1000:6.2f} ms  p95 {p95 * 1000:6.2f} ms  "
+        f"({elapsed:.1f}s)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--ops", type=int, default=200, help="Transactions per writer thread")
+    parser.add_argument("--read-interval-ms", type=float, default=5.0, help="Pause between reads per reader")
+    args = parser.parse_args()
+
+    print(
+        f"SQLite mixed workload: {args.writers} writers x {args.ops} txns, "
+        f"{args.readers} readers, 1 dispatcher"
+    )
+    run_profile("default", tuned=False, args=args)
+    run_profile("tuned", tuned=True, args=args)
+    run_profile("queued", tuned=True, args=args, queued=True)
+
+
+if __name__ == "__main__":
+    main()
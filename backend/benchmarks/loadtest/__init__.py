@@ -0,0 +1,7 @@
+"""
+Seeded HTTP load tests for the API.
+
+- seed:    deterministic data generator (users, reminders, status mix, timezones)
+- run:     scripted load against a local uvicorn, writing a JSON report
+- compare: diff two JSON reports (e.g. a stored baseline and a new run)
+"""
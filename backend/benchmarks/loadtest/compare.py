@@ -0,0 +1,74 @@
+"""
+Compare two load-test reports (baseline vs candidate) endpoint by endpoint.
+
+Prints throughput and latency percentiles side by side with the relative
+change. With --max-regression, exits non-zero when any endpoint's p95
+latency grows, or its throughput drops, by more than that percentage.
+
+Usage (from the backend directory):
+    python -m benchmarks.loadtest.compare BASELINE.json CANDIDATE.json [--max-regression 20]
+"""
+
+import argparse
+import json
+import sys
+
+METRICS = ["rps", "p50_ms", "p95_ms", "p99_ms"]
+
+
+def change(before: float, after: float) -> float | None:
+    """Relative change in percent (None when the baseline is zero)."""
+    if not before:
+        return None
+    return (after - before) / before * 100
+
+
+def _fmt_change(value: float | None) -> str:
+    return "    n/a" if value is None else f"{value:+6.1f}%"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument(
+        "--max-regression", type=float,
+        help="Fail if p95 grows or req/s drops by more than this percentage"
+    )
+    args = parser.parse_args()
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.candidate) as f:
+        candidate = json.load(f)
+
+    print(f"baseline:  {baseline['meta'].get('git_commit')} {baseline['meta'].get('created_at')}")
+    print(f"candidate: {candidate['meta'].get('git_commit')} {candidate['meta'].get('created_at')}")
+    print(f"{'endpoint':<24} {'metric':<7} {'baseline':>10} {'candidate':>10} {'change':>8}")
+
+    regressions = []
+    for name in sorted(set(baseline["endpoints"]) | set(candidate["endpoints"])):
+        before = baseline["endpoints"].get(name)
+        after = candidate["endpoints"].get(name)
+        if before is None or after is None:
+            print(f"{name:<24} only in {'candidate' if before is None else 'baseline'}")
+            continue
+        for metric in METRICS:
+            delta = change(before[metric], after[metric])
+            print(f"{name:<24} {metric:<7} {before[metric]:10.2f} {after[metric]:10.2f} {_fmt_change(delta):>8}")
+            if args.max_regression is None or delta is None:
+                continue
+            # Throughput regresses when it drops; latency when it grows
+            worse = -delta if metric == "rps" else delta
+            if metric in ("rps", "p95_ms") and worse > args.max_regression:
+                regressions.append(f"{name} {metric} {_fmt_change(delta).strip()}")
+        if after["errors"] > before["errors"]:
+            print(f"{name:<24} errors  {before['errors']:10d} {after['errors']:10d}")
+
+    if regressions:
+        print(f"Regressions over {args.max_regression:.0f}%: " + "; ".join(regressions))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+"""
+Scripted HTTP load against the API, reported per endpoint as JSON.
+
+Each virtual user logs in as one of the seeded users (see seed.py); once all
+are logged in, each repeats a session until the duration elapses:
+
+    list (random status filter, search or page) -> stats -> create -> update -> delete
+
+Every virtual user draws from its own random.Random(seed, index), so a given
+--seed replays the same request script. Latency is measured per request on
+the client; the report lists throughput, error count and p50/p90/p95/p99/max
+latency for each endpoint and is written as JSON, ready to be stored as a
+baseline and diffed with benchmarks.loadtest.compare.
+
+By default the script starts `uvicorn main:app` on a free port against
+DATABASE_URL, with the auth rate limits raised so every virtual user can log
+in from 127.0.0.1. Pass --base-url to target a server that is already running
+instead. That server must be reachable over plain HTTP with non-secure
+cookies, so ENVIRONMENT must not be "production".
+
+Usage (from the backend directory, after seeding):
+    python -m benchmarks.loadtest.run [--vus 20] [--duration 30] [--users 50] [--seed 42]
+        [--workers 1] [--output benchmarks/loadtest/baselines/local.json]
+        [--base-url http://127.0.0.1:8000]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+import httpx
+
+from benchmarks.loadtest.seed import EMAIL_TEMPLATE, PASSWORD, TIMEZONE_MIX, TITLES
+
+API = "/api/v1"
+STATUS_FILTERS = [None, None, "scheduled", "completed", "failed"]
+SEARCH_TERMS = ["medication", "call", "rent", "appointment", "zzz-no-match"]
+
+
+class Recorder:
+    """Latencies and errors per endpoint name."""
+
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+
+    async def request(self, client: httpx.AsyncClient, name: str, method: str, url: str, **kwargs) -> httpx.Response | None:
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            self.errors[name] += 1
+            return None
+        self.latencies[name].append(time.perf_counter() - start)
+        if response.status_code >= 400:
+            self.errors[name] += 1
+            return None
+        return response
+
+
+async def login(client: httpx.AsyncClient, index: int, users: int, recorder: Recorder) -> bool:
+    response = await recorder.request(
+        client, "POST /auth/login", "POST", f"{API}/auth/login",
+        json={"email": EMAIL_TEMPLATE.format(index % users), "password": PASSWORD}
+    )
+    return response is not None
+
+
+async def session_loop(client: httpx.AsyncClient, rng: random.Random, deadline: float, recorder: Recorder) -> None:
+    while time.perf_counter() < deadline:
+        params = {"limit": 20, "skip": 20 * rng.randrange(5)}
+        status = rng.choice(STATUS_FILTERS)
+        if status:
+            params["status"] = status
+        if rng.random() < 0.3:
+            params["search"] = rng.choice(SEARCH_TERMS)
+        await recorder.request(client, "GET /reminders/", "GET", f"{API}/reminders/", params=params)
+        await recorder.request(client, "GET /reminders/stats", "GET", f"{API}/reminders/stats")
+
+        local = datetime.utcnow() + timedelta(days=rng.randrange(2, 60), minutes=15 * rng.randrange(96))
+        created = await recorder.request(
+            client, "POST /reminders/", "POST", f"{API}/reminders/",
+            json={
+                "title": rng.choice(TITLES),
+                "message": "Load test reminder",
+                "phone_number": f"+1202555{rng.randrange(10000):04d}",
+                "date_time": local.replace(second=0, microsecond=0).isoformat(),
+                "timezone": rng.choice(TIMEZONE_MIX)[0],
+            }
+        )
+        if created is None:
+            continue
+        url = f"{API}/reminders/{created.json()['id']}"
+        await recorder.request(client, "PUT /reminders/{id}", "PUT", url, json={"title": "Updated by load test"})
+        await recorder.request(client, "DELETE /reminders/{id}", "DELETE", url)
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(fraction * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def build_report(recorder: Recorder, elapsed: float, meta: dict) -> dict:
+    endpoints = {}
+    for name in sorted(set(recorder.latencies) | set(recorder.errors)):
+        values = sorted(recorder.latencies[name])
+        endpoints[name] = {
+            "count": len(values),
+            "errors": recorder.errors[name],
+            "rps": round(len(values) / elapsed, 2),
+            "mean_ms": round(sum(values) / len(values) * 1000, 2) if values else 0.0,
+            **{
+                f"p{int(fraction * 100)}_ms": round(percentile(values, fraction) * 1000, 2)
+                for fraction in (0.5, 0.9, 0.95, 0.99)
+            },
+            "max_ms": round(values[-1] * 1000, 2) if values else 0.0,
+        }
+    requests = sum(endpoint["count"] for endpoint in endpoints.values())
+    return {
+        "meta": {**meta, "elapsed_seconds": round(elapsed, 2)},
+        "totals": {
+            "requests": requests,
+            "errors": sum(endpoint["errors"] for endpoint in endpoints.values()),
+            "rps": round(requests / elapsed, 2),
+        },
+        "endpoints": endpoints,
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(workers: int, timeout: float = 30.0) -> tuple[subprocess.Popen, str]:
+    port = _free_port()
+    env = {
+        **os.environ,
+        # Anything but "production": cookies must not be Secure over plain HTTP
+        "ENVIRONMENT": "loadtest",
+        "LOGIN_RATE_LIMIT_PER_IP": "1000000",
+        "LOGIN_RATE_LIMIT_PER_EMAIL": "1000000",
+    }
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning", "--no-access-log"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    start = time.perf_counter()
+    while time.perf_counter() - start < timeout:
+        if server.poll() is not None:
+            raise RuntimeError(f"uvicorn exited with status {server.returncode}")
+        try:
+            with urllib.request.urlopen(f"{base_url}/health", timeout=1):
+                return server, base_url
+        except OSError:
+            time.sleep(0.05)
+    server.terminate()
+    raise RuntimeError(f"uvicorn did not answer on {base_url} within {timeout}s")
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run_load(base_url: str, args) -> dict:
+    recorder = Recorder()
+    clients = [httpx.AsyncClient(base_url=base_url, timeout=30) for _ in range(args.vus)]
+    try:
+        # Log everyone in first (bcrypt-bound); the measured window starts after
+        logged_in = await asyncio.gather(*(
+            login(client, index, args.users, recorder) for index, client in enumerate(clients)
+        ))
+        start = time.perf_counter()
+        deadline = start + args.duration
+        await asyncio.gather(*(
+            session_loop(client, random.Random(f"{args.seed}-{index}"), deadline, recorder)
+            for index, client in enumerate(clients) if logged_in[index]
+        ))
+        elapsed = time.perf_counter() - start
+    finally:
+        for client in clients:
+            await client.aclose()
+    meta = {
+        "created_at": datetime.utcnow().isoformat(timespec="seconds"),
+        "git_commit": _git_commit(),
+        "vus": args.vus,
+        "duration_seconds": args.duration,
+        "users": args.users,
+        "seed": args.seed,
+        "workers": args.workers if not args.base_url else None,
+    }
+    return build_report(recorder, elapsed, meta)
+
+
+def print_report(report: dict) -> None:
+    totals = report["totals"]
+    print(f"{totals['requests']} requests, {totals['errors']} errors, {totals['rps']:.1f} req/s")
+    print(f"{'endpoint':<24} {'count':>7} {'err':>5} {'req/s':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}")
+    for name, endpoint in report["endpoints"].items():
+        print(
+            f"{name:<24} {endpoint['count']:7d} {endpoint['errors']:5d} {endpoint['rps']:8.1f} "
+            f"{endpoint['p50_ms']:8.1f} {endpoint['p95_ms']:8.1f} {endpoint['p99_ms']:8.1f} {endpoint['max_ms']:8.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--vus", type=int, default=20, help="Concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds of load after login")
+    parser.add_argument("--users", type=int, default=50, help="Seeded users to log in as (see seed.py)")
+    parser.add_argument("--seed", type=int, default=42, help="Request script seed")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers for the spawned server")
+    parser.add_argument("--base-url", help="Target a running server instead of spawning uvicorn")
+    parser.add_argument("--output", help="Write the JSON report to this path")
+    args = parser.parse_args()
+
+    server = None
+    base_url = args.base_url
+    if base_url is None:
+        server, base_url = start_server(args.workers)
+    try:
+        report = asyncio.run(run_load(base_url, args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    print_report(report)
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+        print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
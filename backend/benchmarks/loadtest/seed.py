@@ -0,0 +1,149 @@
+"""
+Deterministic data generator for load tests.
+
+Creates N users (loadtest-<i>@example.com, all sharing one password) with
+M reminders each. Everything is drawn from a seeded random.Random, so the
+same --seed produces the same users, titles, status mix and timezones.
+Times are relative to the start of the current UTC day. Scheduled
+reminders are always in the future, so a running scheduler never dispatches
+(and calls) them during a load test.
+
+Writes to DATABASE_URL, which must already be migrated (alembic upgrade head).
+
+Usage (from the backend directory):
+    python -m benchmarks.loadtest.seed [--users 50] [--reminders 200] [--seed 42]
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, insert, select
+
+from app.core.password import hash_password, shutdown_password_pool
+from app.core.user_cache import user_cache
+from app.database import SessionLocal
+from app.models import RefreshToken, Reminder, ReminderArchive, User
+from app.models.reminder import local_to_utc
+
+EMAIL_TEMPLATE = "loadtest-{}@example.com"
+PASSWORD = "LoadTest123"
+
+# (status, weight): roughly what a month of production history looks like
+STATUS_MIX = [
+    ("scheduled", 55),
+    ("completed", 35),
+    ("failed", 5),
+    ("pending_retry", 5),
+]
+
+# (timezone, weight)
+TIMEZONE_MIX = [
+    ("America/New_York", 30),
+    ("America/Los_Angeles", 15),
+    ("Europe/London", 15),
+    ("Europe/Berlin", 10),
+    ("Asia/Kolkata", 10),
+    ("Asia/Tokyo", 5),
+    ("Australia/Sydney", 5),
+    ("UTC", 5),
+    ("UTC+5:30", 5),
+]
+
+TITLES = [
+    "Take medication", "Doctor appointment", "Call mom", "Pay rent", "Team standup",
+    "Pick up groceries", "Water the plants", "Renew passport", "Gym session", "Dentist",
+]
+MESSAGES = [
+    "Don't forget the blood pressure pills after breakfast.",
+    "Bring the insurance card and arrive 10 minutes early.",
+    "Ask about the weekend plans.",
+    "Transfer before the 5th to avoid the late fee.",
+    "Prepare the sprint update.",
+]
+RECURRENCE_RULES = [None] * 8 + ["FREQ=DAILY", "FREQ=WEEKLY;BYDAY=MO,WE,FR"]
+
+
+def _weighted(rng: random.Random, mix: list[tuple[str, int]]) -> str:
+    values, weights = zip(*mix)
+    return rng.choices(values, weights=weights)[0]
+
+
+def reminder_rows(rng: random.Random, user_id: int, count: int, anchor: datetime) -> list[dict]:
+    rows = []
+    for _ in range(count):
+        status = _weighted(rng, STATUS_MIX)
+        tz_identifier = _weighted(rng, TIMEZONE_MIX)
+        minutes = rng.randrange(15, 60 * 24 * 30, 15)
+        if status == "scheduled":
+            local = anchor + timedelta(days=1, minutes=minutes)
+        else:
+            local = anchor - timedelta(minutes=minutes)
+        attempts = {"completed": 1, "failed": 3, "pending_retry": 1}.get(status, 0)
+        rule = rng.choice(RECURRENCE_RULES) if status == "scheduled" else None
+        rows.append({
+            "user_id": user_id,
+            "title": rng.choice(TITLES),
+            "message": rng.choice(MESSAGES),
+            "phone_number": f"+1202555{rng.randrange(10000):04d}",
+            "date_time": local,
+            "timezone": tz_identifier,
+            "date_time_utc": local_to_utc(local, tz_identifier),
+            "status": status,
+            "attempt_count": attempts,
+            "max_attempts": 3,
+            # Retries wait far in the future so the scheduler leaves them alone
+            "next_retry_at": anchor + timedelta(days=60) if status == "pending_retry" else None,
+            "recurrence_rule": rule,
+            "recurrence_start": local if rule else None,
+        })
+    return rows
+
+
+def seed(users: int, reminders_per_user: int, seed_value: int) -> None:
+    rng = random.Random(seed_value)
+    anchor = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    password_hash = hash_password(PASSWORD)
+    emails = [EMAIL_TEMPLATE.format(i) for i in range(users)]
+
+    with SessionLocal() as db:
+        # Replace data from a previous seed run
+        old_ids = db.scalars(select(User.id).where(User.email.like(EMAIL_TEMPLATE.format("%")))).all()
+        if old_ids:
+            db.execute(delete(Reminder).where(Reminder.user_id.in_(old_ids)))
+            db.execute(delete(ReminderArchive).where(ReminderArchive.user_id.in_(old_ids)))
+            db.execute(delete(RefreshToken).where(RefreshToken.user_id.in_(old_ids)))
+            db.execute(delete(User).where(User.id.in_(old_ids)))
+
+        db.execute(insert(User), [{"email": email, "password_hash": password_hash} for email in emails])
+        user_ids = db.scalars(select(User.id).where(User.email.in_(emails)).order_by(User.id)).all()
+        for user_id in user_ids:
+            db.execute(insert(Reminder), reminder_rows(rng, user_id, reminders_per_user, anchor))
+        db.commit()
+
+    # Bulk deletes bypass the ORM hooks; evict replaced users from a shared cache
+    for user_id in old_ids:
+        user_cache.invalidate(user_id)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--reminders", type=int, default=200, help="Reminders per user")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        seed(args.users, args.reminders, args.seed)
+    finally:
+        shutdown_password_pool()
+    print(
+        f"Seeded {args.users} users x {args.reminders} reminders (seed {args.seed}) "
+        f"in {time.perf_counter() - start:.1f}s; password {PASSWORD!r}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+"""
+Query budget check: SQL statements and commits per endpoint and scheduler job.
+
+Runs every route under app/api/v1 (through the ASGI app, in a fixed order)
+and each scheduler job in app/jobs/daily_calls.py against a seeded
+in-memory SQLite database, counts the statements and commits each one
+issues, and compares them with the budgets declared in BUDGETS.
+
+Exits non-zero when an operation exceeds its budget, when an API route has
+no budget (every new route must declare one), or when a request fails.
+Lower a budget when an optimization lands; raising one should be a
+deliberate, reviewed change.
+
+Usage (from the backend directory):
+    python -m benchmarks.query_budget [--verbose]
+"""
+
+import os
+
+# Must be set before the app's settings and engines are created
+os.environ.update({
+    "DATABASE_URL": "sqlite:///file:query_budget?mode=memory&cache=shared&uri=true",
+    "DATABASE_READ_URL": "",
+    "ENVIRONMENT": "test",
+    "DEBUG": "False",
+    "SQLITE_WRITE_QUEUE": "False",
+    "EVENTS_BACKEND": "memory",
+    "USER_CACHE_BACKEND": "memory",
+    "RATE_LIMIT_BACKEND": "memory",
+})
+
+import argparse  # noqa: E402
+import logging  # noqa: E402
+import sys  # noqa: E402
+from dataclasses import dataclass, field  # noqa: E402
+from datetime import datetime, timedelta  # noqa: E402
+from typing import Callable  # noqa: E402
+
+from fastapi.routing import APIRoute  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event, select  # noqa: E402
+
+import app.models  # noqa: E402,F401
+from app.config import settings  # noqa: E402
+from app.core.password import shutdown_password_pool  # noqa: E402
+from app.database import Base, SessionLocal, engine, scheduler_engine  # noqa: E402
+from app.jobs import daily_calls  # noqa: E402
+from app.models import Reminder, User  # noqa: E402
+from app.services.vapi_service import VapiService  # noqa: E402
+
+P = settings.API_V1_PREFIX
+PASSWORD = "Passw0rdX"
+NEW_PASSWORD = "Passw0rdY"
+SEEDED_REMINDERS = 25
+DUE_REMINDERS = 3
+
+# Maximum (statements, commits) per operation. Keys for API routes are
+# "<METHOD> <path template>"; scheduler jobs are "job <module>.<function>".
+BUDGETS: dict[str, tuple[int, int]] = {
+    f"GET {P}/": (0, 0),
+    f"POST {P}/auth/signup": (4, 2),
+    f"POST {P}/auth/login": (2, 1),
+    f"GET {P}/users/me": (1, 0),
+    f"POST {P}/reminders/": (1, 1),
+    f"GET {P}/reminders/": (2, 0),
+    f"GET {P}/reminders/stats": (5, 0),
+    f"GET {P}/reminders/occurrences": (1, 0),
+    f"GET {P}/reminders/export": (1, 0),
+    f"GET {P}/reminders/{{reminder_id}}": (1, 0),
+    f"PUT {P}/reminders/{{reminder_id}}": (2, 1),
+    f"DELETE {P}/reminders/{{reminder_id}}": (2, 1),
+    f"POST {P}/auth/refresh": (2, 0),
+    f"POST {P}/auth/password-reset/request": (2, 1),
+    f"POST {P}/auth/password-reset/confirm": (2, 1),
+    f"POST {P}/auth/password/change": (3, 1),
+    f"POST {P}/auth/logout": (2, 1),
+    # One poll, then per due reminder: claim, load, attempt count + in-flight
+    # ledger row, result + ledger outcome
+    "job daily_calls.process_due_reminders": (1 + 6 * DUE_REMINDERS, 3 * DUE_REMINDERS),
+    "job daily_calls.reset_stuck_reminders": (1, 1),
+}
+
+# Routes that cannot be measured as a single request/response
+UNBUDGETED_ROUTES = {
+    f"GET {P}/reminders/events": "server-sent event stream stays open",
+}
+
+
+@dataclass
+class QueryCounter:
+    """Statements and commits on the app's engines, from any thread."""
+    statements: int = 0
+    commits: int = 0
+    log: list[str] = field(default_factory=list)
+
+    def reset(self) -> None:
+        self.statements = 0
+        self.commits = 0
+        self.log = []
+
+    def install(self, *engines) -> None:
+        for bound in set(engines):
+            event.listen(bound, "after_cursor_execute", self._on_statement)
+            event.listen(bound, "commit", self._on_commit)
+
+    def _on_statement(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements += 1
+        self.log.append(" ".join(statement.split()))
+
+    def _on_commit(self, conn):
+        self.commits += 1
+
+
+@dataclass
+class Operation:
+    """One measured step; prepare runs first and is not counted."""
+    key: str
+    action: Callable[[], object]
+    prepare: Callable[[], None] | None = None
+
+
+@dataclass
+class Outcome:
+    key: str
+    statements: int
+    commits: int
+    budget: tuple[int, int]
+    error: str | None = None
+    log: list[str] = field(default_factory=list)
+
+    @property
+    def over_budget(self) -> bool:
+        return self.statements > self.budget[0] or self.commits > self.budget[1]
+
+
+def seed(user_id: int) -> None:
+    """Reminders for the signed-up user: future ones to read, due ones for the dispatcher."""
+    now = datetime.utcnow()
+    with SessionLocal() as db:
+        for i in range(SEEDED_REMINDERS):
+            reminder = Reminder(
+                user_id=user_id, title=f"Reminder {i}", message="Take your medication",
+                phone_number="+12025550123", date_time=now + timedelta(days=i + 1),
+                timezone="America/New_York", status="scheduled"
+            )
+            reminder.set_utc_datetime(reminder.date_time, reminder.timezone)
+            db.add(reminder)
+        for i in range(DUE_REMINDERS):
+            reminder = Reminder(
+                user_id=user_id, title=f"Due {i}", message="Call the pharmacy",
+                phone_number="+12025550123", date_time=now - timedelta(minutes=1),
+                timezone="UTC", status="scheduled"
+            )
+            reminder.set_utc_datetime(reminder.date_time, reminder.timezone)
+            db.add(reminder)
+        db.add(Reminder(
+            user_id=user_id, title="Stuck", message="Stuck in processing",
+            phone_number="+12025550123", date_time=now - timedelta(hours=2),
+            timezone="UTC", date_time_utc=now - timedelta(hours=2), status="processing",
+            updated_at=now - timedelta(hours=2)
+        ))
+        db.commit()
+
+
+def _fake_call(self, phone_number, reminder_title, reminder_message, idempotency_key=None) -> dict:
+    return {"success": True, "call_id": f"call-{idempotency_key}"}
+
+
+def operations(client: TestClient, email: str) -> list[Operation]:
+    """Measured steps in execution order; later steps rely on earlier ones."""
+    state: dict = {}
+
+    def create():
+        response = client.post(f"{P}/reminders/", json={
+            "title": "Budget", "message": "m", "phone_number": "+12025550123",
+            "date_time": "2030-03-10T09:00:00", "timezone": "America/New_York"
+        })
+        state["reminder_id"] = response.json().get("id")
+        return response
+
+    def reminder_url() -> str:
+        return f"{P}/reminders/{state['reminder_id']}"
+
+    def load_reset_token() -> None:
+        with SessionLocal() as db:
+            state["reset_token"] = db.scalar(select(User.reset_token).where(User.email == email))
+
+    def seed_signed_up_user() -> None:
+        with SessionLocal() as db:
+            seed(db.scalar(select(User.id).where(User.email == email)))
+
+    return [
+        Operation(f"GET {P}/", lambda: client.get(f"{P}/")),
+        Operation(f"POST {P}/auth/signup", lambda: client.post(
+            f"{P}/auth/signup", json={"email": email, "password": PASSWORD}
+        )),
+        Operation(
+            f"POST {P}/auth/login",
+            lambda: client.post(f"{P}/auth/login", json={"email": email, "password": PASSWORD}),
+            prepare=seed_signed_up_user
+        ),
+        Operation(f"GET {P}/users/me", lambda: client.get(f"{P}/users/me")),
+        Operation(f"POST {P}/reminders/", create),
+        Operation(f"GET {P}/reminders/", lambda: client.get(
+            f"{P}/reminders/", params={"status": "scheduled", "search": "Reminder", "limit": 20}
+        )),
+        Operation(f"GET {P}/reminders/stats", lambda: client.get(f"{P}/reminders/stats")),
+        Operation(f"GET {P}/reminders/occurrences", lambda: client.get(f"{P}/reminders/occurrences")),
+        Operation(f"GET {P}/reminders/export", lambda: client.get(f"{P}/reminders/export", params={"format": "csv"})),
+        Operation(f"GET {P}/reminders/{{reminder_id}}", lambda: client.get(reminder_url())),
+        Operation(f"PUT {P}/reminders/{{reminder_id}}", lambda: client.put(reminder_url(), json={"title": "Renamed"})),
+        Operation(f"DELETE {P}/reminders/{{reminder_id}}", lambda: client.delete(reminder_url())),
+        Operation(f"POST {P}/auth/refresh", lambda: client.post(f"{P}/auth/refresh")),
+        Operation(f"POST {P}/auth/password-reset/request", lambda: client.post(
+            f"{P}/auth/password-reset/request", json={"email": email}
+        )),
+        Operation(
+            f"POST {P}/auth/password-reset/confirm",
+            lambda: client.post(
+                f"{P}/auth/password-reset/confirm",
+                json={"reset_token": state["reset_token"], "new_password": NEW_PASSWORD}
+            ),
+            prepare=load_reset_token
+        ),
+        Operation(f"POST {P}/auth/password/change", lambda: client.post(
+            f"{P}/auth/password/change", json={"current_password": NEW_PASSWORD, "new_password": PASSWORD}
+        )),
+        Operation(f"POST {P}/auth/logout", lambda: client.post(f"{P}/auth/logout")),
+        Operation("job daily_calls.process_due_reminders", daily_calls.process_due_reminders),
+        Operation("job daily_calls.reset_stuck_reminders", daily_calls.reset_stuck_reminders),
+    ]
+
+
+def measure(counter: QueryCounter, operation: Operation) -> Outcome:
+    if operation.prepare is not None:
+        operation.prepare()
+    counter.reset()
+    error = None
+    try:
+        result = operation.action()
+        status_code = getattr(result, "status_code", None)
+        if status_code is not None and status_code >= 400:
+            error = f"HTTP {status_code}: {result.text[:200]}"
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    return Outcome(
+        operation.key, counter.statements, counter.commits, BUDGETS[operation.key], error, list(counter.log)
+    )
+
+
+def api_route_keys(fastapi_app) -> set[str]:
+    keys = set()
+    for route in fastapi_app.routes:
+        if isinstance(route, APIRoute) and route.path.startswith(P):
+            keys.update(f"{method} {route.path}" for method in route.methods)
+    return keys
+
+
+def run(fastapi_app) -> list[Outcome]:
+    Base.metadata.create_all(bind=engine)
+    counter = QueryCounter()
+    counter.install(engine, scheduler_engine)
+    VapiService.make_reminder_call = _fake_call
+
+    # No lifespan: the scheduler must not run jobs on its own during the check
+    client = TestClient(fastapi_app)
+    return [measure(counter, operation) for operation in operations(client, "budget@example.com")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--verbose", action="store_true", help="Print every statement per operation")
+    args = parser.parse_args()
+
+    import main as app_main
+
+    # The report below is the output; keep app logging to errors
+    logging.disable(logging.WARNING)
+    try:
+        outcomes = run(app_main.app)
+    finally:
+        shutdown_password_pool()
+
+    failures = []
+    for outcome in outcomes:
+        max_statements, max_commits = outcome.budget
+        flag = "FAIL" if outcome.error or outcome.over_budget else "ok"
+        print(
+            f"{flag:>4}  {outcome.statements:3d}/{max_statements:<3d} statements  "
+            f"{outcome.commits:2d}/{max_commits:<2d} commits  {outcome.key}"
+        )
+        if outcome.error:
+            print(f"        {outcome.error}")
+        if args.verbose or flag == "FAIL":
+            for statement in outcome.log:
+                print(f"        {statement[:160]}")
+        if flag == "FAIL":
+            failures.append(outcome.key)
+
+    missing = api_route_keys(app_main.app) - set(BUDGETS) - set(UNBUDGETED_ROUTES)
+    for key in sorted(missing):
+        print(f"FAIL  no budget declared for {key}")
+        failures.append(key)
+
+    if failures:
+        print(f"{len(failures)} operation(s) failed the query budget")
+        sys.exit(1)
+    print(f"All {len(outcomes)} operations within budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,33 +1,50 @@
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
 from app.database import engine, Base
+from app.core.sqlite import check_sqlite_profile
 from app.api.v1.router import api_router
-from app.scheduler import start_scheduler, shutdown_scheduler
-import app.jobs.daily_calls
-import logging
+from app.scheduler import register_jobs, start_scheduler, shutdown_scheduler, drain_jobs
+from app.core.leader import release_leader_lease
+from app.core.events import event_bus
+from app.core.password import start_password_pool, shutdown_password_pool
+from app.core.write_queue import shutdown_write_queue
+from app.core.request_metrics import RequestMetricsMiddleware
+from app.core.read_routing import ReadYourWritesMiddleware
+from app.core.db_pool import snapshot_pools
+from app.core.structured_logging import setup_logging
+from app.core.user_cache import check_user_cache_backend
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Configure logging (queued, written by a background thread)
+setup_logging()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifespan events."""
+    if settings.is_development:
+        # Create database tables in development mode
+        # In production, use Alembic migrations instead
+        Base.metadata.create_all(bind=engine)
+    if settings.is_sqlite:
+        check_sqlite_profile(engine)
+    check_user_cache_backend()
+    start_password_pool()
+    await event_bus.start()
+    register_jobs()
     start_scheduler()
     yield
     shutdown_scheduler()
+    # Stop claiming and let the call in flight finish before giving up the lease
+    await asyncio.to_thread(drain_jobs)
+    release_leader_lease()
+    await event_bus.stop()
+    shutdown_write_queue()
+    shutdown_password_pool()
 
 
-# Create database tables in development mode
-# In production, use Alembic migrations instead
-if settings.is_development:
-    Base.metadata.create_all(bind=engine)
-
 # Initialize FastAPI application with lifespan
 app = FastAPI(
     title=settings.APP_NAME,
@@ -36,10 +53,6 @@ app = FastAPI(
     lifespan=lifespan
 )
 
-print("==============================")
-print("settings.CORS_ORIGINS =>", settings.CORS_ORIGINS)
-print("==============================")
-
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
@@ -48,6 +61,9 @@ app.add_middleware(
     allow_headers=["*"],
     expose_headers=["*"],
 )
+app.add_middleware(RequestMetricsMiddleware)
+if settings.DATABASE_READ_URL:
+    app.add_middleware(ReadYourWritesMiddleware)
 
 
 # Include API router
@@ -61,4 +77,10 @@ def read_root():
 
 @app.get("/health")
 def health_check():
-    return {"status": "healthy", "environment": settings.ENVIRONMENT}
\ No newline at end of file
+    return {"status": "healthy", "environment": settings.ENVIRONMENT}
+
+
+@app.get("/health/db")
+def database_pool_health():
+    """Connection pool gauges and checkout wait statistics per pool."""
+    return {"pools": snapshot_pools()}
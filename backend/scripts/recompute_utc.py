@@ -0,0 +1,57 @@
+"""
+Recompute date_time_utc for future scheduled reminders after a tzdata update.
+
+Run after upgrading tzdata (or the Python/zoneinfo build) when a zone's
+offset or DST rules changed. Reports, per timezone, how many reminders were
+scanned and how many had their UTC time corrected.
+
+Usage (from the backend directory):
+    python -m scripts.recompute_utc [--timezone Europe/Kyiv ...] [--chunk-size 5000] [--dry-run]
+"""
+
+import argparse
+import logging
+import time
+
+from app.core.write_queue import shutdown_write_queue
+from app.database import SchedulerSessionLocal
+from app.services.utc_recompute import DEFAULT_CHUNK_SIZE, recompute_utc
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--timezone", action="append", dest="timezones",
+        help="Only recompute this timezone (repeatable; default: every zone in use)"
+    )
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Rows per read/UPDATE batch")
+    parser.add_argument("--dry-run", action="store_true", help="Report changes without writing them")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+
+    start = time.perf_counter()
+    try:
+        with SchedulerSessionLocal() as db:
+            results = recompute_utc(db, args.timezones, args.chunk_size, args.dry_run)
+    finally:
+        shutdown_write_queue()
+    elapsed = time.perf_counter() - start
+
+    verb = "would change" if args.dry_run else "changed"
+    for result in results:
+        if result.error:
+            print(f"{result.timezone:>32}: skipped ({result.error})")
+        else:
+            print(
+                f"{result.timezone:>32}: {result.scanned:8d} scanned  {result.changed:8d} {verb}"
+                f"  max shift {result.max_shift}"
+            )
+    print(
+        f"{sum(r.scanned for r in results)} reminders scanned, "
+        f"{sum(r.changed for r in results)} {verb} across {len(results)} timezones in {elapsed:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()